@@ -62,5 +62,8 @@ async def run_migrations_online():
 
 if context.is_offline_mode():
     run_migrations_offline()
+elif config.attributes.get("connection") is not None:
+    # Called from app/migrations.py (flowtrack db upgrade) with its own connection
+    do_run_migrations(config.attributes["connection"])
 else:
     asyncio.run(run_migrations_online())
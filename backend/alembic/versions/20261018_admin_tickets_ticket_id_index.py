@@ -0,0 +1,28 @@
+"""index admin_tickets.ticket_id for mirror lookups
+
+Revision ID: 20261018_admin_tickets_ticket_id
+Revises: 20261018_outbox_events
+Create Date: 2026-10-18 15:02:41.530118
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '20261018_admin_tickets_ticket_id'
+down_revision: Union[str, Sequence[str], None] = '20261018_outbox_events'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(op.f('ix_admin_tickets_ticket_id'), 'admin_tickets', ['ticket_id'], unique=False, if_not_exists=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_admin_tickets_ticket_id'), table_name='admin_tickets', if_exists=True)
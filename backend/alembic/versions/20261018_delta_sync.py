@@ -0,0 +1,48 @@
+"""updated_at indexes and tombstones for delta sync
+
+Revision ID: 20261018_delta_sync
+Revises: 20261018_admin_tickets_ticket_id
+Create Date: 2026-10-18 15:40:12.804417
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '20261018_delta_sync'
+down_revision: Union[str, Sequence[str], None] = '20261018_admin_tickets_ticket_id'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+UPDATED_AT_TABLES = ('tickets', 'epics', 'projects', 'admin_tickets', 'admin_epics')
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for table in UPDATED_AT_TABLES:
+        op.create_index(f'ix_{table}_updated_at', table, ['updated_at'], unique=False, if_not_exists=True)
+
+    op.create_table(
+        'tombstones',
+        sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column('entity', sa.String(length=30), nullable=False),
+        sa.Column('entity_id', sa.Integer(), nullable=False),
+        sa.Column('project_id', sa.Integer(), nullable=True),
+        sa.Column('deleted_at', sa.TIMESTAMP(), server_default=sa.text('CURRENT_TIMESTAMP'), nullable=True),
+        sa.PrimaryKeyConstraint('id'),
+        if_not_exists=True,
+    )
+    op.create_index('ix_tombstones_id', 'tombstones', ['id'], unique=False, if_not_exists=True)
+    op.create_index('ix_tombstones_entity_deleted_at', 'tombstones', ['entity', 'deleted_at'], unique=False, if_not_exists=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_tombstones_entity_deleted_at', table_name='tombstones', if_exists=True)
+    op.drop_index('ix_tombstones_id', table_name='tombstones', if_exists=True)
+    op.drop_table('tombstones', if_exists=True)
+    for table in UPDATED_AT_TABLES:
+        op.drop_index(f'ix_{table}_updated_at', table_name=table, if_exists=True)
@@ -0,0 +1,43 @@
+"""outbox_events table for admin_* mirror writes
+
+Revision ID: 20261018_outbox_events
+Revises: 20261018_project_members
+Create Date: 2026-10-18 13:45:09.117402
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '20261018_outbox_events'
+down_revision: Union[str, Sequence[str], None] = '20261018_project_members'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        'outbox_events',
+        sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column('event_type', sa.String(length=50), nullable=False),
+        sa.Column('payload', sa.Text(), nullable=False),
+        sa.Column('attempts', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('last_error', sa.Text(), nullable=True),
+        sa.Column('created_at', sa.TIMESTAMP(), server_default=sa.text('CURRENT_TIMESTAMP'), nullable=True),
+        sa.Column('processed_at', sa.TIMESTAMP(), nullable=True),
+        sa.PrimaryKeyConstraint('id'),
+        if_not_exists=True,
+    )
+    op.create_index('ix_outbox_events_id', 'outbox_events', ['id'], if_not_exists=True)
+    op.create_index('ix_outbox_events_processed_at_id', 'outbox_events', ['processed_at', 'id'], if_not_exists=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_outbox_events_processed_at_id', table_name='outbox_events', if_exists=True)
+    op.drop_index('ix_outbox_events_id', table_name='outbox_events', if_exists=True)
+    op.drop_table('outbox_events', if_exists=True)
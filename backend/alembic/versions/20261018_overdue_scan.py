@@ -0,0 +1,54 @@
+"""overdue flag on tickets, overdue_rollups and the overdue_scans watermark row
+
+Revision ID: 20261018_overdue_scan
+Revises: 20261018_ticket_timeline
+Create Date: 2026-10-18 22:06:51.493820
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '20261018_overdue_scan'
+down_revision: Union[str, Sequence[str], None] = '20261018_ticket_timeline'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Flags start cleared; the first scan after deploy looks at every past due date
+    op.add_column('tickets', sa.Column('overdue', sa.Boolean(), nullable=False, server_default=sa.false()))
+    op.create_index('ix_tickets_due_date', 'tickets', ['due_date'], if_not_exists=True)
+    op.create_index(
+        'ix_tickets_overdue_due_date', 'tickets', ['due_date', 'id'], if_not_exists=True,
+        postgresql_where=sa.text('overdue'), sqlite_where=sa.text('overdue = 1'),
+    )
+    op.create_table(
+        'overdue_rollups',
+        sa.Column('project_id', sa.Integer(), nullable=False),
+        sa.Column('ticket_count', sa.Integer(), nullable=False),
+        sa.PrimaryKeyConstraint('project_id'),
+        if_not_exists=True,
+    )
+    op.create_table(
+        'overdue_scans',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('due_watermark', sa.Date(), nullable=True),
+        sa.Column('updated_watermark', sa.TIMESTAMP(), nullable=True),
+        sa.Column('scanned_at', sa.TIMESTAMP(), nullable=True),
+        sa.PrimaryKeyConstraint('id'),
+        if_not_exists=True,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('overdue_scans')
+    op.drop_table('overdue_rollups')
+    op.drop_index('ix_tickets_overdue_due_date', table_name='tickets')
+    op.drop_index('ix_tickets_due_date', table_name='tickets')
+    op.drop_column('tickets', 'overdue')
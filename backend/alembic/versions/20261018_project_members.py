@@ -0,0 +1,54 @@
+"""project_members join table with backfill from projects.leads / team_members
+
+Revision ID: 20261018_project_members
+Revises: 20261018_tickets_keyset
+Create Date: 2026-10-18 11:02:17.884310
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '20261018_project_members'
+down_revision: Union[str, Sequence[str], None] = '20261018_tickets_keyset'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _split_emails(value):
+    if not value:
+        return []
+    return list(dict.fromkeys(email.strip() for email in value.split(',') if email.strip()))
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    project_members = op.create_table(
+        'project_members',
+        sa.Column('project_id', sa.Integer(), nullable=False),
+        sa.Column('user_email', sa.String(length=255), nullable=False),
+        sa.Column('role', sa.String(length=20), nullable=False),
+        sa.PrimaryKeyConstraint('project_id', 'user_email', 'role'),
+        if_not_exists=True,
+    )
+    op.create_index('ix_project_members_user_email_project_id', 'project_members', ['user_email', 'project_id'], if_not_exists=True)
+
+    # Backfill from the comma-separated columns, using the same splitting rules as crud
+    conn = op.get_bind()
+    conn.execute(sa.text("DELETE FROM project_members"))
+    projects = conn.execute(sa.text("SELECT id, leads, team_members FROM projects")).all()
+    rows = []
+    for project_id, leads, team_members in projects:
+        rows += [{'project_id': project_id, 'user_email': email, 'role': 'lead'} for email in _split_emails(leads)]
+        rows += [{'project_id': project_id, 'user_email': email, 'role': 'member'} for email in _split_emails(team_members)]
+    if rows:
+        op.bulk_insert(project_members, rows)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_project_members_user_email_project_id', table_name='project_members', if_exists=True)
+    op.drop_table('project_members', if_exists=True)
@@ -0,0 +1,78 @@
+"""rank columns for Kanban card order on tickets and admin_tickets
+
+Revision ID: 20261018_ticket_ranks
+Revises: 20261018_ticket_rollups
+Create Date: 2026-10-18 20:03:12.671940
+
+"""
+from datetime import datetime
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '20261018_ticket_ranks'
+down_revision: Union[str, Sequence[str], None] = '20261018_ticket_rollups'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Same encoding as app/ranking.py: 8 base-36 digits, trailing zeros dropped
+DIGITS = '0123456789abcdefghijklmnopqrstuvwxyz'
+
+
+def _encode(value):
+    digits = []
+    for _ in range(8):
+        value, digit = divmod(value, 36)
+        digits.append(DIGITS[digit])
+    return ''.join(reversed(digits)).rstrip('0')
+
+
+def _spread(count):
+    """ranking.spread: evenly spaced ranks below the current millisecond"""
+    now = int((datetime.utcnow() - datetime(1970, 1, 1)).total_seconds() * 1000)
+    step = now // (count + 1)
+    return [_encode(step * (i + 1)) for i in range(count)]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    conn = op.get_bind()
+    # Ranks compare byte by byte
+    rank_type = sa.String(length=64, collation='C') if conn.dialect.name == 'postgresql' else sa.String(length=64)
+    op.add_column('tickets', sa.Column('rank', rank_type, nullable=True))
+    op.add_column('admin_tickets', sa.Column('rank', rank_type, nullable=True))
+
+    # Existing cards keep their creation order
+    ticket_ids = [row[0] for row in conn.execute(sa.text("SELECT id FROM tickets ORDER BY created_at, id"))]
+    if ticket_ids:
+        conn.execute(
+            sa.text("UPDATE tickets SET rank = :rank WHERE id = :id"),
+            [{'id': i, 'rank': r} for i, r in zip(ticket_ids, _spread(len(ticket_ids)))],
+        )
+    conn.execute(sa.text(
+        "UPDATE admin_tickets SET rank = (SELECT t.rank FROM tickets t WHERE t.id = admin_tickets.ticket_id)"
+    ))
+    orphan_ids = [row[0] for row in conn.execute(sa.text(
+        "SELECT admin_ticket_id FROM admin_tickets WHERE rank IS NULL ORDER BY created_at, admin_ticket_id"
+    ))]
+    if orphan_ids:
+        conn.execute(
+            sa.text("UPDATE admin_tickets SET rank = :rank WHERE admin_ticket_id = :id"),
+            [{'id': i, 'rank': r} for i, r in zip(orphan_ids, _spread(len(orphan_ids)))],
+        )
+
+    op.alter_column('tickets', 'rank', existing_type=rank_type, nullable=False)
+    op.alter_column('admin_tickets', 'rank', existing_type=rank_type, nullable=False)
+    op.create_index('ix_tickets_rank_id', 'tickets', ['rank', 'id'], if_not_exists=True)
+    op.create_index('ix_admin_tickets_project_id_rank', 'admin_tickets', ['project_id', 'rank'], if_not_exists=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_admin_tickets_project_id_rank', table_name='admin_tickets')
+    op.drop_index('ix_tickets_rank_id', table_name='tickets')
+    op.drop_column('admin_tickets', 'rank')
+    op.drop_column('tickets', 'rank')
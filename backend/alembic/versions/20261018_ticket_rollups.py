@@ -0,0 +1,44 @@
+"""ticket_rollups table behind the dashboard summary
+
+Revision ID: 20261018_ticket_rollups
+Revises: 20261018_ticket_search
+Create Date: 2026-10-18 19:26:51.804417
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '20261018_ticket_rollups'
+down_revision: Union[str, Sequence[str], None] = '20261018_ticket_search'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        'ticket_rollups',
+        sa.Column('project_id', sa.Integer(), nullable=False),
+        sa.Column('status', sa.String(length=50), nullable=False),
+        sa.Column('priority', sa.String(length=50), nullable=False),
+        sa.Column('assignee', sa.String(length=255), nullable=False),
+        sa.Column('ticket_count', sa.Integer(), nullable=False),
+        sa.PrimaryKeyConstraint('project_id', 'status', 'priority', 'assignee'),
+        if_not_exists=True,
+    )
+    # Backfill from the existing tickets; NULL handling must match rollups.key()
+    op.execute(
+        "INSERT INTO ticket_rollups (project_id, status, priority, assignee, ticket_count) "
+        "SELECT coalesce(project_id, 0), coalesce(status, ''), coalesce(priority, ''), coalesce(assignee, ''), count(*) "
+        "FROM admin_tickets "
+        "GROUP BY coalesce(project_id, 0), coalesce(status, ''), coalesce(priority, ''), coalesce(assignee, '')"
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('ticket_rollups')
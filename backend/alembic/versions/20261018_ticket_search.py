@@ -0,0 +1,49 @@
+"""full-text search vectors on tickets and admin_tickets
+
+Revision ID: 20261018_ticket_search
+Revises: 20261018_users_search
+Create Date: 2026-10-18 18:47:09.553027
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '20261018_ticket_search'
+down_revision: Union[str, Sequence[str], None] = '20261018_users_search'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+SEARCH_TABLES = ('tickets', 'admin_tickets')
+
+# Must match crud.TICKET_SEARCH_CONFIG; titles weigh more than descriptions
+SEARCH_VECTOR = (
+    "setweight(to_tsvector('english', coalesce(title, '')), 'A') || "
+    "setweight(to_tsvector('english', coalesce(description, '')), 'B')"
+)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Generated tsvector columns are PostgreSQL-only; other databases fall
+    # back to LIKE matching in crud
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    for table in SEARCH_TABLES:
+        op.execute(
+            f"ALTER TABLE {table} ADD COLUMN IF NOT EXISTS search_vector tsvector "
+            f"GENERATED ALWAYS AS ({SEARCH_VECTOR}) STORED"
+        )
+        op.execute(f"CREATE INDEX IF NOT EXISTS ix_{table}_search_vector ON {table} USING gin (search_vector)")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    for table in SEARCH_TABLES:
+        op.execute(f"DROP INDEX IF EXISTS ix_{table}_search_vector")
+        op.execute(f"ALTER TABLE {table} DROP COLUMN IF EXISTS search_vector")
@@ -0,0 +1,41 @@
+"""date-range index for /tickets/timeline overlap queries
+
+Revision ID: 20261018_ticket_timeline
+Revises: 20261018_ticket_ranks
+Create Date: 2026-10-18 21:14:37.208315
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '20261018_ticket_timeline'
+down_revision: Union[str, Sequence[str], None] = '20261018_ticket_ranks'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Same expressions as app/models.py and crud._timeline_overlaps
+FIRST = 'coalesce(start_date, due_date)'
+LAST = 'coalesce(due_date, start_date)'
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    if op.get_bind().dialect.name == 'postgresql':
+        op.execute(
+            "CREATE INDEX IF NOT EXISTS ix_tickets_timeline ON tickets USING gist "
+            "(daterange(least(start_date, due_date), greatest(start_date, due_date), '[]')) "
+            "WHERE start_date IS NOT NULL OR due_date IS NOT NULL"
+        )
+    else:
+        op.execute(
+            f"CREATE INDEX IF NOT EXISTS ix_tickets_timeline ON tickets "
+            f"(min({FIRST}, {LAST}), max({FIRST}, {LAST}))"
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute("DROP INDEX IF EXISTS ix_tickets_timeline")
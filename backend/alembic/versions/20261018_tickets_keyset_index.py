@@ -0,0 +1,30 @@
+"""tickets keyset pagination indexes
+
+Revision ID: 20261018_tickets_keyset
+Revises: da732f3ce7be
+Create Date: 2026-10-18 09:12:41.503218
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '20261018_tickets_keyset'
+down_revision: Union[str, Sequence[str], None] = 'da732f3ce7be'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_tickets_created_at_id', 'tickets', ['created_at', 'id'], if_not_exists=True)
+    op.create_index('ix_tickets_user_id_created_at_id', 'tickets', ['user_id', 'created_at', 'id'], if_not_exists=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_tickets_user_id_created_at_id', table_name='tickets', if_exists=True)
+    op.drop_index('ix_tickets_created_at_id', table_name='tickets', if_exists=True)
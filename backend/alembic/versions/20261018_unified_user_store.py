@@ -0,0 +1,97 @@
+"""user_profile as a projection of users_management
+
+Revision ID: 20261018_unified_user_store
+Revises: 20261018_delta_sync
+Create Date: 2026-10-18 17:12:40.318205
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '20261018_unified_user_store'
+down_revision: Union[str, Sequence[str], None] = '20261018_delta_sync'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _split_full_name(full_name):
+    parts = (full_name or '').strip().split(' ', 1)
+    return parts[0], parts[1] if len(parts) > 1 else ''
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Room for every value users_management can project
+    op.alter_column('user_profile', 'full_name', type_=sa.String(length=255), existing_nullable=False)
+    op.alter_column('user_profile', 'mobile_number', type_=sa.String(length=30), existing_nullable=True)
+    op.alter_column('user_profile', 'department', type_=sa.String(length=100), existing_nullable=False)
+    op.add_column('user_profile', sa.Column('users_management_id', sa.Integer(), nullable=True))
+
+    conn = op.get_bind()
+
+    # Profiles whose users_management row was never created (a failed sync) get one
+    orphans = conn.execute(sa.text(
+        "SELECT p.full_name, p.email, p.mobile_number, p.role, p.department, p.user_status "
+        "FROM user_profile p LEFT JOIN users_management m ON m.email = p.email "
+        "WHERE m.id IS NULL"
+    )).all()
+    users_management = sa.table(
+        'users_management',
+        sa.column('first_name'), sa.column('last_name'), sa.column('email'), sa.column('role'),
+        sa.column('department'), sa.column('tickets_issued'), sa.column('tickets_resolved'),
+        sa.column('active'), sa.column('language'), sa.column('mobile_number'),
+        sa.column('date_format'), sa.column('password_reset_needed'),
+    )
+    rows = []
+    for full_name, email, mobile_number, role, department, user_status in orphans:
+        first_name, last_name = _split_full_name(full_name)
+        rows.append({
+            'first_name': first_name[:100], 'last_name': last_name[:100], 'email': email,
+            'role': role, 'department': department, 'tickets_issued': 0, 'tickets_resolved': 0,
+            'active': user_status == 'Active', 'language': 'English', 'mobile_number': mobile_number,
+            'date_format': 'YYYY-MM-DD', 'password_reset_needed': False,
+        })
+    if rows:
+        op.bulk_insert(users_management, rows)
+
+    # ... and users_management rows without a profile get their projection
+    conn.execute(sa.text(
+        "INSERT INTO user_profile (full_name, email, mobile_number, role, department, user_status) "
+        "SELECT TRIM(m.first_name || ' ' || m.last_name), m.email, m.mobile_number, m.role, m.department, "
+        "CASE WHEN m.active THEN 'Active' ELSE 'Inactive' END "
+        "FROM users_management m LEFT JOIN user_profile p ON p.email = m.email "
+        "WHERE p.user_id IS NULL"
+    ))
+
+    # Link every profile and rewrite its projected columns, removing any drift
+    conn.execute(sa.text(
+        "UPDATE user_profile SET "
+        "users_management_id = m.id, "
+        "full_name = TRIM(m.first_name || ' ' || m.last_name), "
+        "mobile_number = m.mobile_number, "
+        "role = m.role, "
+        "department = m.department, "
+        "user_status = CASE WHEN m.active THEN 'Active' ELSE 'Inactive' END "
+        "FROM users_management m WHERE m.email = user_profile.email"
+    ))
+
+    op.alter_column('user_profile', 'users_management_id', existing_type=sa.Integer(), nullable=False)
+    op.create_unique_constraint('uq_user_profile_users_management_id', 'user_profile', ['users_management_id'])
+    op.create_foreign_key(
+        'fk_user_profile_users_management_id', 'user_profile', 'users_management',
+        ['users_management_id'], ['id'], ondelete='CASCADE',
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_constraint('fk_user_profile_users_management_id', 'user_profile', type_='foreignkey')
+    op.drop_constraint('uq_user_profile_users_management_id', 'user_profile', type_='unique')
+    op.drop_column('user_profile', 'users_management_id')
+    op.alter_column('user_profile', 'department', type_=sa.String(length=50), existing_nullable=False)
+    op.alter_column('user_profile', 'mobile_number', type_=sa.String(length=20), existing_nullable=True)
+    op.alter_column('user_profile', 'full_name', type_=sa.String(length=150), existing_nullable=False)
@@ -0,0 +1,49 @@
+"""prefix and trigram indexes for users_management search
+
+Revision ID: 20261018_users_search
+Revises: 20261018_unified_user_store
+Create Date: 2026-10-18 18:05:51.402176
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '20261018_users_search'
+down_revision: Union[str, Sequence[str], None] = '20261018_unified_user_store'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+SEARCH_COLUMNS = ('email', 'first_name', 'last_name')
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # pg_trgm and operator classes are PostgreSQL-only; other databases fall
+    # back to unindexed prefix matching
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    for column in SEARCH_COLUMNS:
+        # lower(col) LIKE 'abc%' for short prefixes
+        op.execute(
+            f"CREATE INDEX IF NOT EXISTS ix_users_management_{column}_prefix "
+            f"ON users_management (lower({column}) text_pattern_ops)"
+        )
+        # lower(col) % 'abc' and similarity() ordering
+        op.execute(
+            f"CREATE INDEX IF NOT EXISTS ix_users_management_{column}_trgm "
+            f"ON users_management USING gin (lower({column}) gin_trgm_ops)"
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    for column in SEARCH_COLUMNS:
+        op.execute(f"DROP INDEX IF EXISTS ix_users_management_{column}_trgm")
+        op.execute(f"DROP INDEX IF EXISTS ix_users_management_{column}_prefix")
@@ -0,0 +1,144 @@
+"""In-process LRU + TTL caches for near-static lookups.
+
+``TTLCache.get_or_load`` returns a cached value or runs the loader once per
+key, however many requests ask for it at the same time. Writers invalidate
+through ``invalidate_on_commit``: the keys are dropped when the session's
+transaction commits, so no reader can refill an entry from data the write
+is about to replace. A generation counter discards loads that were already
+in flight when an invalidation happened.
+
+Caches are per worker process. Another worker's writes are only seen once
+entries expire, so ``ttl`` bounds how stale a lookup can be.
+"""
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Hashable, List, Optional, Tuple
+import asyncio
+import time
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+# All caches created in this process, for stats() and /metrics
+_registry: List["TTLCache"] = []
+
+_ALL = object()  # invalidate_on_commit marker for "every key"
+
+
+class TTLCache:
+    """Bounded LRU cache whose entries expire ``ttl`` seconds after loading"""
+
+    def __init__(self, name: str, ttl: float, max_entries: int, enabled: bool = True):
+        self.name = name
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.enabled = enabled
+        self._entries: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self._loading: Dict[Hashable, asyncio.Future] = {}
+        self._generation = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        _registry.append(self)
+
+    async def get_or_load(self, key: Hashable, loader: Callable[[], Awaitable[Any]]) -> Any:
+        if not self.enabled:
+            return await loader()
+
+        entry = self._entries.get(key)
+        if entry is not None and entry[0] > time.monotonic():
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+        # Someone is already loading this key; share their result
+        pending = self._loading.get(key)
+        if pending is not None:
+            try:
+                value = await asyncio.shield(pending)
+                self.hits += 1
+                return value
+            except asyncio.CancelledError:
+                if not pending.cancelled():
+                    raise  # This request was cancelled
+                # The request doing the load went away; load it here instead
+
+        self.misses += 1
+        future = asyncio.get_running_loop().create_future()
+        self._loading[key] = future
+        generation = self._generation
+        try:
+            value = await loader()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except BaseException as e:
+            future.set_exception(e)
+            future.exception()  # Mark retrieved when nobody else was waiting
+            raise
+        finally:
+            if self._loading.get(key) is future:
+                del self._loading[key]
+        if generation == self._generation:
+            self._store(key, value)
+        future.set_result(value)
+        return value
+
+    def _store(self, key: Hashable, value: Any) -> None:
+        self._entries[key] = (time.monotonic() + self.ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def invalidate(self, key: Hashable) -> None:
+        self._generation += 1
+        self._entries.pop(key, None)
+        self._loading.pop(key, None)
+
+    def clear(self) -> None:
+        self._generation += 1
+        self._entries.clear()
+        self._loading.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "enabled": self.enabled,
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "ttl_seconds": self.ttl,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_ratio": round(self.hits / lookups, 4) if lookups else None,
+        }
+
+
+def invalidate_on_commit(session, cache: TTLCache, keys: Optional[list] = None) -> None:
+    """Drop ``keys`` (or everything) from ``cache`` once ``session`` commits"""
+    sync_session = getattr(session, "sync_session", session)
+    pending = sync_session.info.setdefault("cache_invalidations", {})
+    if keys is None:
+        pending[cache] = _ALL
+    elif pending.get(cache) is not _ALL:
+        pending.setdefault(cache, set()).update(keys)
+
+
+@event.listens_for(Session, "after_commit")
+def _apply_invalidations(session) -> None:
+    for cache, keys in session.info.pop("cache_invalidations", {}).items():
+        if keys is _ALL:
+            cache.clear()
+        else:
+            for key in keys:
+                cache.invalidate(key)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_invalidations(session) -> None:
+    session.info.pop("cache_invalidations", None)
+
+
+def stats() -> Dict[str, Dict[str, Any]]:
+    """Hit/miss counters and size of every cache"""
+    return {cache.name: cache.stats() for cache in _registry}
@@ -22,6 +22,64 @@ class Settings(BaseSettings):
     backend_host: str = "0.0.0.0"
     backend_port: int = 8000
 
+    # Engine / connection pool profile (see app/database.py)
+    db_echo: bool = False  # log every SQL statement
+    db_pool_size: int = 10
+    db_max_overflow: int = 20
+    db_pool_timeout: float = 30.0  # seconds to wait for a free connection
+    db_pool_recycle: int = 1800  # seconds before a connection is replaced
+    db_pool_pre_ping: bool = True
+    db_pool_warmup: int = 5  # connections opened at startup
+    db_statement_timeout_ms: int = 30000  # PostgreSQL statement_timeout, 0 disables
+
+    # Outbox worker that applies admin_* mirror writes in the background
+    outbox_enabled: bool = True
+    outbox_batch_size: int = 100
+    outbox_poll_interval: float = 1.0  # seconds between polls when idle
+    outbox_max_attempts: int = 10  # events failing this often are left for inspection
+    outbox_retention_hours: float = 24.0  # applied events are deleted after this long
+
+    # bcrypt runs on its own thread pool so it never blocks the event loop
+    password_hash_workers: int = 4
+    password_hash_max_queue: int = 64  # calls allowed to wait for a thread before returning 503
+
+    # Change feed for live board updates (see app/events.py)
+    event_broker: str = "memory"  # "memory" (single worker) or "postgres" (LISTEN/NOTIFY across workers)
+    event_channel: str = "flowtrack_events"
+    event_queue_size: int = 1000  # per-subscriber buffer; oldest events are dropped when full
+    event_heartbeat_interval: float = 15.0  # seconds between SSE keep-alive comments
+
+    # Delta sync: X-Sync-Timestamp is moved back by this much so rows written by
+    # transactions still in flight when a list was read are picked up next poll
+    sync_overlap_seconds: int = 5
+
+    # Per-route request metrics served at /metrics (see app/metrics.py)
+    metrics_enabled: bool = True
+
+    # In-process cache for user lookups by email and the user directory (see app/cache.py);
+    # other workers' writes show up after at most user_cache_ttl seconds
+    user_cache_enabled: bool = True
+    user_cache_ttl: float = 30.0
+    user_cache_max_entries: int = 10000
+
+    # What worker startup does about the schema (see app/migrations.py):
+    # "check" refuses to boot unless alembic_version is at the head revision,
+    # "create_all" creates missing tables (throwaway dev databases only), "off" skips both
+    db_boot_mode: str = "check"
+
+    # Kanban card order (see app/ranking.py): ranks longer than this are
+    # respaced by the background rebalancer
+    ticket_rank_max_length: int = 24
+    rank_rebalance_enabled: bool = True
+
+    # Largest batch POST /tickets/bulk accepts in one request (one transaction)
+    ticket_bulk_max_items: int = 5000
+
+    # Background scan that flags overdue tickets (see app/overdue.py); on PostgreSQL
+    # one worker at a time runs it, under an advisory lock
+    overdue_scan_enabled: bool = True
+    overdue_scan_interval: float = 300.0  # seconds between scans
+
     class Config:
         env_file = ".env"
         env_file_encoding = "utf-8"
@@ -129,14 +129,16 @@
 #     await session.delete(obj)
 #     await session.commit()
 #     return True
-from sqlalchemy import select, update, delete
+from sqlalchemy import select, insert, update, delete, tuple_, bindparam, case, func, or_, and_, literal, literal_column
 from sqlalchemy.ext.asyncio import AsyncSession 
-from typing import List, Optional
-from datetime import datetime
-from . import models, schemas 
+from typing import Dict, List, Optional, Sequence, Tuple
+from datetime import date, datetime, timedelta
+import base64
+import json
+from . import models, schemas, outbox, security, events, cache, rollups, ranking
+from .config import settings
 from .models import UserProfile 
-from .schemas import UserProfileCreate, UserProfileUpdate 
-import bcrypt 
+from .schemas import UserProfileUpdate 
 
 
 
@@ -186,6 +188,38 @@ def _normalize_location(incoming) -> Optional[str]:
         return 'WFH'
     return val
 
+def _changes(obj_in) -> dict:
+    """Fields an update schema actually sets (None means "leave unchanged")"""
+    return obj_in.dict(exclude_none=True)
+
+async def _update_returning(session: AsyncSession, model, key_column, key, values: dict):
+    """Apply ``values`` to one row with a single UPDATE ... RETURNING.
+
+    Returns the updated object, or None when no row matches ``key``.
+    """
+    if not values:
+        res = await session.execute(select(model).where(key_column == key))
+        return res.scalars().first()
+    stmt = (
+        update(model)
+        .where(key_column == key)
+        .values(**values)
+        .returning(model)
+        .execution_options(synchronize_session=False, populate_existing=True)
+    )
+    res = await session.execute(stmt)
+    return res.scalars().first()
+
+def _is_postgres(session: AsyncSession) -> bool:
+    return session.bind.dialect.name == "postgresql"
+
+def _escape_like(term: str) -> str:
+    return term.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+def _like_prefix(term: str) -> str:
+    """LIKE pattern matching values that start with ``term`` literally"""
+    return _escape_like(term) + "%"
+
 async def get_asset(session: AsyncSession, asset_id: int) -> Optional[models.Asset]:
     q = select(models.Asset).where(models.Asset.id == asset_id)
     res = await session.execute(q)
@@ -208,7 +242,11 @@ async def list_assets(session: AsyncSession, status: Optional[str] = None, user_
     res = await session.execute(q)
     return res.scalars().all()
 
-async def create_asset(session: AsyncSession, asset_in: schemas.AssetCreate) -> models.Asset:
+async def _publish_asset(event_type: str, asset: models.Asset) -> None:
+    await events.publish(event_type, asset.id, None, schemas.AssetOut.model_validate(asset).model_dump(mode="json"))
+
+async def create_asset(session: AsyncSession, asset_in: schemas.AssetCreate, mirror: bool = False) -> models.Asset:
+    """Create an asset; with ``mirror`` the admin_assets copy is queued in the same transaction"""
     # Normalize incoming values to what the DB check constraints expect
     type_val = _normalize_type(asset_in.type)
     status_val = _normalize_status(asset_in.status)
@@ -223,30 +261,29 @@ async def create_asset(session: AsyncSession, asset_in: schemas.AssetCreate) ->
         open_date=datetime.utcnow(),
     )
     session.add(obj)
+    if mirror:
+        await session.flush()
+        outbox.enqueue(session, outbox.ADMIN_ASSET_CREATE, {"asset_id": obj.id})
     await session.commit()
-    await session.refresh(obj)
+    await _publish_asset("asset.created", obj)
     return obj
 
 async def update_asset(session: AsyncSession, asset_id: int, asset_in: schemas.AssetUpdate) -> Optional[models.Asset]:
-    obj = await get_asset(session, asset_id)
-    if not obj:
-        return None
+    values = _changes(asset_in)
     
     # Use normalization helpers for updates as well
+    if "type" in values:
+        values["type"] = _normalize_type(values["type"])
+    if "location" in values:
+        values["location"] = _normalize_location(values["location"])
+    if "status" in values:
+        values["status"] = _normalize_status(values["status"])
     
-    if asset_in.email is not None:
-        obj.email = asset_in.email
-    if asset_in.type is not None:
-        obj.type = _normalize_type(asset_in.type)
-    if asset_in.location is not None:
-        obj.location = _normalize_location(asset_in.location)
-    if asset_in.status is not None:
-        obj.status = _normalize_status(asset_in.status)
-    if asset_in.description is not None:
-        obj.description = asset_in.description
-    
+    obj = await _update_returning(session, models.Asset, models.Asset.id, asset_id, values)
+    if not obj:
+        return None
     await session.commit()
-    await session.refresh(obj)
+    await _publish_asset("asset.updated", obj)
     return obj
 
 async def delete_asset(session: AsyncSession, asset_id: int) -> bool:
@@ -255,16 +292,13 @@ async def delete_asset(session: AsyncSession, asset_id: int) -> bool:
         return False
     await session.delete(obj)
     await session.commit()
+    await events.publish("asset.deleted", asset_id)
     return True
 
 
 async def create_user(session: AsyncSession, user_in: schemas.UserCreate) -> models.User:
-    # Hash password with bcrypt - ensure password is bytes and not too long
-    password_bytes = user_in.password.encode('utf-8')
-    if len(password_bytes) > 72:
-        password_bytes = password_bytes[:72]
-    salt = bcrypt.gensalt()
-    hashed_password = bcrypt.hashpw(password_bytes, salt).decode('utf-8')
+    # Hash password with bcrypt on the hashing thread pool
+    hashed_password = await security.hash_password(user_in.password)
     
     user = models.User(
         full_name=user_in.full_name,
@@ -273,7 +307,6 @@ async def create_user(session: AsyncSession, user_in: schemas.UserCreate) -> mod
     )
     session.add(user)
     await session.commit()
-    await session.refresh(user)
     return user
 
 async def get_user_by_email(session: AsyncSession, email: str) -> Optional[models.User]:
@@ -291,36 +324,18 @@ async def get_user(db: AsyncSession, user_id: int):
     result = await db.execute(select(UserProfile).where(UserProfile.user_id == user_id))
     return result.scalar_one_or_none()
 
-async def create_user_profile(db: AsyncSession, user: UserProfileCreate):
-    db_user = UserProfile(**user.dict())
-    db.add(db_user)
-    await db.commit()
-    await db.refresh(db_user)
-    return db_user
-
 async def update_user(db: AsyncSession, user_id: int, user: UserProfileUpdate):
-    await db.execute(
-        update(UserProfile)
-        .where(UserProfile.user_id == user_id)
-        .values(**user.dict(exclude_unset=True))
-    )
-    await db.commit()
-    return await get_user(db, user_id)
+    return await update_user_profile(db, user_id, user)
 
 async def delete_user(db: AsyncSession, user_id: int):
-    await db.execute(delete(UserProfile).where(UserProfile.user_id == user_id))
-    await db.commit()
+    await delete_user_profile(db, user_id)
     return {"message": "User deleted successfully"}
 
 # Admin Registration CRUD Functions
 async def create_admin(session: AsyncSession, admin_in: schemas.AdminCreate) -> models.AdminRegistration:
     """Create a new admin registration"""
-    # Hash password with bcrypt
-    password_bytes = admin_in.password.encode('utf-8')
-    if len(password_bytes) > 72:
-        password_bytes = password_bytes[:72]
-    salt = bcrypt.gensalt()
-    hashed_password = bcrypt.hashpw(password_bytes, salt).decode('utf-8')
+    # Hash password with bcrypt on the hashing thread pool
+    hashed_password = await security.hash_password(admin_in.password)
     
     admin = models.AdminRegistration(
         full_name=admin_in.full_name,
@@ -329,7 +344,6 @@ async def create_admin(session: AsyncSession, admin_in: schemas.AdminCreate) ->
     )
     session.add(admin)
     await session.commit()
-    await session.refresh(admin)
     return admin
 
 async def get_admin_by_email(session: AsyncSession, email: str) -> Optional[models.AdminRegistration]:
@@ -339,32 +353,149 @@ async def get_admin_by_email(session: AsyncSession, email: str) -> Optional[mode
     return res.scalars().first()
 
 # Ticket CRUD Functions
-async def _update_tickets_issued_counter(session: AsyncSession, email: str, increment: bool = True):
-    """Helper function to update tickets_issued counter for a user"""
+def _add_counter_delta(deltas: Dict[str, List[int]], email: Optional[str], status: Optional[str], sign: int) -> None:
+    """Record that a ticket in ``status`` was added to (+1) or removed from (-1) ``email``'s counters"""
     if not email:
         return
-    user = await get_users_management_by_email(session, email)
-    if user:
-        if increment:
-            user.tickets_issued = (user.tickets_issued or 0) + 1
-        else:
-            user.tickets_issued = max(0, (user.tickets_issued or 0) - 1)
-        await session.commit()
-
-async def _update_tickets_resolved_counter(session: AsyncSession, email: str, increment: bool = True):
-    """Helper function to update tickets_resolved counter for a user"""
-    if not email:
+    delta = deltas.setdefault(email, [0, 0])
+    if status == 'Done':
+        delta[1] += sign  # tickets_resolved
+    else:
+        delta[0] += sign  # tickets_issued
+
+def _clamped_increment(column, delta_param: str):
+    """``column + :delta`` floored at zero, evaluated by the database"""
+    new_value = column + bindparam(delta_param)
+    return case((new_value < 0, 0), else_=new_value)
+
+async def _apply_counter_deltas(session: AsyncSession, deltas: Dict[str, List[int]]) -> None:
+    """Apply tickets_issued / tickets_resolved deltas with a single UPDATE ... SET col = col + :delta.
+
+    Runs inside the caller's transaction, so the counters commit (or roll
+    back) together with the ticket write and concurrent updates can't lose
+    increments.
+    """
+    params = [
+        {"b_email": email, "d_issued": issued, "d_resolved": resolved}
+        for email, (issued, resolved) in deltas.items()
+        if issued or resolved
+    ]
+    if not params:
         return
-    user = await get_users_management_by_email(session, email)
-    if user:
-        if increment:
-            user.tickets_resolved = (user.tickets_resolved or 0) + 1
-        else:
-            user.tickets_resolved = max(0, (user.tickets_resolved or 0) - 1)
-        await session.commit()
+    _invalidate_counters(session, [p["b_email"] for p in params])
+    table = models.UsersManagement.__table__
+    stmt = (
+        table.update()
+        .where(table.c.email == bindparam("b_email"))
+        .values(
+            tickets_issued=_clamped_increment(table.c.tickets_issued, "d_issued"),
+            tickets_resolved=_clamped_increment(table.c.tickets_resolved, "d_resolved"),
+        )
+    )
+    await session.execute(stmt, params)
+
+async def recompute_ticket_counters(session: AsyncSession) -> int:
+    """Rebuild every user's tickets_issued / tickets_resolved from the tickets table.
+
+    One UPDATE with correlated aggregates, used to repair counter drift.
+    Returns the number of users_management rows updated.
+    """
+    users = models.UsersManagement.__table__
+    tickets = models.Ticket.__table__
+
+    def _count(done: bool):
+        status_filter = tickets.c.status == 'Done' if done else tickets.c.status != 'Done'
+        return (
+            select(func.count())
+            .select_from(tickets)
+            .where(tickets.c.assignee == users.c.email)
+            .where(status_filter)
+            .scalar_subquery()
+        )
+
+    res = await session.execute(
+        users.update().values(tickets_issued=_count(False), tickets_resolved=_count(True))
+    )
+    _invalidate_counters(session)
+    await session.commit()
+    return res.rowcount
+
+async def _crowded_ticket_rank(session: AsyncSession, after: Optional[str]) -> Optional[str]:
+    """Lowest rank (>= ``after``) that is too long or shared by several tickets"""
+    tickets = models.Ticket
+    shared = select(tickets.rank).group_by(tickets.rank).having(func.count() > 1)
+    query = select(tickets.rank).where(or_(func.length(tickets.rank) > settings.ticket_rank_max_length, tickets.rank.in_(shared)))
+    if after is not None:
+        query = query.where(tickets.rank >= after)
+    return (await session.execute(query.order_by(tickets.rank).limit(1))).scalar()
+
+async def _rebalance_ticket_neighbourhood(session: AsyncSession, crowded: str) -> Tuple[int, Optional[str]]:
+    """Respace the tickets between the compact ranks around ``crowded`` and commit.
+
+    The neighbourhood runs from the nearest rank below ``crowded`` to the
+    nearest rank above it that are no longer than a plain timestamp rank.
+    Only those tickets (bounds included, so moves next to them wait) are
+    locked. Returns the number re-ranked and the upper bound.
+    """
+    tickets = models.Ticket
+    compact = func.length(tickets.rank) <= ranking.INTEGER_WIDTH
+    low = (await session.execute(select(func.max(tickets.rank)).where(tickets.rank < crowded, compact))).scalar()
+    high = (await session.execute(select(func.min(tickets.rank)).where(tickets.rank > crowded, compact))).scalar()
+    bounds = [tickets.rank >= low] if low is not None else []
+    if high is not None:
+        bounds.append(tickets.rank <= high)
+    res = await session.execute(
+        select(tickets.id, tickets.rank).where(*bounds).order_by(tickets.rank, tickets.id).with_for_update()
+    )
+    window = [(ticket_id, rank) for ticket_id, rank in res.all() if (low is None or rank > low) and (high is None or rank < high)]
+    if window:
+        # Nothing compact above: stay below the next millisecond so new tickets still rank after these
+        ceiling = high if high is not None else ranking.between(window[-1][1], None)
+        ranks = ranking.spread_between(low, ceiling, len(window))
+        rows = [{"_key": ticket_id, "rank": rank} for (ticket_id, _), rank in zip(window, ranks)]
+        await _executemany_by_key(session, tickets.__table__, tickets.__table__.c.id, rows)
+        window_ids = [ticket_id for ticket_id, _ in window]
+        await session.execute(
+            update(models.AdminTicket)
+            .where(models.AdminTicket.ticket_id.in_(window_ids))
+            .values(rank=select(tickets.rank).where(tickets.id == models.AdminTicket.ticket_id).scalar_subquery())
+            .execution_options(synchronize_session=False)
+        )
+    await session.commit()
+    return len(window), high
+
+async def rebalance_ticket_ranks(session: AsyncSession) -> int:
+    """Respace ranks that grew too long or collide, one neighbourhood per transaction.
+
+    Each crowded rank is fixed by evenly respacing (ranking.spread_between)
+    the tickets between the compact ranks around it, so a rebalance locks
+    and rewrites a handful of rows rather than the whole table, and
+    admin_tickets mirrors take the new ranks in the same commit. Returns
+    the number of tickets re-ranked.
+    """
+    total, after = 0, None
+    while True:
+        crowded = await _crowded_ticket_rank(session, after)
+        if crowded is None:
+            return total
+        count, after = await _rebalance_ticket_neighbourhood(session, crowded)
+        total += count
+        if after is None:
+            return total
+
+
+async def _ticket_project_id(session: AsyncSession, ticket_id: int) -> Optional[int]:
+    """Project of a ticket, which is only recorded on its admin_tickets mirror"""
+    res = await session.execute(
+        select(models.AdminTicket.project_id).where(models.AdminTicket.ticket_id == ticket_id).limit(1)
+    )
+    return res.scalar()
+
+async def _publish_ticket(event_type: str, ticket: models.Ticket, project_id: Optional[int]) -> None:
+    await events.publish(event_type, ticket.id, project_id, schemas.TicketOut.model_validate(ticket).model_dump(mode="json"))
 
-async def create_ticket(session: AsyncSession, ticket_in: schemas.TicketCreate) -> models.Ticket:
-    """Create a new ticket"""
+async def create_ticket(session: AsyncSession, ticket_in: schemas.TicketCreate, mirror: bool = False, epic_id: Optional[int] = None, project_id: Optional[int] = None, user_name: Optional[str] = None) -> models.Ticket:
+    """Create a new ticket; with ``mirror`` the admin_tickets copy is queued in the same transaction"""
     ticket = models.Ticket(
         user_id=ticket_in.user_id,
         title=ticket_in.title,
@@ -377,102 +508,327 @@ async def create_ticket(session: AsyncSession, ticket_in: schemas.TicketCreate)
         due_date=ticket_in.due_date
     )
     session.add(ticket)
-    await session.commit()
-    await session.refresh(ticket)
+    if mirror:
+        await session.flush()
+        outbox.enqueue(session, outbox.ADMIN_TICKET_CREATE, {
+            "ticket_id": ticket.id,
+            "epic_id": epic_id,
+            "project_id": project_id,
+            "user_name": user_name,
+        })
     
-    # Update counters if assignee is set
-    if ticket.assignee:
-        if ticket.status == 'Done':
-            # If ticket is created as Done, increment tickets_resolved directly
-            await _update_tickets_resolved_counter(session, ticket.assignee, increment=True)
-        else:
-            # If ticket is not Done, increment tickets_issued
-            await _update_tickets_issued_counter(session, ticket.assignee, increment=True)
+    # Count the ticket for its assignee (resolved if created as Done, issued otherwise)
+    deltas: Dict[str, List[int]] = {}
+    _add_counter_delta(deltas, ticket.assignee, ticket.status, +1)
+    await _apply_counter_deltas(session, deltas)
     
+    await session.commit()
+    await _publish_ticket("ticket.created", ticket, project_id)
     return ticket
 
+async def create_tickets_bulk(session: AsyncSession, tickets_in: List[schemas.TicketCreate], epic_id: Optional[int] = None, project_id: Optional[int] = None, user_name: Optional[str] = None) -> List[models.Ticket]:
+    """Create many tickets and their admin_tickets mirrors in one transaction.
+
+    Tickets are written with multi-row INSERT ... RETURNING, the mirrors with
+    a multi-row INSERT (not through the outbox), and the counter and rollup
+    deltas of the whole batch are applied once each. Tickets keep the order
+    of ``tickets_in`` on the board.
+    """
+    if len(tickets_in) > settings.ticket_bulk_max_items:
+        raise ValueError(f"At most {settings.ticket_bulk_max_items} tickets can be created per request")
+    if not tickets_in:
+        return []
+    rows = [
+        {**ticket_in.dict(), "rank": rank}
+        for ticket_in, rank in zip(tickets_in, ranking.sequence(len(tickets_in)))
+    ]
+    res = await session.execute(insert(models.Ticket).returning(models.Ticket), rows)
+    # RETURNING order isn't guaranteed across batched rows; the ranks follow the input order
+    tickets = sorted(res.scalars().all(), key=lambda ticket: ticket.rank)
+
+    project = await session.get(models.Project, project_id) if project_id is not None else None
+    mirror_rows = [
+        {
+            "ticket_id": ticket.id,
+            "epic_id": epic_id,
+            "project_id": project_id,
+            "project_title": project.name if project else None,
+            "user_name": user_name,
+            **{name: getattr(ticket, name) for name in outbox.TICKET_MIRROR_FIELDS},
+        }
+        for ticket in tickets
+    ]
+    await session.execute(insert(models.AdminTicket), mirror_rows)
+
+    deltas: Dict[str, List[int]] = {}
+    rollup_deltas: Dict[rollups.RollupKey, int] = {}
+    for ticket in tickets:
+        _add_counter_delta(deltas, ticket.assignee, ticket.status, +1)
+        rollups.add(rollup_deltas, rollups.key(project_id, ticket.status, ticket.priority, ticket.assignee), +1)
+    await _apply_counter_deltas(session, deltas)
+    await rollups.apply(session, rollup_deltas)
+    await session.commit()
+
+    for ticket in tickets:
+        await _publish_ticket("ticket.created", ticket, project_id)
+    return tickets
+
 async def get_ticket(session: AsyncSession, ticket_id: int) -> Optional[models.Ticket]:
     """Get ticket by ID"""
     q = select(models.Ticket).where(models.Ticket.id == ticket_id)
     res = await session.execute(q)
     return res.scalars().first()
 
-async def list_tickets(session: AsyncSession, user_id: Optional[int] = None, status: Optional[str] = None) -> List[models.Ticket]:
-    """List tickets with optional filters"""
-    q = select(models.Ticket)
+def _encode_ticket_cursor(ticket: models.Ticket) -> str:
+    """Build an opaque cursor pointing just after the given ticket"""
+    payload = {"c": ticket.created_at.isoformat() if ticket.created_at else None, "i": ticket.id}
+    raw = json.dumps(payload, separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+def _decode_ticket_cursor(cursor: str) -> Tuple[Optional[datetime], int]:
+    """Decode a cursor produced by _encode_ticket_cursor, raising ValueError if it is malformed"""
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        payload = json.loads(raw)
+        created_at = payload["c"]
+        return (datetime.fromisoformat(created_at) if created_at is not None else None), int(payload["i"])
+    except Exception as e:
+        raise ValueError(f"Invalid cursor: {cursor}") from e
+
+def _after_ticket_cursor(session: AsyncSession, created_at: Optional[datetime], ticket_id: int):
+    """Tickets after the cursor in (created_at desc nulls first, id desc) order.
+
+    Rows without created_at (older databases, SQL-script inserts) come
+    first and are paged by id alone.
+    """
+    tickets = models.Ticket
+    if created_at is None:
+        return or_(and_(tickets.created_at.is_(None), tickets.id < ticket_id), tickets.created_at.isnot(None))
+    if not _is_postgres(session):
+        # SQLite compares timestamps as text, and the CURRENT_TIMESTAMP default
+        # stores no fractional seconds; isoformat() matches both stored forms
+        created_at = literal(created_at.isoformat(sep=" "))
+    return tuple_(tickets.created_at, tickets.id) < tuple_(created_at, ticket_id)
+
+def _select_fields(model, fields: Optional[Sequence[str]]):
+    """SELECT of the whole entity, or only the ``fields`` columns (rows then come back as Row tuples)"""
+    if fields is None:
+        return select(model)
+    return select(*(getattr(model, name) for name in fields))
+
+async def _fetch(session: AsyncSession, q, fields: Optional[Sequence[str]]) -> list:
+    res = await session.execute(q)
+    return list(res.scalars().all() if fields is None else res.all())
+
+async def list_tickets(session: AsyncSession, user_id: Optional[int] = None, status: Optional[str] = None, limit: Optional[int] = None, cursor: Optional[str] = None, updated_since: Optional[datetime] = None, fields: Optional[Sequence[str]] = None, by_rank: bool = False) -> List[models.Ticket]:
+    """List tickets with optional filters, newest first (or in board order with ``by_rank``).
+
+    When ``cursor`` is given only tickets after that position in the
+    (created_at desc nulls first, id desc) ordering are returned, so pages are read
+    with an index range scan instead of an OFFSET. ``updated_since`` keeps
+    only tickets changed at or after that time. ``fields`` limits the
+    selected columns.
+    """
+    if by_rank and (cursor or limit):
+        raise ValueError("order=rank returns the whole list and cannot be combined with limit or cursor")
+    q = _select_fields(models.Ticket, fields)
     if user_id:
         q = q.where(models.Ticket.user_id == user_id)
     if status:
         q = q.where(models.Ticket.status == status)
-    q = q.order_by(models.Ticket.created_at.desc())
-    res = await session.execute(q)
-    return res.scalars().all()
-
-async def update_ticket(session: AsyncSession, ticket_id: int, ticket_in: schemas.TicketUpdate) -> Optional[models.Ticket]:
-    """Update a ticket"""
-    ticket = await get_ticket(session, ticket_id)
+    if updated_since:
+        q = q.where(models.Ticket.updated_at >= updated_since)
+    if cursor:
+        q = q.where(_after_ticket_cursor(session, *_decode_ticket_cursor(cursor)))
+    if by_rank:
+        q = q.order_by(models.Ticket.rank, models.Ticket.id)
+    else:
+        # NULLS FIRST is PostgreSQL's default for DESC, so its index still serves the order
+        q = q.order_by(models.Ticket.created_at.desc().nulls_first(), models.Ticket.id.desc())
+    if limit:
+        q = q.limit(limit)
+    return await _fetch(session, q, fields)
+
+async def list_tickets_page(session: AsyncSession, limit: int, user_id: Optional[int] = None, status: Optional[str] = None, cursor: Optional[str] = None, updated_since: Optional[datetime] = None, fields: Optional[Sequence[str]] = None) -> Tuple[List[models.Ticket], Optional[str]]:
+    """Return one page of tickets and the cursor for the next page (None on the last page)"""
+    if fields is not None:
+        # The next-page cursor is built from these
+        fields = tuple(fields) + tuple(name for name in ("created_at", "id") if name not in fields)
+    rows = await list_tickets(session, user_id, status, limit=limit + 1, cursor=cursor, updated_since=updated_since, fields=fields)
+    if len(rows) <= limit:
+        return rows, None
+    rows = rows[:limit]
+    return rows, _encode_ticket_cursor(rows[-1])
+
+# Text search configuration of the tickets / admin_tickets search_vector columns
+# (migration 20261018_ticket_search); queries must use the same one
+TICKET_SEARCH_CONFIG = "english"
+
+def _encode_offset_cursor(offset: int) -> str:
+    raw = json.dumps({"o": offset}, separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+def _decode_offset_cursor(cursor: str) -> int:
+    """Decode a cursor produced by _encode_offset_cursor, raising ValueError if it is malformed"""
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        offset = int(json.loads(raw)["o"])
+    except Exception as e:
+        raise ValueError(f"Invalid cursor: {cursor}") from e
+    if offset < 0:
+        raise ValueError(f"Invalid cursor: {cursor}")
+    return offset
+
+async def _search_ticket_rows(session: AsyncSession, model, key_column, q: str, query, limit: int, cursor: Optional[str]):
+    """Rank ``query`` (already filtered) by how well title/description match ``q`` and return one page.
+
+    PostgreSQL matches the GIN-indexed search_vector column with
+    websearch_to_tsquery and orders by ts_rank_cd. Other databases (the
+    SQLite test stand-in) require every word to appear in the title or
+    description, with title matches first.
+    """
+    offset = _decode_offset_cursor(cursor) if cursor else 0
+    if not q.strip():
+        return [], None
+    if _is_postgres(session):
+        vector = literal_column(f"{model.__tablename__}.search_vector")
+        ts_query = func.websearch_to_tsquery(TICKET_SEARCH_CONFIG, q)
+        query = query.where(vector.op("@@")(ts_query)).order_by(func.ts_rank_cd(vector, ts_query).desc(), key_column.desc())
+    else:
+        title = func.lower(func.coalesce(model.title, ""))
+        description = func.lower(func.coalesce(model.description, ""))
+        words = q.lower().split()
+        for word in words:
+            pattern = f"%{_escape_like(word)}%"
+            query = query.where(or_(title.like(pattern, escape="\\"), description.like(pattern, escape="\\")))
+        in_title = and_(*(title.like(f"%{_escape_like(word)}%", escape="\\") for word in words))
+        query = query.order_by(case((in_title, 0), else_=1), key_column.desc())
+    res = await session.execute(query.offset(offset).limit(limit + 1))
+    rows = list(res.scalars().all())
+    if len(rows) <= limit:
+        return rows, None
+    return rows[:limit], _encode_offset_cursor(offset + limit)
+
+async def search_tickets(session: AsyncSession, q: str, limit: int, cursor: Optional[str] = None, project_id: Optional[int] = None, status: Optional[str] = None, assignee: Optional[str] = None) -> Tuple[List[models.Ticket], Optional[str]]:
+    """Full-text search over ticket titles and descriptions, best match first.
+
+    Returns one page and the cursor for the next one (None on the last
+    page). ``project_id`` is resolved through the admin_tickets mirror.
+    """
+    query = select(models.Ticket)
+    if project_id is not None:
+        query = query.where(models.Ticket.id.in_(
+            select(models.AdminTicket.ticket_id).where(models.AdminTicket.project_id == project_id)
+        ))
+    if status:
+        query = query.where(models.Ticket.status == status)
+    if assignee:
+        query = query.where(models.Ticket.assignee == assignee)
+    return await _search_ticket_rows(session, models.Ticket, models.Ticket.id, q, query, limit, cursor)
+
+def _timeline_overlaps(session: AsyncSession, window_start: date, window_end: date):
+    """Tickets whose [start_date, due_date] span overlaps the window, written to match the
+    ix_tickets_timeline index (see app/models.py); a single date is a one-day span"""
+    tickets = models.Ticket
+    dated = or_(tickets.start_date.isnot(None), tickets.due_date.isnot(None))
+    if _is_postgres(session):
+        closed = literal_column("'[]'")
+        span = func.daterange(func.least(tickets.start_date, tickets.due_date), func.greatest(tickets.start_date, tickets.due_date), closed)
+        return and_(dated, span.op("&&")(func.daterange(window_start, window_end, closed)))
+    first = func.coalesce(tickets.start_date, tickets.due_date)
+    last = func.coalesce(tickets.due_date, tickets.start_date)
+    return and_(dated, func.min(first, last) <= window_end, func.max(first, last) >= window_start)
+
+async def list_ticket_timeline(session: AsyncSession, window_start: date, window_end: date, project_id: Optional[int] = None, fields: Optional[Sequence[str]] = None) -> List[models.Ticket]:
+    """Tickets scheduled within [window_start, window_end] (both inclusive), earliest first.
+
+    ``project_id`` is resolved through the admin_tickets mirror; ``fields``
+    limits the selected columns.
+    """
+    if window_start > window_end:
+        raise ValueError("'from' must not be after 'to'")
+    tickets = models.Ticket
+    query = _select_fields(tickets, fields).where(_timeline_overlaps(session, window_start, window_end))
+    if project_id is not None:
+        query = query.where(tickets.id.in_(
+            select(models.AdminTicket.ticket_id).where(models.AdminTicket.project_id == project_id)
+        ))
+    query = query.order_by(func.coalesce(tickets.start_date, tickets.due_date), tickets.id)
+    return await _fetch(session, query, fields)
+
+async def list_overdue_tickets(session: AsyncSession, project_id: Optional[int] = None, fields: Optional[Sequence[str]] = None) -> List[models.Ticket]:
+    """Tickets flagged by the overdue scan (app/overdue.py), earliest due date first"""
+    tickets = models.Ticket
+    query = _select_fields(tickets, fields).where(tickets.overdue)
+    if project_id is not None:
+        query = query.where(tickets.id.in_(
+            select(models.AdminTicket.ticket_id).where(models.AdminTicket.project_id == project_id)
+        ))
+    query = query.order_by(tickets.due_date, tickets.id)
+    return await _fetch(session, query, fields)
+
+async def update_ticket(session: AsyncSession, ticket_id: int, ticket_in: schemas.TicketUpdate, mirror: bool = False) -> Optional[models.Ticket]:
+    """Update a ticket; with ``mirror`` the admin_tickets sync is queued in the same transaction"""
+    return await _update_ticket_values(session, ticket_id, _changes(ticket_in), mirror)
+
+async def move_ticket(session: AsyncSession, ticket_id: int, move: schemas.TicketMove, mirror: bool = False) -> Optional[models.Ticket]:
+    """Drop a ticket between two others (and into another status column), rewriting only its own row.
+
+    Raises ValueError when a neighbour does not exist, and
+    ranking.RankCollision when the neighbours' ranks leave no room between
+    them (equal ranks, or a stale board); see ranking.between.
+    """
+    neighbours = {i for i in (move.prev_id, move.next_id) if i is not None}
+    if ticket_id in neighbours:
+        raise ValueError("A ticket cannot be moved next to itself")
+    ranks: Dict[int, str] = {}
+    if neighbours:
+        # Shared locks: the rebalancer can't respace these ranks until this move commits
+        res = await session.execute(
+            select(models.Ticket.id, models.Ticket.rank)
+            .where(models.Ticket.id.in_(neighbours))
+            .with_for_update(read=True)
+        )
+        ranks = dict(res.all())
+        missing = neighbours - set(ranks)
+        if missing:
+            raise ValueError(f"Ticket {min(missing)} not found")
+    values = {"rank": ranking.between(ranks.get(move.prev_id), ranks.get(move.next_id))}
+    if move.status:
+        values["status"] = move.status
+    return await _update_ticket_values(session, ticket_id, values, mirror)
+
+async def _update_ticket_values(session: AsyncSession, ticket_id: int, values: dict, mirror: bool) -> Optional[models.Ticket]:
+    # Counters only move when the assignee or status changes; lock the row
+    # while reading the old values so concurrent moves can't double count
+    old = None
+    if "assignee" in values or "status" in values:
+        res = await session.execute(
+            select(models.Ticket.assignee, models.Ticket.status)
+            .where(models.Ticket.id == ticket_id)
+            .with_for_update()
+        )
+        old = res.first()
+        if old is None:
+            return None
+    
+    ticket = await _update_returning(session, models.Ticket, models.Ticket.id, ticket_id, values)
     if not ticket:
         return None
     
-    # Store old values for counter updates
-    old_assignee = ticket.assignee
-    old_status = ticket.status
-    
-    if ticket_in.title is not None:
-        ticket.title = ticket_in.title
-    if ticket_in.description is not None:
-        ticket.description = ticket_in.description
-    if ticket_in.status is not None:
-        ticket.status = ticket_in.status
-    if ticket_in.priority is not None:
-        ticket.priority = ticket_in.priority
-    if ticket_in.assignee is not None:
-        ticket.assignee = ticket_in.assignee
-    if ticket_in.reporter is not None:
-        ticket.reporter = ticket_in.reporter
-    if ticket_in.start_date is not None:
-        ticket.start_date = ticket_in.start_date
-    if ticket_in.due_date is not None:
-        ticket.due_date = ticket_in.due_date
+    if old is not None:
+        # Move the ticket from its old (assignee, status) counter to the new one;
+        # the deltas cancel out when neither changed in a way that matters
+        deltas: Dict[str, List[int]] = {}
+        _add_counter_delta(deltas, old.assignee, old.status, -1)
+        _add_counter_delta(deltas, ticket.assignee, ticket.status, +1)
+        await _apply_counter_deltas(session, deltas)
     
+    if mirror:
+        outbox.enqueue(session, outbox.ADMIN_TICKET_UPDATE, {"ticket_id": ticket.id})
+    project_id = await _ticket_project_id(session, ticket.id)
     await session.commit()
-    await session.refresh(ticket)
-    
-    # Handle counter updates
-    new_assignee = ticket.assignee if ticket_in.assignee is not None else old_assignee
-    new_status = ticket.status if ticket_in.status is not None else old_status
-    
-    # Handle assignee changes FIRST (before status changes)
-    if ticket_in.assignee is not None and old_assignee != new_assignee:
-        # Remove from old assignee
-        if old_assignee:
-            if old_status == 'Done':
-                await _update_tickets_resolved_counter(session, old_assignee, increment=False)
-            else:
-                await _update_tickets_issued_counter(session, old_assignee, increment=False)
-        
-        # Add to new assignee
-        if new_assignee:
-            if new_status == 'Done':
-                await _update_tickets_resolved_counter(session, new_assignee, increment=True)
-            else:
-                await _update_tickets_issued_counter(session, new_assignee, increment=True)
-    
-    # Handle status changes (only if assignee didn't change)
-    if ticket_in.status is not None and old_status != new_status and ticket_in.assignee is None:
-        assignee_for_status = old_assignee
-        if assignee_for_status:
-            # If moving to Done
-            if new_status == 'Done' and old_status != 'Done':
-                # Increment tickets_resolved and decrement tickets_issued
-                await _update_tickets_resolved_counter(session, assignee_for_status, increment=True)
-                await _update_tickets_issued_counter(session, assignee_for_status, increment=False)
-            # If moving from Done to something else
-            elif old_status == 'Done' and new_status != 'Done':
-                # Decrement tickets_resolved and increment tickets_issued
-                await _update_tickets_resolved_counter(session, assignee_for_status, increment=False)
-                await _update_tickets_issued_counter(session, assignee_for_status, increment=True)
-    
+    await _publish_ticket("ticket.updated", ticket, project_id)
     return ticket
 
 async def delete_ticket(session: AsyncSession, ticket_id: int) -> bool:
@@ -481,20 +837,35 @@ async def delete_ticket(session: AsyncSession, ticket_id: int) -> bool:
     if not ticket:
         return False
     
-    # Update counters before deleting
-    if ticket.assignee:
-        if ticket.status == 'Done':
-            # If ticket was Done, decrement tickets_resolved
-            await _update_tickets_resolved_counter(session, ticket.assignee, increment=False)
-        else:
-            # If ticket was not Done, decrement tickets_issued
-            await _update_tickets_issued_counter(session, ticket.assignee, increment=False)
+    # Remove the ticket from its assignee's counters in the same transaction
+    deltas: Dict[str, List[int]] = {}
+    _add_counter_delta(deltas, ticket.assignee, ticket.status, -1)
+    await _apply_counter_deltas(session, deltas)
     
+    project_id = await _ticket_project_id(session, ticket_id)
     await session.delete(ticket)
+    await _record_deletes(session, [("tickets", ticket_id)], project_id)
     await session.commit()
+    await events.publish("ticket.deleted", ticket_id, project_id)
     return True
 
 # Project CRUD Functions
+def _split_emails(value: Optional[str]) -> List[str]:
+    """Split a comma-separated email column into a de-duplicated list"""
+    if not value:
+        return []
+    return list(dict.fromkeys(email.strip() for email in value.split(',') if email.strip()))
+
+async def _sync_project_members(session: AsyncSession, project: models.Project) -> None:
+    """Rewrite project_members rows from the project's leads/team_members columns (caller commits)"""
+    await session.execute(
+        delete(models.ProjectMember).where(models.ProjectMember.project_id == project.id)
+    )
+    rows = [{"project_id": project.id, "user_email": email, "role": "lead"} for email in _split_emails(project.leads)]
+    rows += [{"project_id": project.id, "user_email": email, "role": "member"} for email in _split_emails(project.team_members)]
+    if rows:
+        await session.execute(models.ProjectMember.__table__.insert(), rows)
+
 async def create_project(session: AsyncSession, project_in: schemas.ProjectCreate) -> models.Project:
     """Create a new project"""
     project = models.Project(
@@ -502,11 +873,13 @@ async def create_project(session: AsyncSession, project_in: schemas.ProjectCreat
         project_key=project_in.project_key,
         project_type=project_in.project_type,
         leads=project_in.leads,
+        team_members=project_in.team_members,
         description=project_in.description
     )
     session.add(project)
+    await session.flush()
+    await _sync_project_members(session, project)
     await session.commit()
-    await session.refresh(project)
     return project
 
 async def get_project(session: AsyncSession, project_id: int) -> Optional[models.Project]:
@@ -515,57 +888,32 @@ async def get_project(session: AsyncSession, project_id: int) -> Optional[models
     res = await session.execute(q)
     return res.scalars().first()
 
-async def list_projects(session: AsyncSession, user_email: Optional[str] = None) -> List[models.Project]:
-    """List projects, optionally filtered by user email (as lead or team member)"""
-    q = select(models.Project).order_by(models.Project.created_at.desc())
-    res = await session.execute(q)
-    projects = res.scalars().all()
+async def list_projects(session: AsyncSession, user_email: Optional[str] = None, updated_since: Optional[datetime] = None) -> List[models.Project]:
+    """List projects, optionally filtered by user email (as lead or team member) and last change"""
+    q = select(models.Project)
+    if updated_since:
+        q = q.where(models.Project.updated_at >= updated_since)
     
-    # If user_email is provided, filter projects where user is lead OR team member
+    # If user_email is provided, only keep projects where user is lead OR team member
     if user_email:
-        filtered_projects = []
-        for project in projects:
-            # Check if user is in leads
-            is_lead = False
-            if project.leads:
-                lead_emails = [email.strip() for email in project.leads.split(',') if email.strip()]
-                is_lead = user_email in lead_emails
-            
-            # Check if user is in team_members
-            is_team_member = False
-            if project.team_members:
-                team_emails = [email.strip() for email in project.team_members.split(',') if email.strip()]
-                is_team_member = user_email in team_emails
-            
-            # Include project if user is either lead or team member
-            if is_lead or is_team_member:
-                filtered_projects.append(project)
-        
-        return filtered_projects
+        member_of = select(models.ProjectMember.project_id).where(models.ProjectMember.user_email == user_email)
+        q = q.where(models.Project.id.in_(member_of))
     
-    return projects
+    q = q.order_by(models.Project.created_at.desc())
+    res = await session.execute(q)
+    return res.scalars().all()
 
 async def update_project(session: AsyncSession, project_id: int, project_in: schemas.ProjectUpdate) -> Optional[models.Project]:
     """Update a project"""
-    project = await get_project(session, project_id)
+    values = _changes(project_in)
+    project = await _update_returning(session, models.Project, models.Project.id, project_id, values)
     if not project:
         return None
 
-    if project_in.name is not None:
-        project.name = project_in.name
-    if project_in.project_key is not None:
-        project.project_key = project_in.project_key
-    if project_in.project_type is not None:
-        project.project_type = project_in.project_type
-    if project_in.leads is not None:
-        project.leads = project_in.leads
-    if project_in.team_members is not None:
-        project.team_members = project_in.team_members
-    if project_in.description is not None:
-        project.description = project_in.description
+    if "leads" in values or "team_members" in values:
+        await _sync_project_members(session, project)
 
     await session.commit()
-    await session.refresh(project)
     return project
 
 async def delete_project(session: AsyncSession, project_id: int) -> bool:
@@ -576,15 +924,30 @@ async def delete_project(session: AsyncSession, project_id: int) -> bool:
     if not project:
         return False
     
+    # Deleted rows, recorded as tombstones in one statement at the end
+    deleted: List[Tuple[str, int]] = []
+    
+    rollup_deltas: Dict[rollups.RollupKey, int] = {}
+    admin_ticket_columns = (
+        models.AdminTicket.admin_ticket_id, models.AdminTicket.project_id, models.AdminTicket.status,
+        models.AdminTicket.priority, models.AdminTicket.assignee,
+    )
+
     # Delete associated admin_tickets first
-    await session.execute(
+    res = await session.execute(
         delete(models.AdminTicket).where(models.AdminTicket.project_id == project_id)
+        .returning(*admin_ticket_columns)
     )
+    for row in res.all():
+        deleted.append(("admin_tickets", row.admin_ticket_id))
+        rollups.add(rollup_deltas, rollups.key_of(row), -1)
     
     # Delete associated admin_epics
-    await session.execute(
+    res = await session.execute(
         delete(models.AdminEpic).where(models.AdminEpic.project_id == project_id)
+        .returning(models.AdminEpic.admin_epic_id)
     )
+    deleted += [("admin_epics", i) for i in res.scalars().all()]
     
     # Delete associated tickets (if you have a project_id column in tickets table)
     # Note: Currently tickets don't have project_id directly, so we need to delete by epic_id
@@ -596,27 +959,43 @@ async def delete_project(session: AsyncSession, project_id: int) -> bool:
     
     # Delete tickets associated with these epics (from admin_tickets by epic_id)
     if epic_ids:
-        await session.execute(
+        res = await session.execute(
             delete(models.AdminTicket).where(models.AdminTicket.epic_id.in_(epic_ids))
+            .returning(*admin_ticket_columns)
         )
+        for row in res.all():
+            deleted.append(("admin_tickets", row.admin_ticket_id))
+            rollups.add(rollup_deltas, rollups.key_of(row), -1)
+    await rollups.apply(session, rollup_deltas)
     
     # Delete associated epics
     await session.execute(
         delete(models.Epic).where(models.Epic.project_id == project_id)
     )
+    deleted += [("epics", i) for i in epic_ids]
+    
+    # Delete membership rows
+    await session.execute(
+        delete(models.ProjectMember).where(models.ProjectMember.project_id == project_id)
+    )
     
     # Finally, delete the project itself
     await session.delete(project)
+    deleted.append(("projects", project_id))
+    await _record_deletes(session, deleted, project_id)
     await session.commit()
     return True
 
 # Epic CRUD Functions
-async def create_epic(session: AsyncSession, epic_in: schemas.EpicCreate) -> models.Epic:
-    """Create a new epic"""
+async def create_epic(session: AsyncSession, epic_in: schemas.EpicCreate, mirror: bool = False, user_name: Optional[str] = None) -> models.Epic:
+    """Create a new epic; with ``mirror`` the admin_epics copy is queued in the same transaction"""
     epic = models.Epic(project_id=epic_in.project_id, name=epic_in.name)
     session.add(epic)
+    if mirror:
+        await session.flush()
+        outbox.enqueue(session, outbox.ADMIN_EPIC_CREATE, {"epic_id": epic.id, "user_name": user_name})
     await session.commit()
-    await session.refresh(epic)
+    await events.publish("epic.created", epic.id, epic.project_id, schemas.EpicOut.model_validate(epic).model_dump(mode="json"))
     return epic
 
 async def get_epic(session: AsyncSession, epic_id: int) -> Optional[models.Epic]:
@@ -625,11 +1004,13 @@ async def get_epic(session: AsyncSession, epic_id: int) -> Optional[models.Epic]
     res = await session.execute(q)
     return res.scalars().first()
 
-async def list_epics(session: AsyncSession, project_id: Optional[int] = None) -> List[models.Epic]:
-    """List all epics, optionally filtered by project"""
+async def list_epics(session: AsyncSession, project_id: Optional[int] = None, updated_since: Optional[datetime] = None) -> List[models.Epic]:
+    """List all epics, optionally filtered by project and last change"""
     q = select(models.Epic)
     if project_id:
         q = q.where(models.Epic.project_id == project_id)
+    if updated_since:
+        q = q.where(models.Epic.updated_at >= updated_since)
     q = q.order_by(models.Epic.created_at.desc())
     res = await session.execute(q)
     return res.scalars().all()
@@ -639,8 +1020,11 @@ async def delete_epic(session: AsyncSession, epic_id: int) -> bool:
     epic = await get_epic(session, epic_id)
     if not epic:
         return False
+    project_id = epic.project_id
     await session.delete(epic)
+    await _record_deletes(session, [("epics", epic_id)], project_id)
     await session.commit()
+    await events.publish("epic.deleted", epic_id, project_id)
     return True
 
 # Admin Asset CRUD Functions
@@ -659,7 +1043,6 @@ async def create_admin_asset(session: AsyncSession, admin_asset_in: schemas.Admi
     )
     session.add(admin_asset)
     await session.commit()
-    await session.refresh(admin_asset)
     return admin_asset
 
 async def get_admin_asset(session: AsyncSession, admin_asset_id: int) -> Optional[models.AdminAsset]:
@@ -676,29 +1059,12 @@ async def list_admin_assets(session: AsyncSession) -> List[models.AdminAsset]:
 
 async def update_admin_asset(session: AsyncSession, admin_asset_id: int, admin_asset_in: schemas.AdminAssetUpdate) -> Optional[models.AdminAsset]:
     """Update an admin asset"""
-    admin_asset = await get_admin_asset(session, admin_asset_id)
+    admin_asset = await _update_returning(
+        session, models.AdminAsset, models.AdminAsset.admin_asset_id, admin_asset_id, _changes(admin_asset_in)
+    )
     if not admin_asset:
         return None
-
-    if admin_asset_in.email is not None:
-        admin_asset.email = admin_asset_in.email
-    if admin_asset_in.type is not None:
-        admin_asset.type = admin_asset_in.type
-    if admin_asset_in.location is not None:
-        admin_asset.location = admin_asset_in.location
-    if admin_asset_in.description is not None:
-        admin_asset.description = admin_asset_in.description
-    if admin_asset_in.status is not None:
-        admin_asset.status = admin_asset_in.status
-    if admin_asset_in.open_date is not None:
-        admin_asset.open_date = admin_asset_in.open_date
-    if admin_asset_in.close_date is not None:
-        admin_asset.close_date = admin_asset_in.close_date
-    if admin_asset_in.actions is not None:
-        admin_asset.actions = admin_asset_in.actions
-
     await session.commit()
-    await session.refresh(admin_asset)
     return admin_asset
 
 async def delete_admin_asset(session: AsyncSession, admin_asset_id: int) -> bool:
@@ -710,29 +1076,120 @@ async def delete_admin_asset(session: AsyncSession, admin_asset_id: int) -> bool
     await session.commit()
     return True
 
-# ==================== UsersManagement CRUD ====================
+# ==================== User accounts ====================
+# users_management is the source of truth for a person. user_profile is a
+# projection of it, linked by users_management_id: its name, email, mobile,
+# role, department and status are derived from the users_management row and
+# rewritten in the same transaction, so only date_of_birth is owned by the
+# profile. users keeps login credentials and is removed with the account.
+
+# Read-through caches for the lookups behind profile pages and the assignee
+# dropdown. They hold response snapshots (not ORM objects, which would be
+# shared across sessions) and are invalidated when a write commits.
+_users_by_email = cache.TTLCache(
+    "users_management_by_email", settings.user_cache_ttl, settings.user_cache_max_entries, settings.user_cache_enabled
+)
+_profiles_by_email = cache.TTLCache(
+    "user_profile_by_email", settings.user_cache_ttl, settings.user_cache_max_entries, settings.user_cache_enabled
+)
+_user_directory = cache.TTLCache("user_directory", settings.user_cache_ttl, 2, settings.user_cache_enabled)
+
+def _invalidate_users(session: AsyncSession) -> None:
+    """Drop every cached user lookup when ``session`` commits"""
+    for user_cache in (_users_by_email, _profiles_by_email, _user_directory):
+        cache.invalidate_on_commit(session, user_cache)
+
+def _invalidate_counters(session: AsyncSession, emails: Optional[List[str]] = None) -> None:
+    """Drop cached users_management rows whose ticket counters change when ``session`` commits"""
+    cache.invalidate_on_commit(session, _users_by_email, emails)
+    cache.invalidate_on_commit(session, _user_directory, ["users_management"])
+
+# users_management fields that user_profile projects
+_PROFILE_SOURCE_FIELDS = {"first_name", "last_name", "email", "mobile_number", "role", "department", "active"}
+
+def _split_full_name(full_name: str) -> Tuple[str, str]:
+    parts = full_name.strip().split(' ', 1)
+    return parts[0], parts[1] if len(parts) > 1 else ''
+
+def _profile_values(user: models.UsersManagement) -> dict:
+    """user_profile columns derived from a users_management row"""
+    return {
+        "full_name": f"{user.first_name} {user.last_name}".strip(),
+        "email": user.email,
+        "mobile_number": user.mobile_number,
+        "role": user.role,
+        "department": user.department,
+        "user_status": "Active" if user.active else "Inactive",
+    }
+
+def _management_values(profile_values: dict) -> dict:
+    """users_management columns for profile-shaped input"""
+    values = {k: v for k, v in profile_values.items() if k in ("email", "mobile_number", "role", "department")}
+    if "full_name" in profile_values:
+        values["first_name"], values["last_name"] = _split_full_name(profile_values["full_name"])
+    if "user_status" in profile_values:
+        values["active"] = profile_values["user_status"] == "Active"
+    return values
+
+async def create_user_account(
+    session: AsyncSession, user_in: schemas.UsersManagementCreate, date_of_birth=None
+) -> Tuple[models.UsersManagement, models.UserProfile]:
+    """Create a users_management row and its user_profile projection in one transaction.
+
+    A duplicate email raises IntegrityError from the unique constraint.
+    """
+    user = models.UsersManagement(**user_in.dict())
+    session.add(user)
+    await session.flush()
+    profile = models.UserProfile(users_management_id=user.id, date_of_birth=date_of_birth, **_profile_values(user))
+    session.add(profile)
+    _invalidate_users(session)
+    await session.commit()
+    return user, profile
 
-async def create_users_management(session: AsyncSession, user_in: schemas.UsersManagementCreate) -> models.UsersManagement:
-    """Create a new user in users_management table"""
-    user = models.UsersManagement(
-        first_name=user_in.first_name,
-        last_name=user_in.last_name,
-        email=user_in.email,
-        role=user_in.role,
-        department=user_in.department,
-        tickets_issued=user_in.tickets_issued,
-        tickets_resolved=user_in.tickets_resolved,
-        active=user_in.active,
-        language=user_in.language,
-        mobile_number=user_in.mobile_number,
-        date_format=user_in.date_format,
-        password_reset_needed=user_in.password_reset_needed,
-        profile_file_name=user_in.profile_file_name,
-        profile_file_size=user_in.profile_file_size
+async def _update_account(
+    session: AsyncSession, user_key, values: dict, date_of_birth: Optional[dict] = None
+) -> Tuple[Optional[models.UsersManagement], Optional[models.UserProfile]]:
+    """Apply users_management changes and rewrite the projection, without committing.
+
+    The profile is only returned when something in it was written.
+    """
+    user = await _update_returning(session, models.UsersManagement, models.UsersManagement.id, user_key, values)
+    if not user:
+        return None, None
+    profile_values = dict(date_of_birth or {})
+    if _PROFILE_SOURCE_FIELDS.intersection(values):
+        profile_values.update(_profile_values(user))
+    profile = None
+    if profile_values:
+        profile = await _update_returning(
+            session, models.UserProfile, models.UserProfile.users_management_id, user.id, profile_values
+        )
+    return user, profile
+
+async def delete_user_account(session: AsyncSession, user_key) -> bool:
+    """Delete a users_management row with its profile and login in one transaction"""
+    res = await session.execute(
+        delete(models.UsersManagement)
+        .where(models.UsersManagement.id == user_key)
+        .returning(models.UsersManagement.id, models.UsersManagement.email)
     )
-    session.add(user)
+    row = res.first()
+    if row is None:
+        return False
+    # ON DELETE CASCADE covers user_profile on PostgreSQL; delete explicitly
+    # for databases that don't enforce foreign keys
+    await session.execute(delete(models.UserProfile).where(models.UserProfile.users_management_id == row.id))
+    await session.execute(delete(models.User).where(models.User.email == row.email))
+    _invalidate_users(session)
     await session.commit()
-    await session.refresh(user)
+    return True
+
+# ==================== UsersManagement CRUD ====================
+
+async def create_users_management(session: AsyncSession, user_in: schemas.UsersManagementCreate) -> models.UsersManagement:
+    """Create a new user in users_management table, with its user_profile"""
+    user, _ = await create_user_account(session, user_in)
     return user
 
 async def get_users_management_by_id(session: AsyncSession, user_id: int) -> Optional[models.UsersManagement]:
@@ -742,82 +1199,86 @@ async def get_users_management_by_id(session: AsyncSession, user_id: int) -> Opt
     )
     return result.scalar_one_or_none()
 
-async def get_users_management_by_email(session: AsyncSession, email: str) -> Optional[models.UsersManagement]:
-    """Get a user from users_management by email"""
-    result = await session.execute(
-        select(models.UsersManagement).where(models.UsersManagement.email == email)
-    )
-    return result.scalar_one_or_none()
-
-async def list_users_management(session: AsyncSession) -> List[models.UsersManagement]:
-    """List all users from users_management table"""
-    result = await session.execute(select(models.UsersManagement))
-    return list(result.scalars().all())
+async def get_users_management_by_email(session: AsyncSession, email: str) -> Optional[schemas.UsersManagementOut]:
+    """Get a user from users_management by email (cached)"""
+    async def load():
+        result = await session.execute(
+            select(models.UsersManagement).where(models.UsersManagement.email == email)
+        )
+        user = result.scalar_one_or_none()
+        return schemas.UsersManagementOut.model_validate(user) if user else None
+
+    return await _users_by_email.get_or_load(email, load)
+
+async def list_users_management(session: AsyncSession, fields: Optional[Sequence[str]] = None) -> list:
+    """List all users from users_management table (cached).
+
+    With ``fields`` only those columns are selected, straight from the
+    database: the cache holds whole rows.
+    """
+    if fields is not None:
+        return await _fetch(session, _select_fields(models.UsersManagement, fields), fields)
+
+    async def load():
+        result = await session.execute(select(models.UsersManagement))
+        return [schemas.UsersManagementOut.model_validate(user) for user in result.scalars().all()]
+
+    return await _user_directory.get_or_load("users_management", load)
+
+# Trigram matching only kicks in once a term has a full trigram
+SEARCH_TRIGRAM_MIN_LENGTH = 3
+
+async def search_users_management(session: AsyncSession, q: str, limit: int = 10) -> List[schemas.UserSearchResult]:
+    """Users whose email, first or last name starts with ``q`` (case-insensitive).
+
+    On PostgreSQL, names and emails that are merely similar (pg_trgm) are
+    returned after the prefix matches, most similar first. Both kinds of
+    match are served by the lower() expression indexes on users_management.
+    """
+    term = q.strip().lower()
+    if not term:
+        return []
+    users = models.UsersManagement
+    fields = (func.lower(users.email), func.lower(users.first_name), func.lower(users.last_name))
+    prefix = or_(*(field.like(_like_prefix(term), escape="\\") for field in fields))
+
+    query = select(users.id, users.email, users.first_name, users.last_name)
+    if _is_postgres(session) and len(term) >= SEARCH_TRIGRAM_MIN_LENGTH:
+        similar = or_(*(field.op("%")(term) for field in fields))
+        similarity = func.greatest(*(func.similarity(field, term) for field in fields))
+        query = query.where(or_(prefix, similar)).order_by(case((prefix, 0), else_=1), similarity.desc(), users.email)
+    else:
+        query = query.where(prefix).order_by(users.email)
+    result = await session.execute(query.limit(limit))
+    return [schemas.UserSearchResult.model_validate(row) for row in result.all()]
 
 async def update_users_management(session: AsyncSession, user_id: int, user_in: schemas.UsersManagementUpdate) -> Optional[models.UsersManagement]:
-    """Update a user in users_management table"""
-    user = await get_users_management_by_id(session, user_id)
+    """Update a user in users_management table and its user_profile"""
+    user, _ = await _update_account(session, user_id, _changes(user_in))
     if not user:
         return None
-    
-    if user_in.first_name is not None:
-        user.first_name = user_in.first_name
-    if user_in.last_name is not None:
-        user.last_name = user_in.last_name
-    if user_in.email is not None:
-        user.email = user_in.email
-    if user_in.role is not None:
-        user.role = user_in.role
-    if user_in.department is not None:
-        user.department = user_in.department
-    if user_in.tickets_issued is not None:
-        user.tickets_issued = user_in.tickets_issued
-    if user_in.tickets_resolved is not None:
-        user.tickets_resolved = user_in.tickets_resolved
-    if user_in.active is not None:
-        user.active = user_in.active
-    if user_in.language is not None:
-        user.language = user_in.language
-    if user_in.mobile_number is not None:
-        user.mobile_number = user_in.mobile_number
-    if user_in.date_format is not None:
-        user.date_format = user_in.date_format
-    if user_in.password_reset_needed is not None:
-        user.password_reset_needed = user_in.password_reset_needed
-    if user_in.profile_file_name is not None:
-        user.profile_file_name = user_in.profile_file_name
-    if user_in.profile_file_size is not None:
-        user.profile_file_size = user_in.profile_file_size
-    
+    _invalidate_users(session)
     await session.commit()
-    await session.refresh(user)
     return user
 
 async def delete_users_management(session: AsyncSession, user_id: int) -> bool:
-    """Delete a user from users_management table"""
-    user = await get_users_management_by_id(session, user_id)
-    if not user:
-        return False
-    await session.delete(user)
-    await session.commit()
-    return True
+    """Delete a user from users_management, user_profile and users"""
+    return await delete_user_account(session, user_id)
 
 # ==================== UserProfile CRUD ====================
 
-async def create_user_profile(session: AsyncSession, profile_in: schemas.UserProfileCreate) -> models.UserProfile:
-    """Create a new user profile"""
-    profile = models.UserProfile(
-        full_name=profile_in.full_name,
-        email=profile_in.email,
-        mobile_number=profile_in.mobile_number,
-        role=profile_in.role,
-        department=profile_in.department,
-        date_of_birth=profile_in.date_of_birth,
-        user_status=profile_in.user_status
+def _profile_owner(user_id: int):
+    """users_management id of a profile, as a subquery"""
+    return (
+        select(models.UserProfile.users_management_id)
+        .where(models.UserProfile.user_id == user_id)
+        .scalar_subquery()
     )
-    session.add(profile)
-    await session.commit()
-    await session.refresh(profile)
+
+async def create_user_profile(session: AsyncSession, profile_in: schemas.UserProfileCreate) -> models.UserProfile:
+    """Create a new user profile, with its users_management row"""
+    user_in = schemas.UsersManagementCreate(**_management_values(profile_in.dict()))
+    _, profile = await create_user_account(session, user_in, date_of_birth=profile_in.date_of_birth)
     return profile
 
 async def get_user_profile_by_id(session: AsyncSession, user_id: int) -> Optional[models.UserProfile]:
@@ -827,51 +1288,41 @@ async def get_user_profile_by_id(session: AsyncSession, user_id: int) -> Optiona
     )
     return result.scalar_one_or_none()
 
-async def get_user_profile_by_email(session: AsyncSession, email: str) -> Optional[models.UserProfile]:
-    """Get a user profile by email"""
-    result = await session.execute(
-        select(models.UserProfile).where(models.UserProfile.email == email)
-    )
-    return result.scalar_one_or_none()
+async def get_user_profile_by_email(session: AsyncSession, email: str) -> Optional[schemas.UserProfileOut]:
+    """Get a user profile by email (cached)"""
+    async def load():
+        result = await session.execute(
+            select(models.UserProfile).where(models.UserProfile.email == email)
+        )
+        profile = result.scalar_one_or_none()
+        return schemas.UserProfileOut.model_validate(profile) if profile else None
 
-async def list_user_profiles(session: AsyncSession) -> List[models.UserProfile]:
-    """List all user profiles"""
-    result = await session.execute(select(models.UserProfile))
-    return list(result.scalars().all())
+    return await _profiles_by_email.get_or_load(email, load)
+
+async def list_user_profiles(session: AsyncSession) -> List[schemas.UserProfileOut]:
+    """List all user profiles (cached)"""
+    async def load():
+        result = await session.execute(select(models.UserProfile))
+        return [schemas.UserProfileOut.model_validate(profile) for profile in result.scalars().all()]
+
+    return await _user_directory.get_or_load("user_profile", load)
 
 async def update_user_profile(session: AsyncSession, user_id: int, profile_in: schemas.UserProfileUpdate) -> Optional[models.UserProfile]:
-    """Update a user profile"""
-    profile = await get_user_profile_by_id(session, user_id)
-    if not profile:
+    """Update a user profile through its users_management row"""
+    changes = _changes(profile_in)
+    own = {"date_of_birth": changes["date_of_birth"]} if "date_of_birth" in changes else None
+    user, profile = await _update_account(session, _profile_owner(user_id), _management_values(changes), own)
+    if not user:
         return None
-    
-    if profile_in.full_name is not None:
-        profile.full_name = profile_in.full_name
-    if profile_in.email is not None:
-        profile.email = profile_in.email
-    if profile_in.mobile_number is not None:
-        profile.mobile_number = profile_in.mobile_number
-    if profile_in.role is not None:
-        profile.role = profile_in.role
-    if profile_in.department is not None:
-        profile.department = profile_in.department
-    if profile_in.date_of_birth is not None:
-        profile.date_of_birth = profile_in.date_of_birth
-    if profile_in.user_status is not None:
-        profile.user_status = profile_in.user_status
-    
+    if profile is None:
+        profile = await get_user_profile_by_id(session, user_id)
+    _invalidate_users(session)
     await session.commit()
-    await session.refresh(profile)
     return profile
 
 async def delete_user_profile(session: AsyncSession, user_id: int) -> bool:
-    """Delete a user profile"""
-    profile = await get_user_profile_by_id(session, user_id)
-    if not profile:
-        return False
-    await session.delete(profile)
-    await session.commit()
-    return True
+    """Delete a user profile together with its users_management row and login"""
+    return await delete_user_account(session, _profile_owner(user_id))
 
 # ==================== AdminEpic CRUD ====================
 
@@ -886,7 +1337,6 @@ async def create_admin_epic(session: AsyncSession, admin_epic_in: schemas.AdminE
     )
     session.add(admin_epic)
     await session.commit()
-    await session.refresh(admin_epic)
     return admin_epic
 
 async def get_admin_epic(session: AsyncSession, admin_epic_id: int) -> Optional[models.AdminEpic]:
@@ -903,31 +1353,24 @@ async def get_admin_epic_by_epic_id(session: AsyncSession, epic_id: int) -> Opti
     )
     return result.scalar_one_or_none()
 
-async def list_admin_epics(session: AsyncSession, project_id: Optional[int] = None) -> List[models.AdminEpic]:
-    """List all admin epics, optionally filtered by project"""
+async def list_admin_epics(session: AsyncSession, project_id: Optional[int] = None, updated_since: Optional[datetime] = None) -> List[models.AdminEpic]:
+    """List all admin epics, optionally filtered by project and last change"""
     query = select(models.AdminEpic)
     if project_id is not None:
         query = query.where(models.AdminEpic.project_id == project_id)
+    if updated_since is not None:
+        query = query.where(models.AdminEpic.updated_at >= updated_since)
     result = await session.execute(query)
     return list(result.scalars().all())
 
 async def update_admin_epic(session: AsyncSession, admin_epic_id: int, admin_epic_in: schemas.AdminEpicUpdate) -> Optional[models.AdminEpic]:
     """Update an admin epic"""
-    admin_epic = await get_admin_epic(session, admin_epic_id)
+    admin_epic = await _update_returning(
+        session, models.AdminEpic, models.AdminEpic.admin_epic_id, admin_epic_id, _changes(admin_epic_in)
+    )
     if not admin_epic:
         return None
-    
-    if admin_epic_in.project_id is not None:
-        admin_epic.project_id = admin_epic_in.project_id
-    if admin_epic_in.project_title is not None:
-        admin_epic.project_title = admin_epic_in.project_title
-    if admin_epic_in.user_name is not None:
-        admin_epic.user_name = admin_epic_in.user_name
-    if admin_epic_in.name is not None:
-        admin_epic.name = admin_epic_in.name
-    
     await session.commit()
-    await session.refresh(admin_epic)
     return admin_epic
 
 async def delete_admin_epic(session: AsyncSession, admin_epic_id: int) -> bool:
@@ -936,6 +1379,7 @@ async def delete_admin_epic(session: AsyncSession, admin_epic_id: int) -> bool:
     if not admin_epic:
         return False
     await session.delete(admin_epic)
+    await _record_deletes(session, [("admin_epics", admin_epic_id)], admin_epic.project_id)
     await session.commit()
     return True
 
@@ -959,8 +1403,9 @@ async def create_admin_ticket(session: AsyncSession, admin_ticket_in: schemas.Ad
         due_date=admin_ticket_in.due_date
     )
     session.add(admin_ticket)
+    await session.flush()
+    await rollups.apply(session, {rollups.key_of(admin_ticket): 1})
     await session.commit()
-    await session.refresh(admin_ticket)
     return admin_ticket
 
 async def get_admin_ticket(session: AsyncSession, admin_ticket_id: int) -> Optional[models.AdminTicket]:
@@ -977,56 +1422,211 @@ async def get_admin_ticket_by_ticket_id(session: AsyncSession, ticket_id: int) -
     )
     return result.scalar_one_or_none()
 
-async def list_admin_tickets(session: AsyncSession, project_id: Optional[int] = None, epic_id: Optional[int] = None) -> List[models.AdminTicket]:
-    """List all admin tickets, optionally filtered by project or epic"""
-    query = select(models.AdminTicket)
+async def list_admin_tickets(session: AsyncSession, project_id: Optional[int] = None, epic_id: Optional[int] = None, updated_since: Optional[datetime] = None, fields: Optional[Sequence[str]] = None) -> List[models.AdminTicket]:
+    """List all admin tickets, optionally filtered by project, epic or last change, and only the ``fields`` columns"""
+    query = _select_fields(models.AdminTicket, fields)
     if project_id is not None:
         query = query.where(models.AdminTicket.project_id == project_id)
     if epic_id is not None:
         query = query.where(models.AdminTicket.epic_id == epic_id)
-    result = await session.execute(query)
-    return list(result.scalars().all())
+    if updated_since is not None:
+        query = query.where(models.AdminTicket.updated_at >= updated_since)
+    query = query.order_by(models.AdminTicket.rank, models.AdminTicket.admin_ticket_id)
+    return await _fetch(session, query, fields)
+
+async def search_admin_tickets(session: AsyncSession, q: str, limit: int, cursor: Optional[str] = None, project_id: Optional[int] = None, status: Optional[str] = None, assignee: Optional[str] = None) -> Tuple[List[models.AdminTicket], Optional[str]]:
+    """Full-text search over admin ticket titles and descriptions, best match first"""
+    query = select(models.AdminTicket)
+    if project_id is not None:
+        query = query.where(models.AdminTicket.project_id == project_id)
+    if status:
+        query = query.where(models.AdminTicket.status == status)
+    if assignee:
+        query = query.where(models.AdminTicket.assignee == assignee)
+    return await _search_ticket_rows(
+        session, models.AdminTicket, models.AdminTicket.admin_ticket_id, q, query, limit, cursor
+    )
 
 async def update_admin_ticket(session: AsyncSession, admin_ticket_id: int, admin_ticket_in: schemas.AdminTicketUpdate) -> Optional[models.AdminTicket]:
     """Update an admin ticket"""
-    admin_ticket = await get_admin_ticket(session, admin_ticket_id)
+    values = _changes(admin_ticket_in)
+    old_key = None
+    if any(name in values for name in rollups.KEY_FIELDS):
+        # Only a re-keyed ticket moves between rollup rows
+        res = await session.execute(
+            select(models.AdminTicket.project_id, models.AdminTicket.status, models.AdminTicket.priority, models.AdminTicket.assignee)
+            .where(models.AdminTicket.admin_ticket_id == admin_ticket_id)
+            .with_for_update()
+        )
+        old = res.one_or_none()
+        if old is None:
+            return None
+        old_key = rollups.key_of(old)
+    admin_ticket = await _update_returning(
+        session, models.AdminTicket, models.AdminTicket.admin_ticket_id, admin_ticket_id, values
+    )
     if not admin_ticket:
         return None
-    
-    if admin_ticket_in.epic_id is not None:
-        admin_ticket.epic_id = admin_ticket_in.epic_id
-    if admin_ticket_in.project_id is not None:
-        admin_ticket.project_id = admin_ticket_in.project_id
-    if admin_ticket_in.project_title is not None:
-        admin_ticket.project_title = admin_ticket_in.project_title
-    if admin_ticket_in.user_name is not None:
-        admin_ticket.user_name = admin_ticket_in.user_name
-    if admin_ticket_in.title is not None:
-        admin_ticket.title = admin_ticket_in.title
-    if admin_ticket_in.description is not None:
-        admin_ticket.description = admin_ticket_in.description
-    if admin_ticket_in.status is not None:
-        admin_ticket.status = admin_ticket_in.status
-    if admin_ticket_in.priority is not None:
-        admin_ticket.priority = admin_ticket_in.priority
-    if admin_ticket_in.assignee is not None:
-        admin_ticket.assignee = admin_ticket_in.assignee
-    if admin_ticket_in.reporter is not None:
-        admin_ticket.reporter = admin_ticket_in.reporter
-    if admin_ticket_in.start_date is not None:
-        admin_ticket.start_date = admin_ticket_in.start_date
-    if admin_ticket_in.due_date is not None:
-        admin_ticket.due_date = admin_ticket_in.due_date
-    
+    if old_key is not None:
+        deltas: Dict[rollups.RollupKey, int] = {}
+        rollups.move(deltas, old_key, rollups.key_of(admin_ticket))
+        await rollups.apply(session, deltas)
     await session.commit()
-    await session.refresh(admin_ticket)
     return admin_ticket
 
+# Fields shared by tickets and admin_tickets, synced back to tickets on admin edits
+TICKET_SYNC_FIELDS = ("title", "description", "status", "priority", "assignee", "reporter", "start_date", "due_date")
+
+async def _executemany_by_key(session: AsyncSession, table, key_column, rows: List[dict]) -> None:
+    """UPDATE ``table`` once per distinct column set, executemany-style, keyed on ``key_column``"""
+    groups: Dict[Tuple[str, ...], List[dict]] = {}
+    for row in rows:
+        columns = tuple(sorted(k for k in row if k != "_key"))
+        if columns:
+            groups.setdefault(columns, []).append(row)
+    for columns, group in groups.items():
+        stmt = (
+            table.update()
+            .where(key_column == bindparam("_key"))
+            .values({name: bindparam(f"v_{name}") for name in columns})
+        )
+        params = [{"_key": row["_key"], **{f"v_{name}": row[name] for name in columns}} for row in group]
+        await session.execute(stmt, params)
+
+async def batch_update_admin_tickets(session: AsyncSession, items: List[schemas.AdminTicketBatchItem]) -> List[schemas.AdminTicketBatchResult]:
+    """Apply many admin ticket updates, and sync their tickets rows, in one transaction.
+
+    Rows are loaded with one SELECT per table, written with executemany
+    UPDATEs grouped by the set of changed columns, and counter deltas for
+    all tickets are applied together. Unknown ids are reported per item
+    without failing the rest of the batch.
+    """
+    # Merge repeated ids so the last write for each field wins
+    changes: Dict[int, dict] = {}
+    for item in items:
+        changes.setdefault(item.admin_ticket_id, {}).update(item.fields.dict(exclude_none=True))
+
+    admin_tickets = {}
+    if changes:
+        res = await session.execute(
+            select(models.AdminTicket).where(models.AdminTicket.admin_ticket_id.in_(changes.keys()))
+            # Locked: the rollup deltas are computed from these values
+            .with_for_update()
+        )
+        admin_tickets = {row.admin_ticket_id: row for row in res.scalars().all()}
+    ticket_ids = [row.ticket_id for row in admin_tickets.values() if row.ticket_id]
+    tickets = {}
+    if ticket_ids:
+        res = await session.execute(
+            select(models.Ticket).where(models.Ticket.id.in_(ticket_ids))
+            # Locked like in _update_ticket_values: the counter deltas are computed from these values
+            .with_for_update()
+        )
+        tickets = {row.id: row for row in res.scalars().all()}
+
+    admin_rows, ticket_rows = [], []
+    deltas: Dict[str, List[int]] = {}
+    rollup_deltas: Dict[rollups.RollupKey, int] = {}
+    for admin_ticket_id, fields in changes.items():
+        admin_ticket = admin_tickets.get(admin_ticket_id)
+        if admin_ticket is None:
+            continue
+        admin_rows.append({"_key": admin_ticket_id, **fields})
+        rollups.move(
+            rollup_deltas,
+            rollups.key_of(admin_ticket),
+            rollups.key(*(fields.get(name, getattr(admin_ticket, name)) for name in rollups.KEY_FIELDS)),
+        )
+        ticket = tickets.get(admin_ticket.ticket_id)
+        ticket_fields = {k: v for k, v in fields.items() if k in TICKET_SYNC_FIELDS}
+        if ticket is not None and ticket_fields:
+            ticket_rows.append({"_key": ticket.id, **ticket_fields})
+            _add_counter_delta(deltas, ticket.assignee, ticket.status, -1)
+            _add_counter_delta(deltas, ticket_fields.get("assignee", ticket.assignee), ticket_fields.get("status", ticket.status), +1)
+
+    await _executemany_by_key(session, models.AdminTicket.__table__, models.AdminTicket.__table__.c.admin_ticket_id, admin_rows)
+    await _executemany_by_key(session, models.Ticket.__table__, models.Ticket.__table__.c.id, ticket_rows)
+    await _apply_counter_deltas(session, deltas)
+    await rollups.apply(session, rollup_deltas)
+    await session.commit()
+
+    updated = {}
+    if admin_tickets:
+        res = await session.execute(
+            select(models.AdminTicket)
+            .where(models.AdminTicket.admin_ticket_id.in_(admin_tickets.keys()))
+            .execution_options(populate_existing=True)
+        )
+        updated = {row.admin_ticket_id: row for row in res.scalars().all()}
+
+    synced = {}
+    if ticket_rows:
+        res = await session.execute(
+            select(models.Ticket)
+            .where(models.Ticket.id.in_([row["_key"] for row in ticket_rows]))
+            .execution_options(populate_existing=True)
+        )
+        synced = {row.id: row for row in res.scalars().all()}
+
+    for row in updated.values():
+        await events.publish("admin_ticket.updated", row.admin_ticket_id, row.project_id, schemas.AdminTicketOut.model_validate(row).model_dump(mode="json"))
+        ticket = synced.get(row.ticket_id)
+        if ticket is not None:
+            await _publish_ticket("ticket.updated", ticket, row.project_id)
+
+    results = []
+    for admin_ticket_id in changes:
+        row = updated.get(admin_ticket_id)
+        if row is None:
+            results.append(schemas.AdminTicketBatchResult(admin_ticket_id=admin_ticket_id, ok=False, detail="Admin ticket not found"))
+        else:
+            results.append(schemas.AdminTicketBatchResult(admin_ticket_id=admin_ticket_id, ok=True, ticket=schemas.AdminTicketOut.model_validate(row)))
+    return results
+
 async def delete_admin_ticket(session: AsyncSession, admin_ticket_id: int) -> bool:
     """Delete an admin ticket"""
     admin_ticket = await get_admin_ticket(session, admin_ticket_id)
     if not admin_ticket:
         return False
     await session.delete(admin_ticket)
+    await _record_deletes(session, [("admin_tickets", admin_ticket_id)], admin_ticket.project_id)
+    await rollups.apply(session, {rollups.key_of(admin_ticket): -1})
     await session.commit()
-    return True
\ No newline at end of file
+    return True
+
+# ==================== Delta sync ====================
+
+TOMBSTONE_ENTITIES = ("tickets", "epics", "projects", "admin_tickets", "admin_epics")
+
+async def _record_deletes(session: AsyncSession, deleted: List[Tuple[str, int]], project_id: Optional[int] = None) -> None:
+    """Write tombstones for (entity, id) pairs in the caller's transaction, as one INSERT"""
+    if not deleted:
+        return
+    await session.execute(
+        insert(models.Tombstone),
+        [{"entity": entity, "entity_id": entity_id, "project_id": project_id} for entity, entity_id in deleted],
+    )
+
+async def list_tombstones(session: AsyncSession, entity: str, since: datetime, project_id: Optional[int] = None) -> List[models.Tombstone]:
+    """Rows of ``entity`` deleted at or after ``since``"""
+    q = select(models.Tombstone).where(
+        models.Tombstone.entity == entity,
+        models.Tombstone.deleted_at >= since,
+    )
+    if project_id is not None:
+        q = q.where(models.Tombstone.project_id == project_id)
+    q = q.order_by(models.Tombstone.deleted_at, models.Tombstone.id)
+    res = await session.execute(q)
+    return res.scalars().all()
+
+async def sync_timestamp(session: AsyncSession) -> datetime:
+    """Value a client should send as its next ``updated_since``.
+
+    Taken from the database clock, which is what fills ``updated_at``, and
+    moved back by ``sync_overlap_seconds`` so writes committed after a list
+    was read (but stamped before it) are not missed.
+    """
+    now = (await session.execute(select(func.now()))).scalar()
+    # updated_at is a naive TIMESTAMP holding the session's wall-clock time
+    now = now.replace(tzinfo=None)
+    return now - timedelta(seconds=settings.sync_overlap_seconds)
@@ -26,6 +26,8 @@
 # async def get_session() -> AsyncSession:
 #     async with async_session_maker() as session:
 #         yield session
+import asyncio
+from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine, AsyncSession
 from sqlalchemy.orm import sessionmaker, declarative_base
 from .config import settings
@@ -33,12 +35,30 @@ from .config import settings
 # Database URL from your settings
 DATABASE_URL = settings.database_url
 
+def _engine_options(url: str) -> dict:
+    """Engine keyword arguments for the configured pool profile"""
+    options = {
+        "echo": settings.db_echo,
+        "future": True,
+        "pool_pre_ping": settings.db_pool_pre_ping,
+    }
+    if url.startswith("sqlite"):
+        # SQLite (local dev / tests) keeps SQLAlchemy's default pool
+        return options
+    options.update(
+        pool_size=settings.db_pool_size,
+        max_overflow=settings.db_max_overflow,
+        pool_timeout=settings.db_pool_timeout,
+        pool_recycle=settings.db_pool_recycle,
+    )
+    if url.startswith("postgresql+asyncpg") and settings.db_statement_timeout_ms:
+        options["connect_args"] = {
+            "server_settings": {"statement_timeout": str(settings.db_statement_timeout_ms)}
+        }
+    return options
+
 # Async engine
-engine: AsyncEngine = create_async_engine(
-    DATABASE_URL,
-    echo=True,  # This will show all SQL queries in console
-    future=True,
-)
+engine: AsyncEngine = create_async_engine(DATABASE_URL, **_engine_options(DATABASE_URL))
 
 # Async session factory
 async_session_maker = sessionmaker(
@@ -47,8 +67,13 @@ async_session_maker = sessionmaker(
     class_=AsyncSession,
 )
 
+class _ModelDefaults:
+    # Fetch server-generated columns (ids, created_at, updated_at) through
+    # RETURNING on the INSERT/UPDATE itself instead of a follow-up SELECT
+    __mapper_args__ = {"eager_defaults": True}
+
 # Base class for models
-Base = declarative_base()
+Base = declarative_base(cls=_ModelDefaults)
 
 # Dependency helper for FastAPI endpoints
 async def get_session() -> AsyncSession:
@@ -56,4 +81,32 @@ async def get_session() -> AsyncSession:
         try:
             yield session
         finally:
-            await session.close()
\ No newline at end of file
+            await session.close()
+
+async def warm_up_pool(connections: int = None) -> int:
+    """Open ``connections`` pooled connections concurrently so the first requests don't pay for connect"""
+    connections = settings.db_pool_warmup if connections is None else connections
+    if connections <= 0:
+        return 0
+
+    async def _ping():
+        async with engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+
+    await asyncio.gather(*(_ping() for _ in range(connections)))
+    return connections
+
+def pool_status() -> dict:
+    """Checked-out / idle connection counts for the engine's pool"""
+    pool = engine.pool
+    status = {"pool_class": type(pool).__name__}
+    for key, attr in (
+        ("size", "size"),
+        ("checked_out", "checkedout"),
+        ("idle", "checkedin"),
+        ("overflow", "overflow"),
+    ):
+        if hasattr(pool, attr):
+            status[key] = getattr(pool, attr)()
+    status["max_overflow"] = settings.db_max_overflow
+    return status
@@ -0,0 +1,198 @@
+"""Change feed for live board updates.
+
+Crud write paths call ``publish`` after they commit; subscribers (the SSE
+endpoint in ``app.main``) receive ticket, epic and asset create/update/delete
+events, optionally filtered to one project, and apply them as deltas instead
+of re-fetching whole boards.
+
+Two brokers are available via ``EVENT_BROKER``:
+
+* ``memory`` fans events out to subscribers of the same process only.
+* ``postgres`` sends every event through ``pg_notify`` and LISTENs on the
+  same channel, so subscribers on any API worker see writes made by any
+  other worker. NOTIFY payloads must stay under 8000 bytes, so an event
+  whose row is larger (a long description) is sent without ``data`` and
+  with ``"truncated": true``; clients re-fetch that row. A dropped LISTEN
+  connection is reopened in the background.
+"""
+from datetime import datetime
+from typing import Dict, Optional
+import asyncio
+import itertools
+import json
+import logging
+
+from .config import settings
+
+logger = logging.getLogger(__name__)
+
+
+class Subscription:
+    """A subscriber's bounded event queue; slow consumers lose their oldest events"""
+
+    def __init__(self, project_id: Optional[int], queue_size: int):
+        self.key: Optional[int] = None
+        self.project_id = project_id
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=queue_size)
+
+    def matches(self, event: dict) -> bool:
+        return self.project_id is None or event.get("project_id") == self.project_id
+
+    def offer(self, event: dict) -> None:
+        if self.queue.full():
+            self.queue.get_nowait()
+        self.queue.put_nowait(event)
+
+
+class InProcessBroker:
+    """Delivers events to subscribers in this process"""
+
+    def __init__(self, queue_size: int):
+        self._queue_size = queue_size
+        self._ids = itertools.count()
+        self._subscribers: Dict[int, Subscription] = {}
+
+    async def start(self) -> None:
+        pass
+
+    async def stop(self) -> None:
+        pass
+
+    def subscribe(self, project_id: Optional[int] = None) -> Subscription:
+        subscription = Subscription(project_id, self._queue_size)
+        subscription.key = next(self._ids)
+        self._subscribers[subscription.key] = subscription
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        self._subscribers.pop(subscription.key, None)
+
+    @property
+    def subscriber_count(self) -> int:
+        return len(self._subscribers)
+
+    def _fan_out(self, event: dict) -> None:
+        for subscription in list(self._subscribers.values()):
+            if subscription.matches(event):
+                subscription.offer(event)
+
+    async def publish(self, event: dict) -> None:
+        self._fan_out(event)
+
+
+class PostgresBroker(InProcessBroker):
+    """Shares events between workers with PostgreSQL LISTEN/NOTIFY"""
+
+    # PostgreSQL rejects NOTIFY payloads of 8000 bytes or more
+    MAX_PAYLOAD_BYTES = 7900
+    RECONNECT_DELAYS = (1, 2, 5, 10, 30)  # seconds; the last one repeats
+
+    def __init__(self, queue_size: int, dsn: str, channel: str):
+        super().__init__(queue_size)
+        # asyncpg wants a plain postgresql:// DSN
+        self._dsn = dsn.replace("postgresql+asyncpg://", "postgresql://", 1)
+        self._channel = channel
+        self._conn = None
+        self._lock = asyncio.Lock()
+        self._stopping = False
+        self._reconnect_task: Optional[asyncio.Task] = None
+
+    async def _connect(self) -> None:
+        import asyncpg
+
+        conn = await asyncpg.connect(self._dsn)
+        await conn.add_listener(self._channel, self._on_notify)
+        conn.add_termination_listener(self._on_terminated)
+        self._conn = conn
+
+    async def start(self) -> None:
+        self._stopping = False
+        await self._connect()
+
+    async def stop(self) -> None:
+        self._stopping = True
+        if self._reconnect_task is not None:
+            self._reconnect_task.cancel()
+            self._reconnect_task = None
+        if self._conn is not None:
+            await self._conn.close()
+            self._conn = None
+
+    def _on_terminated(self, connection) -> None:
+        if connection is self._conn:
+            self._conn = None
+        self._reconnect_soon()
+
+    def _reconnect_soon(self) -> None:
+        if self._stopping or (self._reconnect_task is not None and not self._reconnect_task.done()):
+            return
+        logger.warning("Event broker lost its PostgreSQL connection; reconnecting")
+        self._reconnect_task = asyncio.create_task(self._reconnect())
+
+    async def _reconnect(self) -> None:
+        for attempt in itertools.count():
+            if self._stopping:
+                return
+            try:
+                await self._connect()
+                logger.info("Event broker reconnected")
+                return
+            except Exception as e:
+                delay = self.RECONNECT_DELAYS[min(attempt, len(self.RECONNECT_DELAYS) - 1)]
+                logger.error(f"Event broker reconnect failed, retrying in {delay}s: {e}")
+                await asyncio.sleep(delay)
+
+    def _on_notify(self, connection, pid, channel, payload) -> None:
+        try:
+            self._fan_out(json.loads(payload))
+        except Exception as e:
+            logger.error(f"Dropping malformed event notification: {e}")
+
+    def _payload(self, event: dict) -> str:
+        payload = json.dumps(event, default=str)
+        if len(payload.encode("utf-8")) < self.MAX_PAYLOAD_BYTES:
+            return payload
+        return json.dumps({**event, "data": None, "truncated": True}, default=str)
+
+    async def publish(self, event: dict) -> None:
+        conn = self._conn
+        if conn is None or conn.is_closed():
+            # Other workers miss this event until the connection is back
+            self._conn = None
+            self._reconnect_soon()
+            self._fan_out(event)
+            return
+        # One connection both listens and notifies, so our own events come back via _on_notify
+        try:
+            async with self._lock:
+                await conn.execute("SELECT pg_notify($1, $2)", self._channel, self._payload(event))
+        except Exception:
+            if conn.is_closed():
+                self._on_terminated(conn)
+                self._fan_out(event)
+                return
+            raise
+
+
+def _make_broker() -> InProcessBroker:
+    if settings.event_broker == "postgres":
+        return PostgresBroker(settings.event_queue_size, settings.database_url, settings.event_channel)
+    return InProcessBroker(settings.event_queue_size)
+
+
+broker = _make_broker()
+
+
+async def publish(event_type: str, entity_id: int, project_id: Optional[int] = None, data: Optional[dict] = None) -> None:
+    """Publish a change event; failures are logged and never fail the write that triggered them"""
+    event = {
+        "type": event_type,
+        "id": entity_id,
+        "project_id": project_id,
+        "data": data,
+        "ts": datetime.utcnow().isoformat(),
+    }
+    try:
+        await broker.publish(event)
+    except Exception as e:
+        logger.error(f"Failed to publish {event_type} event for {entity_id}: {e}")
@@ -0,0 +1,45 @@
+"""Sparse fieldsets: ``?fields=id,title,status`` on the list routes.
+
+``parse`` turns the query parameter into the requested field names of an
+output schema (in the schema's order, always including its key field).
+crud selects only those columns, and ``render`` serializes the rows through
+a slim copy of the schema straight to JSON bytes, skipping the full
+response model.
+"""
+from functools import lru_cache
+from typing import Iterable, List, Optional, Tuple, Type
+
+from fastapi import Response
+from pydantic import BaseModel, ConfigDict, TypeAdapter, create_model
+
+FIELDS_DESCRIPTION = "Comma-separated fields to return (default: all), e.g. id,title,status,priority,assignee"
+
+
+def parse(fields: Optional[str], schema: Type[BaseModel], key: str) -> Optional[Tuple[str, ...]]:
+    """Requested field names of ``schema``, or None for all; raises ValueError on unknown names"""
+    if fields is None:
+        return None
+    requested = {name.strip() for name in fields.split(",") if name.strip()}
+    unknown = requested - set(schema.model_fields)
+    if unknown:
+        raise ValueError(f"Unknown fields: {', '.join(sorted(unknown))}")
+    requested.add(key)
+    return tuple(name for name in schema.model_fields if name in requested)
+
+
+@lru_cache(maxsize=256)
+def _adapter(schema: Type[BaseModel], names: Tuple[str, ...]) -> TypeAdapter:
+    slim = create_model(
+        f"{schema.__name__}Fields",
+        __config__=ConfigDict(from_attributes=True),
+        **{name: (schema.model_fields[name].annotation, schema.model_fields[name]) for name in names},
+    )
+    return TypeAdapter(List[slim])
+
+
+def render(schema: Type[BaseModel], names: Tuple[str, ...], rows: Iterable, response: Response) -> Response:
+    """JSON list of ``rows`` with only ``names``, carrying the headers already set on ``response``"""
+    adapter = _adapter(schema, names)
+    body = adapter.dump_json(adapter.validate_python(list(rows), from_attributes=True))
+    headers = {k: v for k, v in response.headers.items() if k != "content-length"}
+    return Response(content=body, media_type="application/json", headers=headers)
@@ -79,15 +79,22 @@
 #         raise HTTPException(status_code=404, detail="Asset not found")
 #     return None
 
-from fastapi import FastAPI, Depends, HTTPException, status, Request
+from fastapi import FastAPI, Depends, HTTPException, status, Request, Response, Query
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, StreamingResponse
 from fastapi.exceptions import RequestValidationError
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import text
+from sqlalchemy.exc import IntegrityError
 from typing import List, Optional
+from datetime import date, datetime
+import asyncio
+import json
 import logging
+import time
 
-from . import models, schemas, crud, database
+from . import models, schemas, crud, database, outbox, security, export, events, metrics, cache, rollups, fieldsets, migrations, ranking, rebalancer, overdue
+from .config import settings
 
 # Logging
 logging.basicConfig(level=logging.INFO)
@@ -102,8 +109,14 @@ app.add_middleware(
     allow_credentials=False,  # Set to False when using allow_origins=["*"]
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Next-Cursor", "X-Sync-Timestamp"],  # Lets browsers read pagination/sync headers
 )
 
+# Per-route latency, status and DB work, exposed at /metrics
+if settings.metrics_enabled:
+    app.add_middleware(metrics.MetricsMiddleware)
+    metrics.instrument_engine(database.engine)
+
 # Add validation error handler
 @app.exception_handler(RequestValidationError)
 async def validation_exception_handler(request: Request, exc: RequestValidationError):
@@ -115,21 +128,74 @@ async def validation_exception_handler(request: Request, exc: RequestValidationE
         content={"detail": exc.errors()}
     )
 
-# Create tables on startup
+# Schema check and background workers on startup
 @app.on_event("startup")
 async def startup():
     try:
-        async with database.engine.begin() as conn:
-            await conn.run_sync(models.Base.metadata.create_all)
-        logger.info("✅ Database tables created successfully")
+        warmed = await database.warm_up_pool()
+        logger.info(f"Warmed up {warmed} database connections")
     except Exception as e:
-        logger.error(f"❌ Error creating tables: {e}")
+        logger.error(f"❌ Error warming up connection pool: {e}")
+    if settings.db_boot_mode == "check":
+        # One query; a mismatch stops the worker instead of serving a drifted schema
+        revision = await migrations.check(database.engine)
+        logger.info(f"Database schema at revision {revision}")
+    elif settings.db_boot_mode == "create_all":
+        try:
+            async with database.engine.begin() as conn:
+                await conn.run_sync(models.Base.metadata.create_all)
+            logger.info("✅ Database tables created successfully")
+        except Exception as e:
+            logger.error(f"❌ Error creating tables: {e}")
+    
+    # Background worker that applies admin_* mirror writes from the outbox
+    if settings.outbox_enabled:
+        app.state.outbox_task = asyncio.create_task(outbox.run_worker())
+    if settings.rank_rebalance_enabled:
+        app.state.rebalancer_task = asyncio.create_task(rebalancer.run_worker())
+    if settings.overdue_scan_enabled:
+        app.state.overdue_task = asyncio.create_task(overdue.run_worker())
+    
+    try:
+        await events.broker.start()
+    except Exception as e:
+        logger.error(f"❌ Error starting event broker: {e}")
+
+@app.on_event("shutdown")
+async def shutdown():
+    task = getattr(app.state, "outbox_task", None)
+    if task:
+        outbox.stop()
+        try:
+            await asyncio.wait_for(task, timeout=5)
+        except (asyncio.TimeoutError, asyncio.CancelledError):
+            pass
+    task = getattr(app.state, "rebalancer_task", None)
+    if task:
+        rebalancer.stop()
+        try:
+            await asyncio.wait_for(task, timeout=5)
+        except (asyncio.TimeoutError, asyncio.CancelledError):
+            pass
+    task = getattr(app.state, "overdue_task", None)
+    if task:
+        overdue.stop()
+        try:
+            await asyncio.wait_for(task, timeout=5)
+        except (asyncio.TimeoutError, asyncio.CancelledError):
+            pass
+    await events.broker.stop()
+    await database.engine.dispose()
 
 # Unified DB session dependency
 async def get_db() -> AsyncSession:
     async with database.async_session_maker() as session:
         yield session
 
+async def _stamp_sync(response: Response, db: AsyncSession) -> None:
+    """Tell delta-sync clients what to send as ``updated_since`` on their next poll"""
+    response.headers["X-Sync-Timestamp"] = (await crud.sync_timestamp(db)).isoformat()
+
 # --- Routes ---
 
 @app.get("/")
@@ -140,6 +206,96 @@ async def root():
 async def health_check():
     return {"status": "healthy", "service": "Flow Track API"}
 
+@app.get("/metrics")
+async def read_metrics():
+    """Request metrics in Prometheus text format"""
+    return Response(metrics.render(), media_type="text/plain; version=0.0.4; charset=utf-8")
+
+@app.get("/health/db")
+async def database_health():
+    """Database round-trip latency and connection pool usage, for sizing pools per node"""
+    pool = database.pool_status()
+    try:
+        start = time.perf_counter()
+        async with database.engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+        latency_ms = round((time.perf_counter() - start) * 1000, 2)
+    except Exception as e:
+        logger.error(f"Database health check failed: {e}")
+        return JSONResponse(status_code=503, content={"status": "unhealthy", "error": str(e), "pool": pool})
+    return {"status": "healthy", "latency_ms": latency_ms, "pool": pool}
+
+@app.get("/health/password-hashing")
+async def password_hashing_health():
+    """Queue depth and latency of the bcrypt thread pool"""
+    return security.stats()
+
+@app.get("/health/outbox")
+async def outbox_health(db: AsyncSession = Depends(get_db)):
+    """Pending and dead-lettered outbox events, with the latest dead letters"""
+    return await outbox.stats(db)
+
+@app.get("/health/cache")
+async def cache_health():
+    """Size and hit/miss counters of the in-process lookup caches"""
+    return cache.stats()
+
+# --- Live Update Routes ---
+@app.get("/events/stream")
+async def stream_events(request: Request, project_id: Optional[int] = None):
+    """Server-sent events for ticket, epic and asset changes, optionally for one project only"""
+    subscription = events.broker.subscribe(project_id)
+
+    async def event_source():
+        try:
+            yield "retry: 3000\n\n"
+            while not await request.is_disconnected():
+                try:
+                    event = await asyncio.wait_for(subscription.queue.get(), timeout=settings.event_heartbeat_interval)
+                except asyncio.TimeoutError:
+                    yield ": keepalive\n\n"  # Keeps proxies from closing an idle stream
+                    continue
+                yield f"event: {event['type']}\ndata: {json.dumps(event, default=str)}\n\n"
+        finally:
+            events.broker.unsubscribe(subscription)
+
+    return StreamingResponse(
+        event_source(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+# --- Delta Sync Routes ---
+@app.get("/sync/deleted/{entity}", response_model=List[schemas.TombstoneOut])
+async def read_deleted(entity: str, since: datetime, project_id: Optional[int] = None, db: AsyncSession = Depends(get_db)):
+    """Ids of rows deleted since ``since``, the counterpart of ``updated_since`` on the list routes"""
+    if entity not in crud.TOMBSTONE_ENTITIES:
+        raise HTTPException(status_code=404, detail=f"Unknown entity '{entity}'")
+    try:
+        return await crud.list_tombstones(db, entity, since, project_id)
+    except Exception as e:
+        logger.error(f"Error fetching deleted {entity}: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+# --- Export Routes ---
+@app.get("/export/{entity}")
+async def export_entity(entity: str, format: str = "ndjson", gzip: bool = False):
+    """Stream every row of an entity as NDJSON or CSV without loading the table into memory"""
+    if entity not in export.EXPORTS:
+        raise HTTPException(status_code=404, detail=f"Unknown export entity: {entity}")
+    if format not in export.FORMATS:
+        raise HTTPException(status_code=400, detail=f"Unsupported export format: {format}")
+    logger.info(f"Exporting {entity} as {format} (gzip={gzip})")
+    filename = f"{entity}.{format}" + (".gz" if gzip else "")
+    headers = {"Content-Disposition": f'attachment; filename="{filename}"'}
+    if gzip:
+        headers["Content-Encoding"] = "gzip"
+    return StreamingResponse(
+        export.stream_export(entity, format, compress=gzip),
+        media_type=export.FORMATS[format],
+        headers=headers,
+    )
+
 # --- Asset Routes ---
 @app.get("/assets", response_model=List[schemas.AssetOut])
 async def read_assets(status: Optional[str] = None, user_email: Optional[str] = None, db: AsyncSession = Depends(get_db)):
@@ -156,28 +312,10 @@ async def read_assets(status: Optional[str] = None, user_email: Optional[str] =
 async def create_asset(asset_in: schemas.AssetCreate, db: AsyncSession = Depends(get_db)):
     try:
         logger.info(f"Creating asset: {asset_in.dict()}")
-        created = await crud.create_asset(db, asset_in)
+        # The admin_asset entry for admin portal viewing is written by the outbox worker
+        created = await crud.create_asset(db, asset_in, mirror=True)
+        outbox.notify()
         logger.info(f"Asset created successfully: {created.id}")
-        
-        # Also create an admin_asset entry for admin portal viewing
-        try:
-            admin_asset_data = schemas.AdminAssetCreate(
-                id=created.id,
-                email=created.email,
-                type=created.type,
-                location=created.location,
-                description=created.description,
-                status=created.status,
-                open_date=created.open_date,
-                close_date=created.close_date,
-                actions=None
-            )
-            await crud.create_admin_asset(db, admin_asset_data)
-            logger.info(f"Admin asset created successfully for asset ID: {created.id}")
-        except Exception as admin_error:
-            logger.error(f"Failed to create admin_asset for asset ID {created.id}: {admin_error}")
-            # Continue anyway - the main asset was created successfully
-        
         return created
     except Exception as e:
         logger.error(f"Error creating asset: {e}")
@@ -205,6 +343,9 @@ async def delete_asset(asset_id: int, db: AsyncSession = Depends(get_db)):
     return None
 
 # --- User Authentication ---
+def _hasher_busy(e: security.PasswordHasherBusy) -> HTTPException:
+    return HTTPException(status_code=503, detail=str(e), headers={"Retry-After": str(e.retry_after)})
+
 @app.post("/auth/register", response_model=schemas.UserOut, status_code=status.HTTP_201_CREATED)
 async def register_user(user_in: schemas.UserCreate, db: AsyncSession = Depends(get_db)):
     try:
@@ -216,23 +357,25 @@ async def register_user(user_in: schemas.UserCreate, db: AsyncSession = Depends(
         return schemas.UserOut(id=created_user.id, email=created_user.email, full_name=created_user.full_name)
     except HTTPException:
         raise
+    except security.PasswordHasherBusy as e:
+        raise _hasher_busy(e)
     except Exception as e:
         logger.error(f"Error registering user: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.post("/auth/login", response_model=schemas.UserOut)
 async def login_user(credentials: schemas.UserLogin, db: AsyncSession = Depends(get_db)):
-    import bcrypt
     try:
         user = await crud.get_user_by_email(db, credentials.email)
         if not user:
             raise HTTPException(status_code=401, detail="Invalid email or password")
-        password_bytes = credentials.password.encode("utf-8")[:72]  # bcrypt limit
-        if not bcrypt.checkpw(password_bytes, user.hashed_password.encode("utf-8")):
+        if not await security.verify_password(credentials.password, user.hashed_password):
             raise HTTPException(status_code=401, detail="Invalid email or password")
         return schemas.UserOut(id=user.id, email=user.email, full_name=user.full_name)
     except HTTPException:
         raise
+    except security.PasswordHasherBusy as e:
+        raise _hasher_busy(e)
     except Exception as e:
         logger.error(f"Error during login: {e}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -303,6 +446,10 @@ async def create_simple_user(user_data: dict, db: AsyncSession = Depends(get_db)
         created_user = await crud.create_user(db, new_user)
         logger.info(f"Created simple user: {created_user.email}")
         return created_user
+    except HTTPException:
+        raise
+    except security.PasswordHasherBusy as e:
+        raise _hasher_busy(e)
     except Exception as e:
         logger.error(f"Error creating simple user: {e}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -324,6 +471,8 @@ async def register_admin(admin_in: schemas.AdminCreate, db: AsyncSession = Depen
         return created_admin
     except HTTPException:
         raise
+    except security.PasswordHasherBusy as e:
+        raise _hasher_busy(e)
     except Exception as e:
         logger.error(f"Error registering admin: {e}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -331,22 +480,22 @@ async def register_admin(admin_in: schemas.AdminCreate, db: AsyncSession = Depen
 @app.post("/admin/login", response_model=schemas.AdminOut)
 async def login_admin(credentials: schemas.AdminLogin, db: AsyncSession = Depends(get_db)):
     """Admin login"""
-    import bcrypt
     try:
         logger.info(f"Admin login attempt: {credentials.email}")
         admin = await crud.get_admin_by_email(db, credentials.email)
         if not admin:
             raise HTTPException(status_code=401, detail="Invalid email or password")
         
-        # Verify password
-        password_bytes = credentials.password.encode("utf-8")[:72]  # bcrypt limit
-        if not bcrypt.checkpw(password_bytes, admin.hashed_password.encode("utf-8")):
+        # Verify password (runs on the hashing thread pool)
+        if not await security.verify_password(credentials.password, admin.hashed_password):
             raise HTTPException(status_code=401, detail="Invalid email or password")
         
         logger.info(f"Admin login successful: {admin.email}")
         return admin
     except HTTPException:
         raise
+    except security.PasswordHasherBusy as e:
+        raise _hasher_busy(e)
     except Exception as e:
         logger.error(f"Error during admin login: {e}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -410,13 +559,38 @@ async def delete_admin_asset(admin_asset_id: int, db: AsyncSession = Depends(get
 
 # --- Ticket Routes ---
 @app.get("/tickets", response_model=List[schemas.TicketOut])
-async def read_tickets(user_id: Optional[int] = None, status: Optional[str] = None, db: AsyncSession = Depends(get_db)):
-    """Get tickets with optional filters"""
+async def read_tickets(response: Response, user_id: Optional[int] = None, status: Optional[str] = None, limit: Optional[int] = Query(None, ge=1, le=500), cursor: Optional[str] = None, updated_since: Optional[datetime] = None, fields: Optional[str] = Query(None, description=fieldsets.FIELDS_DESCRIPTION), order: str = Query("created", pattern="^(created|rank)$"), db: AsyncSession = Depends(get_db)):
+    """Get tickets with optional filters.
+
+    Pass ``limit`` to page through results; the cursor for the next page is
+    returned in the ``X-Next-Cursor`` header and is absent on the last page.
+    Without ``limit`` the full list is returned as before.
+
+    Pass ``updated_since`` to fetch only tickets changed since a previous
+    poll; send the ``X-Sync-Timestamp`` header of that poll, and fetch
+    deletions from ``/sync/deleted/tickets``.
+
+    Pass ``fields`` (e.g. ``id,title,status``) to get only those fields,
+    and ``order=rank`` for board order (whole list only).
+    """
     try:
-        logger.info(f"Fetching tickets with user_id: {user_id}, status: {status}")
-        tickets = await crud.list_tickets(db, user_id, status)
+        logger.info(f"Fetching tickets with user_id: {user_id}, status: {status}, limit: {limit}, updated_since: {updated_since}")
+        names = fieldsets.parse(fields, schemas.TicketOut, "id")
+        await _stamp_sync(response, db)
+        if limit is None:
+            tickets = await crud.list_tickets(db, user_id, status, cursor=cursor, updated_since=updated_since, fields=names, by_rank=order == "rank")
+        else:
+            if order == "rank":
+                raise ValueError("order=rank returns the whole list and cannot be combined with limit")
+            tickets, next_cursor = await crud.list_tickets_page(db, limit, user_id, status, cursor, updated_since, fields=names)
+            if next_cursor:
+                response.headers["X-Next-Cursor"] = next_cursor
         logger.info(f"Found {len(tickets)} tickets")
+        if names is not None:
+            return fieldsets.render(schemas.TicketOut, names, tickets, response)
         return tickets
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         logger.error(f"Error fetching tickets: {e}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -426,43 +600,75 @@ async def create_ticket(ticket_in: schemas.TicketCreate, epic_id: Optional[int]
     """Create a new ticket"""
     try:
         logger.info(f"Creating ticket: {ticket_in.dict()}")
-        created_ticket = await crud.create_ticket(db, ticket_in)
+        # The admin_ticket entry for admin portal visibility is written by the outbox worker
+        created_ticket = await crud.create_ticket(db, ticket_in, mirror=True, epic_id=epic_id, project_id=project_id, user_name=user_name)
+        outbox.notify()
         logger.info(f"Ticket created successfully: {created_ticket.id}")
-        
-        # Also create an admin_ticket entry for admin portal visibility
-        try:
-            # Get project details if project_id is provided
-            project_title = None
-            if project_id:
-                project = await crud.get_project(db, project_id)
-                if project:
-                    project_title = project.name
-            
-            admin_ticket_data = schemas.AdminTicketCreate(
-                ticket_id=created_ticket.id,
-                epic_id=epic_id,
-                project_id=project_id,
-                project_title=project_title,
-                user_name=user_name,
-                title=created_ticket.title,
-                description=created_ticket.description,
-                status=created_ticket.status,
-                priority=created_ticket.priority,
-                assignee=created_ticket.assignee,
-                reporter=created_ticket.reporter,  # ✅ Include reporter field
-                start_date=created_ticket.start_date,
-                due_date=created_ticket.due_date
-            )
-            await crud.create_admin_ticket(db, admin_ticket_data)
-            logger.info(f"Admin ticket created successfully for ticket_id: {created_ticket.id}")
-        except Exception as admin_err:
-            logger.error(f"Failed to create admin ticket (non-critical): {admin_err}")
-        
         return created_ticket
     except Exception as e:
         logger.error(f"Error creating ticket: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
+@app.post("/tickets/bulk", response_model=List[schemas.TicketOut], status_code=status.HTTP_201_CREATED)
+async def create_tickets_bulk(tickets_in: List[schemas.TicketCreate], epic_id: Optional[int] = None, project_id: Optional[int] = None, user_name: Optional[str] = None, db: AsyncSession = Depends(get_db)):
+    """Create many tickets (e.g. from a template or an import) in one transaction, in board order"""
+    try:
+        logger.info(f"Bulk creating {len(tickets_in)} tickets")
+        return await crud.create_tickets_bulk(db, tickets_in, epic_id=epic_id, project_id=project_id, user_name=user_name)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        logger.error(f"Error bulk creating tickets: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+@app.get("/tickets/search", response_model=List[schemas.TicketOut])
+async def search_tickets(response: Response, q: str = Query(..., min_length=1, max_length=200), project_id: Optional[int] = None, status: Optional[str] = None, assignee: Optional[str] = None, limit: int = Query(20, ge=1, le=100), cursor: Optional[str] = None, db: AsyncSession = Depends(get_db)):
+    """Search ticket titles and descriptions, best match first.
+
+    The cursor for the next page is returned in the ``X-Next-Cursor``
+    header and is absent on the last page.
+    """
+    try:
+        tickets, next_cursor = await crud.search_tickets(db, q, limit, cursor, project_id, status, assignee)
+        if next_cursor:
+            response.headers["X-Next-Cursor"] = next_cursor
+        return tickets
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        logger.error(f"Error searching tickets: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+@app.get("/tickets/timeline", response_model=List[schemas.TicketOut])
+async def read_ticket_timeline(response: Response, from_: date = Query(..., alias="from"), to: date = Query(...), project_id: Optional[int] = None, fields: Optional[str] = Query(None, description=fieldsets.FIELDS_DESCRIPTION), db: AsyncSession = Depends(get_db)):
+    """Tickets whose start_date..due_date span overlaps the from..to window (both inclusive)"""
+    try:
+        names = fieldsets.parse(fields, schemas.TicketOut, "id")
+        tickets = await crud.list_ticket_timeline(db, from_, to, project_id, names)
+        if names is not None:
+            return fieldsets.render(schemas.TicketOut, names, tickets, response)
+        return tickets
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        logger.error(f"Error reading ticket timeline: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+@app.get("/tickets/overdue", response_model=List[schemas.TicketOut])
+async def read_overdue_tickets(response: Response, project_id: Optional[int] = None, fields: Optional[str] = Query(None, description=fieldsets.FIELDS_DESCRIPTION), db: AsyncSession = Depends(get_db)):
+    """Tickets flagged overdue by the last background scan, earliest due date first"""
+    try:
+        names = fieldsets.parse(fields, schemas.TicketOut, "id")
+        tickets = await crud.list_overdue_tickets(db, project_id, names)
+        if names is not None:
+            return fieldsets.render(schemas.TicketOut, names, tickets, response)
+        return tickets
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        logger.error(f"Error reading overdue tickets: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
 @app.get("/tickets/{ticket_id}", response_model=schemas.TicketOut)
 async def get_ticket(ticket_id: int, db: AsyncSession = Depends(get_db)):
     """Get a specific ticket"""
@@ -473,32 +679,40 @@ async def get_ticket(ticket_id: int, db: AsyncSession = Depends(get_db)):
 
 @app.put("/tickets/{ticket_id}", response_model=schemas.TicketOut)
 async def update_ticket(ticket_id: int, ticket_in: schemas.TicketUpdate, db: AsyncSession = Depends(get_db)):
-    """Update a ticket"""
-    updated_ticket = await crud.update_ticket(db, ticket_id, ticket_in)
+    """Update a ticket; the corresponding admin_ticket is synced by the outbox worker"""
+    updated_ticket = await crud.update_ticket(db, ticket_id, ticket_in, mirror=True)
     if not updated_ticket:
         raise HTTPException(status_code=404, detail="Ticket not found")
-    
-    # Also update the corresponding admin_ticket if it exists
-    try:
-        admin_ticket = await crud.get_admin_ticket_by_ticket_id(db, ticket_id)
-        if admin_ticket:
-            admin_ticket_update = schemas.AdminTicketUpdate(
-                title=ticket_in.title,
-                description=ticket_in.description,
-                status=ticket_in.status,
-                priority=ticket_in.priority,
-                assignee=ticket_in.assignee,
-                reporter=ticket_in.reporter,  # ✅ Include reporter field
-                start_date=ticket_in.start_date,
-                due_date=ticket_in.due_date
-            )
-            await crud.update_admin_ticket(db, admin_ticket.admin_ticket_id, admin_ticket_update)
-            logger.info(f"Updated admin_ticket for ticket_id: {ticket_id}")
-    except Exception as admin_err:
-        logger.error(f"Failed to update admin ticket (non-critical): {admin_err}")
-    
+    outbox.notify()
     return updated_ticket
 
+@app.post("/tickets/{ticket_id}/move", response_model=schemas.TicketOut)
+async def move_ticket(ticket_id: int, move: schemas.TicketMove, db: AsyncSession = Depends(get_db)):
+    """Drag and drop: place a ticket between ``prev_id`` and ``next_id``, optionally in another status column.
+
+    Only the moved ticket's row is written. A 409 means the board is stale
+    (the neighbours are no longer adjacent); refetch and retry.
+    """
+    try:
+        moved = await crud.move_ticket(db, ticket_id, move, mirror=True)
+        if not moved:
+            raise HTTPException(status_code=404, detail="Ticket not found")
+        outbox.notify()
+        if rebalancer.needed(moved.rank):
+            rebalancer.request()
+        return moved
+    except HTTPException:
+        raise
+    except ranking.RankCollision as e:
+        # Equal ranks (tickets created in the same millisecond) are only separated by a rebalance
+        rebalancer.request()
+        raise HTTPException(status_code=409, detail=str(e))
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        logger.error(f"Error moving ticket {ticket_id}: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
 @app.delete("/tickets/{ticket_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_ticket(ticket_id: int, db: AsyncSession = Depends(get_db)):
     """Delete a ticket and its corresponding admin ticket"""
@@ -526,11 +740,12 @@ async def delete_ticket(ticket_id: int, db: AsyncSession = Depends(get_db)):
 
 # --- Project Routes ---
 @app.get("/projects", response_model=List[schemas.ProjectOut])
-async def read_projects(user_email: Optional[str] = None, db: AsyncSession = Depends(get_db)):
-    """Get all projects, optionally filtered by user_email (leads or team_members)"""
+async def read_projects(response: Response, user_email: Optional[str] = None, updated_since: Optional[datetime] = None, db: AsyncSession = Depends(get_db)):
+    """Get all projects, optionally filtered by user_email (leads or team_members) and last change"""
     try:
-        logger.info(f"Fetching projects for user_email: {user_email}")
-        projects = await crud.list_projects(db, user_email)
+        logger.info(f"Fetching projects for user_email: {user_email}, updated_since: {updated_since}")
+        await _stamp_sync(response, db)
+        projects = await crud.list_projects(db, user_email, updated_since)
         logger.info(f"Found {len(projects)} projects")
         return projects
     except Exception as e:
@@ -575,11 +790,12 @@ async def delete_project(project_id: int, db: AsyncSession = Depends(get_db)):
 
 # --- Epic Routes ---
 @app.get("/epics", response_model=List[schemas.EpicOut])
-async def read_epics(project_id: Optional[int] = None, db: AsyncSession = Depends(get_db)):
-    """Get all epics, optionally filtered by project"""
+async def read_epics(response: Response, project_id: Optional[int] = None, updated_since: Optional[datetime] = None, db: AsyncSession = Depends(get_db)):
+    """Get all epics, optionally filtered by project and last change"""
     try:
-        logger.info(f"Fetching epics for project_id: {project_id}")
-        epics = await crud.list_epics(db, project_id)
+        logger.info(f"Fetching epics for project_id: {project_id}, updated_since: {updated_since}")
+        await _stamp_sync(response, db)
+        epics = await crud.list_epics(db, project_id, updated_since)
         logger.info(f"Found {len(epics)} epics")
         return epics
     except Exception as e:
@@ -591,30 +807,10 @@ async def create_epic(epic_in: schemas.EpicCreate, user_name: Optional[str] = No
     """Create a new epic"""
     try:
         logger.info(f"Creating epic: {epic_in.name}")
-        created_epic = await crud.create_epic(db, epic_in)
+        # The admin_epic entry for admin portal visibility is written by the outbox worker
+        created_epic = await crud.create_epic(db, epic_in, mirror=True, user_name=user_name)
+        outbox.notify()
         logger.info(f"Epic created successfully: {created_epic.id}")
-        
-        # Also create an admin_epic entry for admin portal visibility
-        try:
-            # Get project details if project_id is provided
-            project_title = None
-            if created_epic.project_id:
-                project = await crud.get_project(db, created_epic.project_id)
-                if project:
-                    project_title = project.name
-            
-            admin_epic_data = schemas.AdminEpicCreate(
-                epic_id=created_epic.id,
-                project_id=created_epic.project_id,
-                project_title=project_title,
-                user_name=user_name,
-                name=created_epic.name
-            )
-            await crud.create_admin_epic(db, admin_epic_data)
-            logger.info(f"Admin epic created successfully for epic_id: {created_epic.id}")
-        except Exception as admin_err:
-            logger.error(f"Failed to create admin epic (non-critical): {admin_err}")
-        
         return created_epic
     except Exception as e:
         logger.error(f"Error creating epic: {e}")
@@ -647,17 +843,31 @@ async def delete_epic(epic_id: int, db: AsyncSession = Depends(get_db)):
 
 # --- UsersManagement Routes (User Frontend Profile Data) ---
 @app.get("/users-management", response_model=List[schemas.UsersManagementOut])
-async def read_users_management(db: AsyncSession = Depends(get_db)):
-    """Get all users from users_management table"""
+async def read_users_management(response: Response, fields: Optional[str] = Query(None, description=fieldsets.FIELDS_DESCRIPTION), db: AsyncSession = Depends(get_db)):
+    """Get all users from users_management table (only ``fields``, if given)"""
     try:
         logger.info("Fetching users from users_management")
-        users = await crud.list_users_management(db)
+        names = fieldsets.parse(fields, schemas.UsersManagementOut, "id")
+        users = await crud.list_users_management(db, fields=names)
         logger.info(f"Found {len(users)} users")
+        if names is not None:
+            return fieldsets.render(schemas.UsersManagementOut, names, users, response)
         return users
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         logger.error(f"Error fetching users_management: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
+@app.get("/users-management/search", response_model=List[schemas.UserSearchResult])
+async def search_users_management(q: str = Query(..., min_length=1, max_length=100), limit: int = Query(10, ge=1, le=50), db: AsyncSession = Depends(get_db)):
+    """Assignee autocomplete: users matching ``q`` on email, first or last name"""
+    try:
+        return await crud.search_users_management(db, q, limit)
+    except Exception as e:
+        logger.error(f"Error searching users_management: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
 @app.get("/users-management/email/{email}", response_model=schemas.UsersManagementOut)
 async def get_users_management_by_email(email: str, db: AsyncSession = Depends(get_db)):
     """Get a user from users_management by email"""
@@ -668,105 +878,36 @@ async def get_users_management_by_email(email: str, db: AsyncSession = Depends(g
 
 @app.post("/users-management", response_model=schemas.UsersManagementOut, status_code=status.HTTP_201_CREATED)
 async def create_users_management(user_in: schemas.UsersManagementCreate, db: AsyncSession = Depends(get_db)):
-    """Create a new user in users_management table - Auto-syncs to user_profile"""
+    """Create a new user in users_management table, with its user_profile"""
     try:
         logger.info(f"Creating user in users_management: {user_in.email}")
-        # Check if user already exists
-        existing_user = await crud.get_users_management_by_email(db, user_in.email)
-        if existing_user:
-            raise HTTPException(status_code=400, detail="User with this email already exists")
-        
         created_user = await crud.create_users_management(db, user_in)
         logger.info(f"User created successfully in users_management: {created_user.id}")
-        
-        # Auto-sync to user_profile table for consistency
-        try:
-            profile_data = schemas.UserProfileCreate(
-                full_name=f"{user_in.first_name} {user_in.last_name}".strip(),
-                email=user_in.email,
-                role=user_in.role,
-                department=user_in.department,
-                mobile_number=user_in.mobile_number,
-                date_of_birth=None,
-                user_status="Active" if user_in.active else "Inactive"
-            )
-            await crud.create_user_profile(db, profile_data)
-            logger.info(f"Successfully synced to user_profile table")
-        except Exception as sync_error:
-            logger.warning(f"Failed to sync to user_profile (non-critical): {sync_error}")
-            # Continue - the main user was created successfully
-        
         return created_user
-    except HTTPException:
-        raise
+    except IntegrityError:
+        raise HTTPException(status_code=400, detail="User with this email already exists")
     except Exception as e:
         logger.error(f"Error creating user in users_management: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.put("/users-management/{user_id}", response_model=schemas.UsersManagementOut)
 async def update_users_management(user_id: int, user_in: schemas.UsersManagementUpdate, db: AsyncSession = Depends(get_db)):
-    """Update a user in users_management table - Auto-syncs to user_profile"""
-    updated_user = await crud.update_users_management(db, user_id, user_in)
+    """Update a user in users_management table and its user_profile"""
+    try:
+        updated_user = await crud.update_users_management(db, user_id, user_in)
+    except IntegrityError:
+        raise HTTPException(status_code=400, detail="User with this email already exists")
     if not updated_user:
         raise HTTPException(status_code=404, detail="User not found")
-    
-    # Auto-sync to user_profile table (bidirectional sync)
-    try:
-        user_profile = await crud.get_user_profile_by_email(db, updated_user.email)
-        if user_profile:
-            # Update user_profile with the data from users_management
-            profile_update = schemas.UserProfileUpdate(
-                full_name=f"{updated_user.first_name} {updated_user.last_name}".strip(),
-                role=updated_user.role,
-                department=updated_user.department,
-                mobile_number=updated_user.mobile_number,
-                user_status="Active" if updated_user.active else "Inactive"
-            )
-            await crud.update_user_profile(db, user_profile.user_id, profile_update)
-            logger.info(f"Successfully synced update to user_profile table")
-    except Exception as sync_error:
-        logger.warning(f"Failed to sync to user_profile (non-critical): {sync_error}")
-    
     return updated_user
 
 @app.delete("/users-management/{user_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_users_management(user_id: int, db: AsyncSession = Depends(get_db)):
-    """Delete a user from ALL tables: users_management, user_profile, AND users (complete sync)"""
+    """Delete a user from users_management, user_profile and users"""
     try:
-        # Get the user first to find their email
-        user = await crud.get_users_management_by_id(db, user_id)
-        if not user:
-            raise HTTPException(status_code=404, detail="User not found")
-        
-        user_email = user.email
-        
-        # 1. Delete from users_management table
-        success = await crud.delete_users_management(db, user_id)
-        if not success:
+        if not await crud.delete_users_management(db, user_id):
             raise HTTPException(status_code=404, detail="User not found")
-        
-        logger.info(f"✓ Deleted from users_management: {user_email}")
-        
-        # 2. Delete from user_profile table
-        try:
-            user_profile = await crud.get_user_profile_by_email(db, user_email)
-            if user_profile:
-                await crud.delete_user_profile(db, user_profile.user_id)
-                logger.info(f"✓ Deleted from user_profile table")
-        except Exception as sync_error:
-            logger.warning(f"Failed to delete from user_profile: {sync_error}")
-        
-        # 3. Delete from users table (authentication)
-        try:
-            auth_user = await crud.get_user_by_email(db, user_email)
-            if auth_user:
-                await db.delete(auth_user)
-                await db.commit()
-                logger.info(f"✓ Deleted from users table (authentication)")
-        except Exception as sync_error:
-            logger.warning(f"Failed to delete from users table: {sync_error}")
-        
-        logger.info(f"🎉 User completely deleted from all tables: {user_email}")
+        logger.info(f"Deleted user {user_id} from all user tables")
         return None
     except HTTPException:
         raise
@@ -797,130 +938,42 @@ async def get_user_profile_by_email(email: str, db: AsyncSession = Depends(get_d
 
 @app.post("/user-profiles", response_model=schemas.UserProfileOut, status_code=status.HTTP_201_CREATED)
 async def create_user_profile(profile_in: schemas.UserProfileCreate, db: AsyncSession = Depends(get_db)):
-    """Create a new user profile (from user frontend) - Auto-syncs to users_management"""
+    """Create a new user profile (from user frontend), with its users_management row"""
     try:
         logger.info(f"Creating user profile: {profile_in.email}")
-        logger.info(f"Profile data: full_name={profile_in.full_name}, role={profile_in.role}, department={profile_in.department}")
-        
-        # Check if profile already exists in user_profile
-        existing_profile = await crud.get_user_profile_by_email(db, profile_in.email)
-        if existing_profile:
-            raise HTTPException(status_code=400, detail="User profile with this email already exists")
-        
-        # Create in user_profile table
         created_profile = await crud.create_user_profile(db, profile_in)
         logger.info(f"User profile created successfully: {created_profile.user_id}")
-        
-        # Auto-sync to users_management table for admin portal visibility
-        try:
-            # Split full_name into first_name and last_name
-            name_parts = profile_in.full_name.strip().split(' ', 1)
-            first_name = name_parts[0]
-            last_name = name_parts[1] if len(name_parts) > 1 else ""
-            
-            users_mgmt_data = schemas.UsersManagementCreate(
-                first_name=first_name,
-                last_name=last_name,
-                email=profile_in.email,
-                role=profile_in.role,
-                department=profile_in.department,
-                active=(profile_in.user_status == "Active"),
-                language="English",
-                mobile_number=profile_in.mobile_number,
-                date_format="YYYY-MM-DD",
-                password_reset_needed=False,
-                profile_file_name=None,
-                profile_file_size=None
-            )
-            await crud.create_users_management(db, users_mgmt_data)
-            logger.info(f"Successfully synced to users_management table")
-        except Exception as sync_error:
-            logger.warning(f"Failed to sync to users_management (non-critical): {sync_error}")
-            # Continue - the main profile was created successfully
-        
         return created_profile
-    except HTTPException:
-        raise
+    except IntegrityError:
+        raise HTTPException(status_code=400, detail="User profile with this email already exists")
     except Exception as e:
         logger.error(f"Error creating user profile: {e}")
-        logger.error(f"Exception type: {type(e).__name__}")
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.put("/user-profiles/{user_id}", response_model=schemas.UserProfileOut)
 async def update_user_profile(user_id: int, profile_in: schemas.UserProfileUpdate, db: AsyncSession = Depends(get_db)):
-    """Update a user profile (admin edits)"""
+    """Update a user profile (admin edits) and its users_management row"""
     try:
         logger.info(f"Updating user profile: {user_id}")
         updated_profile = await crud.update_user_profile(db, user_id, profile_in)
         if not updated_profile:
             raise HTTPException(status_code=404, detail="User profile not found")
-        
-        # Also update the corresponding users_management entry if it exists
-        if updated_profile.email:
-            users_mgmt = await crud.get_users_management_by_email(db, updated_profile.email)
-            if users_mgmt:
-                # Update users_management with the new data
-                full_name_parts = updated_profile.full_name.split(' ', 1)
-                first_name = full_name_parts[0] if full_name_parts else updated_profile.full_name
-                last_name = full_name_parts[1] if len(full_name_parts) > 1 else ''
-                
-                users_mgmt_update = schemas.UsersManagementUpdate(
-                    first_name=first_name,
-                    last_name=last_name,
-                    email=updated_profile.email,
-                    role=updated_profile.role,
-                    department=updated_profile.department,
-                    mobile_number=updated_profile.mobile_number,
-                    active=(updated_profile.user_status == "Active")
-                )
-                await crud.update_users_management(db, users_mgmt.id, users_mgmt_update)
-                logger.info(f"Synchronized update to users_management: {users_mgmt.id}")
-        
         return updated_profile
     except HTTPException:
         raise
+    except IntegrityError:
+        raise HTTPException(status_code=400, detail="User profile with this email already exists")
     except Exception as e:
         logger.error(f"Error updating user profile: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.delete("/user-profiles/{user_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_user_profile(user_id: int, db: AsyncSession = Depends(get_db)):
-    """Delete a user profile from ALL tables: user_profile, users_management, AND users (complete sync)"""
+    """Delete a user profile from user_profile, users_management and users"""
     try:
-        # Get the profile first to find their email
-        profile = await crud.get_user_profile_by_id(db, user_id)
-        if not profile:
-            raise HTTPException(status_code=404, detail="User profile not found")
-        
-        user_email = profile.email
-        
-        # 1. Delete from user_profile table
-        success = await crud.delete_user_profile(db, user_id)
-        if not success:
+        if not await crud.delete_user_profile(db, user_id):
             raise HTTPException(status_code=404, detail="User profile not found")
-        
-        logger.info(f"✓ Deleted from user_profile: {user_email}")
-        
-        # 2. Delete from users_management table
-        try:
-            users_mgmt = await crud.get_users_management_by_email(db, user_email)
-            if users_mgmt:
-                await crud.delete_users_management(db, users_mgmt.id)
-                logger.info(f"✓ Deleted from users_management table")
-        except Exception as sync_error:
-            logger.warning(f"Failed to delete from users_management: {sync_error}")
-        
-        # 3. Delete from users table (authentication)
-        try:
-            auth_user = await crud.get_user_by_email(db, user_email)
-            if auth_user:
-                await db.delete(auth_user)
-                await db.commit()
-                logger.info(f"✓ Deleted from users table (authentication)")
-        except Exception as sync_error:
-            logger.warning(f"Failed to delete from users table: {sync_error}")
-        
-        logger.info(f"🎉 User completely deleted from all tables: {user_email}")
+        logger.info(f"Deleted user profile {user_id} from all user tables")
         return None
     except HTTPException:
         raise
@@ -930,11 +983,12 @@ async def delete_user_profile(user_id: int, db: AsyncSession = Depends(get_db)):
 
 # --- AdminEpic Routes (For Admin Portal Boards) ---
 @app.get("/admin/epics", response_model=List[schemas.AdminEpicOut])
-async def read_admin_epics(project_id: Optional[int] = None, db: AsyncSession = Depends(get_db)):
-    """Get all admin epics, optionally filtered by project"""
+async def read_admin_epics(response: Response, project_id: Optional[int] = None, updated_since: Optional[datetime] = None, db: AsyncSession = Depends(get_db)):
+    """Get all admin epics, optionally filtered by project and last change"""
     try:
-        logger.info(f"Fetching admin epics for project_id: {project_id}")
-        admin_epics = await crud.list_admin_epics(db, project_id)
+        logger.info(f"Fetching admin epics for project_id: {project_id}, updated_since: {updated_since}")
+        await _stamp_sync(response, db)
+        admin_epics = await crud.list_admin_epics(db, project_id, updated_since)
         logger.info(f"Found {len(admin_epics)} admin epics")
         return admin_epics
     except Exception as e:
@@ -967,17 +1021,47 @@ async def delete_admin_epic(admin_epic_id: int, db: AsyncSession = Depends(get_d
 
 # --- AdminTicket Routes (For Admin Portal Boards) ---
 @app.get("/admin/tickets", response_model=List[schemas.AdminTicketOut])
-async def read_admin_tickets(project_id: Optional[int] = None, epic_id: Optional[int] = None, db: AsyncSession = Depends(get_db)):
-    """Get all admin tickets, optionally filtered by project or epic"""
+async def read_admin_tickets(response: Response, project_id: Optional[int] = None, epic_id: Optional[int] = None, updated_since: Optional[datetime] = None, fields: Optional[str] = Query(None, description=fieldsets.FIELDS_DESCRIPTION), db: AsyncSession = Depends(get_db)):
+    """Get all admin tickets in board (rank) order, optionally filtered by project, epic or last change (only ``fields``, if given)"""
     try:
-        logger.info(f"Fetching admin tickets for project_id: {project_id}, epic_id: {epic_id}")
-        admin_tickets = await crud.list_admin_tickets(db, project_id, epic_id)
+        logger.info(f"Fetching admin tickets for project_id: {project_id}, epic_id: {epic_id}, updated_since: {updated_since}")
+        names = fieldsets.parse(fields, schemas.AdminTicketOut, "admin_ticket_id")
+        await _stamp_sync(response, db)
+        admin_tickets = await crud.list_admin_tickets(db, project_id, epic_id, updated_since, fields=names)
         logger.info(f"Found {len(admin_tickets)} admin tickets")
+        if names is not None:
+            return fieldsets.render(schemas.AdminTicketOut, names, admin_tickets, response)
         return admin_tickets
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         logger.error(f"Error fetching admin tickets: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
+@app.get("/admin/tickets/search", response_model=List[schemas.AdminTicketOut])
+async def search_admin_tickets(response: Response, q: str = Query(..., min_length=1, max_length=200), project_id: Optional[int] = None, status: Optional[str] = None, assignee: Optional[str] = None, limit: int = Query(20, ge=1, le=100), cursor: Optional[str] = None, db: AsyncSession = Depends(get_db)):
+    """Search admin ticket titles and descriptions, best match first (paged like /tickets/search)"""
+    try:
+        admin_tickets, next_cursor = await crud.search_admin_tickets(db, q, limit, cursor, project_id, status, assignee)
+        if next_cursor:
+            response.headers["X-Next-Cursor"] = next_cursor
+        return admin_tickets
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        logger.error(f"Error searching admin tickets: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+@app.patch("/admin/tickets/batch", response_model=List[schemas.AdminTicketBatchResult])
+async def batch_update_admin_tickets(items: List[schemas.AdminTicketBatchItem], db: AsyncSession = Depends(get_db)):
+    """Update many admin tickets (and their original tickets) in one request, e.g. a Kanban reorder"""
+    try:
+        logger.info(f"Batch updating {len(items)} admin tickets")
+        return await crud.batch_update_admin_tickets(db, items)
+    except Exception as e:
+        logger.error(f"Error batch updating admin tickets: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
 @app.get("/admin/tickets/{admin_ticket_id}", response_model=schemas.AdminTicketOut)
 async def get_admin_ticket(admin_ticket_id: int, db: AsyncSession = Depends(get_db)):
     """Get a specific admin ticket"""
@@ -1045,3 +1129,22 @@ async def delete_admin_ticket(admin_ticket_id: int, db: AsyncSession = Depends(g
     except Exception as e:
         logger.error(f"Error deleting admin ticket: {e}")
         raise HTTPException(status_code=500, detail=str(e))
+
+# --- Dashboard Routes ---
+@app.get("/dashboard/summary", response_model=schemas.DashboardSummary)
+async def dashboard_summary(project_id: Optional[int] = None, db: AsyncSession = Depends(get_db)):
+    """Ticket counts by status, priority, assignee and project, from the ticket_rollups table"""
+    try:
+        return await rollups.summary(db, project_id)
+    except Exception as e:
+        logger.error(f"Error fetching dashboard summary: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+@app.get("/dashboard/overdue", response_model=schemas.OverdueSummary)
+async def dashboard_overdue(project_id: Optional[int] = None, db: AsyncSession = Depends(get_db)):
+    """Overdue ticket counts by project, as of the last background scan"""
+    try:
+        return await overdue.summary(db, project_id)
+    except Exception as e:
+        logger.error(f"Error fetching overdue summary: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
@@ -0,0 +1,220 @@
+"""Per-route request metrics in Prometheus text format.
+
+``MetricsMiddleware`` times every HTTP request and records its status code;
+SQLAlchemy engine events registered by ``instrument_engine`` add the time
+spent in the database and the number of statements to the request that ran
+them. ``render`` produces the body served at ``/metrics``, together with
+the hit/miss counters of the caches in ``app.cache`` and the queue depth
+and latency of the password hashing pool in ``app.security``.
+
+Routes are labelled by their path template (``/tickets/{ticket_id}``), so
+label cardinality is bounded by the number of routes rather than by ids.
+
+Streaming routes (``STREAMING_PATHS``: the SSE feed and exports) stay open
+for minutes or hours, so they are kept out of the latency histograms and
+the in-flight gauge; they are counted in ``flowtrack_http_streams_open``
+and, once closed, in the request counter.
+"""
+from collections import defaultdict
+from contextvars import ContextVar
+from typing import Dict, List, Optional, Sequence, Tuple
+import bisect
+import time
+
+from sqlalchemy import event
+
+from . import cache, security
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+STATEMENT_BUCKETS = (1, 2, 3, 5, 8, 13, 21, 34, 55, 89)
+
+UNMATCHED_ROUTE = "unmatched"
+STREAMING_PATHS = ("/events/stream", "/export/")
+
+
+class Histogram:
+    """Fixed-bucket histogram; bucket counts are stored non-cumulatively"""
+
+    def __init__(self, buckets: Sequence[float]):
+        self.buckets = buckets
+        self.counts = [0] * len(buckets)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value: float) -> None:
+        index = bisect.bisect_left(self.buckets, value)
+        if index < len(self.counts):
+            self.counts[index] += 1
+        self.count += 1
+        self.sum += value
+
+
+class RequestStats:
+    """Database work attributed to the request currently being served"""
+
+    __slots__ = ("db_seconds", "statements")
+
+    def __init__(self):
+        self.db_seconds = 0.0
+        self.statements = 0
+
+
+_current: ContextVar[Optional[RequestStats]] = ContextVar("metrics_request", default=None)
+
+_requests_total: Dict[Tuple[str, str, str], int] = defaultdict(int)
+_durations: Dict[Tuple[str, str], Histogram] = {}
+_db_durations: Dict[Tuple[str, str], Histogram] = {}
+_statements: Dict[Tuple[str, str], Histogram] = {}
+_in_flight = 0
+_streams_open = 0
+
+
+def current_request() -> Optional[RequestStats]:
+    """Stats of the request being served in this context, if any"""
+    return _current.get()
+
+
+def _histogram(store: Dict[Tuple[str, str], Histogram], key: Tuple[str, str], buckets: Sequence[float]) -> Histogram:
+    histogram = store.get(key)
+    if histogram is None:
+        histogram = store[key] = Histogram(buckets)
+    return histogram
+
+
+def _observe(method: str, route: str, status_code: int, seconds: float, stats: RequestStats) -> None:
+    key = (method, route)
+    _requests_total[(method, route, str(status_code))] += 1
+    _histogram(_durations, key, LATENCY_BUCKETS).observe(seconds)
+    _histogram(_db_durations, key, LATENCY_BUCKETS).observe(stats.db_seconds)
+    _histogram(_statements, key, STATEMENT_BUCKETS).observe(stats.statements)
+
+
+class MetricsMiddleware:
+    """ASGI middleware recording latency, status, in-flight count and DB work per route"""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        global _in_flight, _streams_open
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        stats = RequestStats()
+        token = _current.set(stats)
+        status_code = 500  # Reported if the app fails before starting a response
+        streaming = scope["path"].startswith(STREAMING_PATHS)
+
+        async def send_with_status(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        if streaming:
+            _streams_open += 1
+        else:
+            _in_flight += 1
+        start = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            elapsed = time.perf_counter() - start
+            _current.reset(token)
+            # The router stores the matched route in the scope
+            route = getattr(scope.get("route"), "path", None) or UNMATCHED_ROUTE
+            if streaming:
+                _streams_open -= 1
+                _requests_total[(scope["method"], route, str(status_code))] += 1
+            else:
+                _in_flight -= 1
+                _observe(scope["method"], route, status_code, elapsed, stats)
+
+
+def instrument_engine(engine) -> None:
+    """Attribute statement count and time on ``engine`` to the current request"""
+    sync_engine = getattr(engine, "sync_engine", engine)
+
+    @event.listens_for(sync_engine, "before_cursor_execute")
+    def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        if context is not None:
+            context._metrics_start = time.perf_counter()
+
+    @event.listens_for(sync_engine, "after_cursor_execute")
+    def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        stats = _current.get()
+        started = getattr(context, "_metrics_start", None)
+        if stats is None or started is None:
+            return
+        stats.db_seconds += time.perf_counter() - started
+        stats.statements += 1
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\"", "\\\"").replace("\n", "\\n")
+
+
+def _labels(**labels) -> str:
+    return "{" + ",".join(f'{name}="{_escape(str(value))}"' for name, value in labels.items()) + "}"
+
+
+def _render_histograms(lines: List[str], name: str, help_text: str, store: Dict[Tuple[str, str], Histogram]) -> None:
+    lines.append(f"# HELP {name} {help_text}")
+    lines.append(f"# TYPE {name} histogram")
+    for (method, route), histogram in sorted(store.items()):
+        cumulative = 0
+        for bound, count in zip(histogram.buckets, histogram.counts):
+            cumulative += count
+            lines.append(f"{name}_bucket{_labels(method=method, route=route, le=bound)} {cumulative}")
+        lines.append(f"{name}_bucket{_labels(method=method, route=route, le='+Inf')} {histogram.count}")
+        lines.append(f"{name}_sum{_labels(method=method, route=route)} {histogram.sum}")
+        lines.append(f"{name}_count{_labels(method=method, route=route)} {histogram.count}")
+
+
+def render() -> str:
+    """All metrics in the Prometheus text exposition format"""
+    lines = [
+        "# HELP flowtrack_http_requests_total HTTP requests by route and status code",
+        "# TYPE flowtrack_http_requests_total counter",
+    ]
+    for (method, route, status_code), count in sorted(_requests_total.items()):
+        lines.append(f"flowtrack_http_requests_total{_labels(method=method, route=route, status=status_code)} {count}")
+    lines += [
+        "# HELP flowtrack_http_requests_in_flight HTTP requests currently being served",
+        "# TYPE flowtrack_http_requests_in_flight gauge",
+        f"flowtrack_http_requests_in_flight {_in_flight}",
+        "# HELP flowtrack_http_streams_open Streaming responses (SSE, exports) currently open",
+        "# TYPE flowtrack_http_streams_open gauge",
+        f"flowtrack_http_streams_open {_streams_open}",
+    ]
+    _render_histograms(lines, "flowtrack_http_request_duration_seconds", "Request latency", _durations)
+    _render_histograms(lines, "flowtrack_http_request_db_seconds", "Time spent executing SQL per request", _db_durations)
+    _render_histograms(lines, "flowtrack_http_request_db_statements", "SQL statements executed per request", _statements)
+    caches = cache.stats()
+    for name, kind, help_text in (
+        ("flowtrack_cache_hits_total", "hits", "Lookups served from an in-process cache"),
+        ("flowtrack_cache_misses_total", "misses", "Lookups that had to load from the database"),
+        ("flowtrack_cache_evictions_total", "evictions", "Entries evicted to stay within max_entries"),
+    ):
+        lines += [f"# HELP {name} {help_text}", f"# TYPE {name} counter"]
+        lines += [f"{name}{_labels(cache=cache_name)} {s[kind]}" for cache_name, s in sorted(caches.items())]
+    lines += ["# HELP flowtrack_cache_entries Entries currently cached", "# TYPE flowtrack_cache_entries gauge"]
+    lines += [f"flowtrack_cache_entries{_labels(cache=cache_name)} {s['entries']}" for cache_name, s in sorted(caches.items())]
+    hashing = security.stats()
+    lines += [
+        "# HELP flowtrack_password_hash_pending bcrypt calls running or queued on the hashing pool",
+        "# TYPE flowtrack_password_hash_pending gauge",
+        f"flowtrack_password_hash_pending {hashing['pending']}",
+        "# HELP flowtrack_password_hash_rejected_total bcrypt calls rejected because the queue was full",
+        "# TYPE flowtrack_password_hash_rejected_total counter",
+        f"flowtrack_password_hash_rejected_total {hashing['rejected']}",
+        "# HELP flowtrack_password_hash_seconds Time to hash or verify a password, queueing included",
+        "# TYPE flowtrack_password_hash_seconds summary",
+    ]
+    for op, entry in sorted(hashing["operations"].items()):
+        lines.append(f"flowtrack_password_hash_seconds_sum{_labels(operation=op)} {entry['total_seconds']}")
+        lines.append(f"flowtrack_password_hash_seconds_count{_labels(operation=op)} {entry['count']}")
+    lines += ["# HELP flowtrack_password_hash_max_seconds Slowest hash or verify so far", "# TYPE flowtrack_password_hash_max_seconds gauge"]
+    lines += [f"flowtrack_password_hash_max_seconds{_labels(operation=op)} {entry['max_ms'] / 1000}" for op, entry in sorted(hashing["operations"].items())]
+    return "\n".join(lines) + "\n"
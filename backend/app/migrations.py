@@ -0,0 +1,93 @@
+"""Schema version gate for worker boot, and the ``flowtrack db upgrade`` steps.
+
+Workers no longer create tables on startup. With ``DB_BOOT_MODE=check`` (the
+default) startup reads ``alembic_version`` in one query and refuses to start
+unless it matches the newest migration in ``alembic/versions``. Creating or
+upgrading the schema is an explicit deploy step: ``upgrade`` runs the
+pending Alembic migrations, or on an empty database creates every table
+from the models and stamps it with the head revision.
+"""
+from functools import lru_cache
+from pathlib import Path
+from typing import Optional
+
+from sqlalchemy import inspect, text
+from sqlalchemy.engine import Connection
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from . import models
+
+ALEMBIC_INI = Path(__file__).resolve().parent.parent / "alembic.ini"
+
+
+class SchemaMismatch(RuntimeError):
+    """The database is not at the revision this code expects"""
+
+
+def _alembic_config():
+    from alembic.config import Config
+
+    config = Config(str(ALEMBIC_INI))
+    config.set_main_option("script_location", str(ALEMBIC_INI.parent / "alembic"))
+    return config
+
+
+@lru_cache(maxsize=1)
+def head_revision() -> str:
+    """Newest revision in alembic/versions (read from the files, not the database)"""
+    from alembic.script import ScriptDirectory
+
+    heads = ScriptDirectory.from_config(_alembic_config()).get_heads()
+    if len(heads) != 1:
+        raise SchemaMismatch(f"Expected one Alembic head, found {len(heads)}: {', '.join(heads)}")
+    return heads[0]
+
+
+async def current_revision(engine: AsyncEngine) -> Optional[str]:
+    """Revision recorded in alembic_version, or None when the database was never stamped"""
+    try:
+        async with engine.connect() as conn:
+            return (await conn.execute(text("SELECT version_num FROM alembic_version"))).scalar()
+    except DBAPIError:
+        return None  # No alembic_version table
+
+
+async def check(engine: AsyncEngine) -> str:
+    """Raise SchemaMismatch unless the database is at the head revision; returns it"""
+    head = head_revision()
+    current = await current_revision(engine)
+    if current != head:
+        raise SchemaMismatch(
+            f"Database schema is at revision {current or '<none>'}, this build expects {head}; "
+            "run `python scripts/flowtrack.py db upgrade` before starting the API"
+        )
+    return head
+
+
+def _upgrade(conn: Connection) -> str:
+    from alembic import command
+
+    config = _alembic_config()
+    config.attributes["connection"] = conn
+    tables = set(inspect(conn).get_table_names())
+    if not tables:
+        # The migration chain predates most tables, so a new database is built from the models
+        models.Base.metadata.create_all(conn)
+        command.stamp(config, "head")
+        return "created"
+    if "alembic_version" not in tables:
+        raise SchemaMismatch(
+            "Database has tables but no alembic_version; stamp the revision it matches "
+            "(`alembic stamp <revision>`) and run the upgrade again"
+        )
+    command.upgrade(config, "head")
+    # Tables that no migration creates, as startup used to
+    models.Base.metadata.create_all(conn)
+    return "upgraded"
+
+
+async def upgrade(engine: AsyncEngine) -> str:
+    """Bring the database to the head revision in one transaction; returns "created" or "upgraded" """
+    async with engine.begin() as conn:
+        return await conn.run_sync(_upgrade)
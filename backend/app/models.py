@@ -61,10 +61,11 @@
 #     # Relationship back to User
 #     user = relationship("User", back_populates="assets")
 from datetime import datetime
-from sqlalchemy import Column, Integer, String, DateTime, Text, TIMESTAMP, func, Date, Boolean
+from sqlalchemy import Column, Integer, String, DateTime, Text, TIMESTAMP, func, Date, Boolean, Index, ForeignKey, DDL, event, false, true
 from sqlalchemy.ext.declarative import declarative_base
 
 from app.database import Base
+from app import ranking
 
 class User(Base):
     __tablename__ = "users"
@@ -105,6 +106,8 @@ class AdminAsset(Base):
 
 class UsersManagement(Base):
     __tablename__ = "users_management"
+    # Search by email / first_name / last_name uses PostgreSQL lower() prefix
+    # and pg_trgm indexes created in migration 20261018_users_search
 
     id = Column(Integer, primary_key=True, index=True, autoincrement=True)
     first_name = Column(String(100), nullable=False)
@@ -127,12 +130,15 @@ class UsersManagement(Base):
 class UserProfile(Base):
     __tablename__ = "user_profile"
 
+    # Projection of users_management: everything except date_of_birth is
+    # derived from the linked row and rewritten with it (see crud user accounts)
     user_id = Column(Integer, primary_key=True, index=True)
-    full_name = Column(String(150), nullable=False)
+    users_management_id = Column(Integer, ForeignKey("users_management.id", ondelete="CASCADE"), unique=True, nullable=False)
+    full_name = Column(String(255), nullable=False)
     email = Column(String(255), unique=True, nullable=False)
-    mobile_number = Column(String(20), nullable=True)
+    mobile_number = Column(String(30), nullable=True)
     role = Column(String(50), nullable=False)
-    department = Column(String(50), nullable=False)
+    department = Column(String(100), nullable=False)
     date_of_birth = Column(Date, nullable=True)
     user_status = Column(String(20), default="Active", nullable=False)
     created_at = Column(TIMESTAMP, server_default=func.now())
@@ -160,6 +166,22 @@ class Project(Base):
     created_at = Column(TIMESTAMP, server_default=func.now())
     updated_at = Column(TIMESTAMP, server_default=func.now(), onupdate=func.now())
 
+    __table_args__ = (
+        Index("ix_projects_updated_at", "updated_at"),
+    )
+
+class ProjectMember(Base):
+    __tablename__ = "project_members"
+
+    # Normalized copy of projects.leads / projects.team_members for indexed lookups by email
+    project_id = Column(Integer, primary_key=True)
+    user_email = Column(String(255), primary_key=True)
+    role = Column(String(20), primary_key=True)  # 'lead' or 'member'
+
+    __table_args__ = (
+        Index("ix_project_members_user_email_project_id", "user_email", "project_id"),
+    )
+
 class Epic(Base):
     __tablename__ = "epics"
 
@@ -169,8 +191,17 @@ class Epic(Base):
     created_at = Column(TIMESTAMP, server_default=func.now())
     updated_at = Column(TIMESTAMP, server_default=func.now(), onupdate=func.now())
 
+    __table_args__ = (
+        Index("ix_epics_updated_at", "updated_at"),
+    )
+
+# Ranks compare byte by byte, whatever the database's default collation
+RankType = String(64).with_variant(String(64, collation="C"), "postgresql")
+
 class Ticket(Base):
     __tablename__ = "tickets"
+    # PostgreSQL also has a generated search_vector tsvector column (GIN indexed),
+    # left unmapped; see migration 20261018_ticket_search
 
     id = Column(Integer, primary_key=True, index=True, autoincrement=True)
     user_id = Column(Integer, nullable=False)  # Will reference users table
@@ -182,9 +213,25 @@ class Ticket(Base):
     reporter = Column(String(255), nullable=True)  # Email of user who created/assigned the ticket
     start_date = Column(Date, nullable=True)  # Task start date
     due_date = Column(Date, nullable=True)  # Task due date
+    rank = Column(RankType, nullable=False, default=ranking.initial)  # Board order, see app/ranking.py
+    overdue = Column(Boolean, nullable=False, default=False, server_default=false())  # Set by app/overdue.py
     created_at = Column(TIMESTAMP, server_default=func.now())
     updated_at = Column(TIMESTAMP, server_default=func.now(), onupdate=func.now())
 
+    __table_args__ = (
+        # Keyset pagination on (created_at, id), globally and per user
+        Index("ix_tickets_created_at_id", "created_at", "id"),
+        Index("ix_tickets_user_id_created_at_id", "user_id", "created_at", "id"),
+        # Delta sync (?updated_since=)
+        Index("ix_tickets_updated_at", "updated_at"),
+        # Board order (?order=rank)
+        Index("ix_tickets_rank_id", "rank", "id"),
+        # Overdue scans: due dates passed since the last run, and the flagged tickets
+        Index("ix_tickets_due_date", "due_date"),
+        # (SQLite compares booleans as "overdue = 1", and only matches the identical predicate)
+        Index("ix_tickets_overdue_due_date", "due_date", "id", postgresql_where=overdue, sqlite_where=overdue == true()),
+    )
+
 class AdminEpic(Base):
     __tablename__ = "admin_epics"
 
@@ -197,11 +244,17 @@ class AdminEpic(Base):
     created_at = Column(TIMESTAMP, server_default=func.now())
     updated_at = Column(TIMESTAMP, server_default=func.now(), onupdate=func.now())
 
+    __table_args__ = (
+        Index("ix_admin_epics_updated_at", "updated_at"),
+    )
+
 class AdminTicket(Base):
     __tablename__ = "admin_tickets"
+    # PostgreSQL also has a generated search_vector tsvector column (GIN indexed),
+    # left unmapped; see migration 20261018_ticket_search
 
     admin_ticket_id = Column(Integer, primary_key=True, index=True, autoincrement=True)
-    ticket_id = Column(Integer, nullable=False)  # Reference to original ticket
+    ticket_id = Column(Integer, nullable=False, index=True)  # Reference to original ticket
     epic_id = Column(Integer, nullable=True)  # Reference to epic
     project_id = Column(Integer, nullable=True)  # Reference to project
     project_title = Column(String(200), nullable=True)  # Project name for easy lookup
@@ -214,5 +267,120 @@ class AdminTicket(Base):
     reporter = Column(String(255), nullable=True)  # Email of user who created/assigned the ticket
     start_date = Column(Date, nullable=True)  # Task start date
     due_date = Column(Date, nullable=True)  # Task due date
+    rank = Column(RankType, nullable=False, default=ranking.initial)  # Copied from the ticket
     created_at = Column(TIMESTAMP, server_default=func.now())
     updated_at = Column(TIMESTAMP, server_default=func.now(), onupdate=func.now())
+
+    __table_args__ = (
+        Index("ix_admin_tickets_updated_at", "updated_at"),
+        # Boards list a project's cards in rank order
+        Index("ix_admin_tickets_project_id_rank", "project_id", "rank"),
+    )
+
+class TicketRollup(Base):
+    __tablename__ = "ticket_rollups"
+
+    # admin_tickets counts per key, maintained by app/rollups.py; no project = 0, no assignee = ''
+    project_id = Column(Integer, primary_key=True)
+    status = Column(String(50), primary_key=True)
+    priority = Column(String(50), primary_key=True)
+    assignee = Column(String(255), primary_key=True)
+    ticket_count = Column(Integer, nullable=False, default=0)
+
+class OverdueRollup(Base):
+    __tablename__ = "overdue_rollups"
+
+    # Overdue tickets per project as of the last scan (app/overdue.py); no project = 0
+    project_id = Column(Integer, primary_key=True)
+    ticket_count = Column(Integer, nullable=False, default=0)
+
+class OverdueScan(Base):
+    __tablename__ = "overdue_scans"
+
+    # Single row (id = 1): watermarks of the last overdue scan
+    id = Column(Integer, primary_key=True)
+    due_watermark = Column(Date, nullable=True)  # Tickets due on or before this day were scanned
+    updated_watermark = Column(TIMESTAMP, nullable=True)  # Edits at or after this are rescanned
+    scanned_at = Column(TIMESTAMP, nullable=True)
+
+class OutboxEvent(Base):
+    __tablename__ = "outbox_events"
+
+    id = Column(Integer, primary_key=True, index=True, autoincrement=True)
+    event_type = Column(String(50), nullable=False)  # e.g. admin_ticket.create
+    payload = Column(Text, nullable=False)  # JSON document
+    attempts = Column(Integer, nullable=False, default=0)
+    last_error = Column(Text, nullable=True)
+    created_at = Column(TIMESTAMP, server_default=func.now())
+    processed_at = Column(TIMESTAMP, nullable=True)
+
+    __table_args__ = (
+        # Pending events are scanned in id order
+        Index("ix_outbox_events_processed_at_id", "processed_at", "id"),
+    )
+
+class Tombstone(Base):
+    __tablename__ = "tombstones"
+
+    # Records deletes so clients syncing with ?updated_since= can drop rows they still hold
+    id = Column(Integer, primary_key=True, index=True, autoincrement=True)
+    entity = Column(String(30), nullable=False)  # tickets, epics, projects, admin_tickets, admin_epics
+    entity_id = Column(Integer, nullable=False)
+    project_id = Column(Integer, nullable=True)
+    deleted_at = Column(TIMESTAMP, server_default=func.now())
+
+    __table_args__ = (
+        Index("ix_tombstones_entity_deleted_at", "entity", "deleted_at"),
+    )
+
+# PostgreSQL-only columns and indexes that migrations add to existing databases,
+# repeated here so `flowtrack db upgrade` builds them on a new one too (create_all)
+def _postgres_ddl(table, *statements):
+    for statement in statements:
+        event.listen(table, "after_create", DDL(statement).execute_if(dialect="postgresql"))
+
+def _not_postgres(ddl, target, bind, **kw):
+    return bind.dialect.name != "postgresql"
+
+def _fallback_ddl(table, *statements):
+    """The same, for every other database (SQLite in development and tests)"""
+    for statement in statements:
+        event.listen(table, "after_create", DDL(statement).execute_if(callable_=_not_postgres))
+
+# Migration 20261018_users_search
+_postgres_ddl(UsersManagement.__table__, "CREATE EXTENSION IF NOT EXISTS pg_trgm", *(
+    f"CREATE INDEX IF NOT EXISTS ix_users_management_{column}_{suffix} ON users_management {expression}"
+    for column in ("email", "first_name", "last_name")
+    for suffix, expression in (
+        ("prefix", f"(lower({column}) text_pattern_ops)"),
+        ("trgm", f"USING gin (lower({column}) gin_trgm_ops)"),
+    )
+))
+
+# Migration 20261018_ticket_search
+TICKET_SEARCH_VECTOR = (
+    "setweight(to_tsvector('english', coalesce(title, '')), 'A') || "
+    "setweight(to_tsvector('english', coalesce(description, '')), 'B')"
+)
+for _table in (Ticket.__table__, AdminTicket.__table__):
+    _postgres_ddl(
+        _table,
+        f"ALTER TABLE {_table.name} ADD COLUMN IF NOT EXISTS search_vector tsvector "
+        f"GENERATED ALWAYS AS ({TICKET_SEARCH_VECTOR}) STORED",
+        f"CREATE INDEX IF NOT EXISTS ix_{_table.name}_search_vector ON {_table.name} USING gin (search_vector)",
+    )
+
+# Migration 20261018_ticket_timeline: /tickets/timeline overlap queries on
+# [start_date, due_date] (crud._timeline_overlaps must use the same expressions)
+_postgres_ddl(
+    Ticket.__table__,
+    "CREATE INDEX IF NOT EXISTS ix_tickets_timeline ON tickets USING gist "
+    "(daterange(least(start_date, due_date), greatest(start_date, due_date), '[]')) "
+    "WHERE start_date IS NOT NULL OR due_date IS NOT NULL",
+)
+_fallback_ddl(
+    Ticket.__table__,
+    "CREATE INDEX IF NOT EXISTS ix_tickets_timeline ON tickets "
+    "(min(coalesce(start_date, due_date), coalesce(due_date, start_date)), "
+    "max(coalesce(start_date, due_date), coalesce(due_date, start_date)))",
+)
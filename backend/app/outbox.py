@@ -0,0 +1,298 @@
+"""Transactional outbox for the admin_* mirror tables.
+
+Write paths add an OutboxEvent in the same transaction as the primary row
+(see ``enqueue``), so the request only pays for a single commit. A background
+worker started from ``app.main`` drains pending events in batches and applies
+them to admin_tickets / admin_epics / admin_assets. Handlers copy the current
+state of the source row, which makes them idempotent: replaying an event or
+applying it late still converges the mirror.
+
+Applied events are deleted by ``purge_processed`` once they are older than
+``settings.outbox_retention_hours``. Events that failed
+``settings.outbox_max_attempts`` times are dead letters: they are logged,
+kept, and reported by ``stats`` (``GET /health/outbox``).
+"""
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional
+import asyncio
+import json
+import logging
+import time
+
+from sqlalchemy import delete, func, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from . import models, database, rollups
+from .config import settings
+
+logger = logging.getLogger(__name__)
+
+ADMIN_TICKET_CREATE = "admin_ticket.create"
+ADMIN_TICKET_UPDATE = "admin_ticket.update"
+ADMIN_EPIC_CREATE = "admin_epic.create"
+ADMIN_ASSET_CREATE = "admin_asset.create"
+
+# Ticket columns copied verbatim into admin_tickets
+TICKET_MIRROR_FIELDS = (
+    "title", "description", "status", "priority", "assignee",
+    "reporter", "start_date", "due_date", "rank",
+)
+
+PURGE_INTERVAL = 300.0  # seconds between retention deletes while idle
+DEAD_LETTER_SAMPLE = 20  # dead letters listed by stats()
+
+_wakeup: Optional[asyncio.Event] = None
+_stopping = False
+
+
+def enqueue(session: AsyncSession, event_type: str, payload: dict) -> models.OutboxEvent:
+    """Add an outbox event to the session; it is committed with the caller's transaction"""
+    event = models.OutboxEvent(event_type=event_type, payload=json.dumps(payload, default=str), attempts=0)
+    session.add(event)
+    return event
+
+
+def notify() -> None:
+    """Wake the worker so freshly committed events are applied without waiting for the next poll"""
+    if _wakeup is not None:
+        _wakeup.set()
+
+
+def stop() -> None:
+    """Ask the worker to exit after the batch it is currently applying"""
+    global _stopping
+    _stopping = True
+    notify()
+
+
+async def _load_by(session: AsyncSession, column, ids) -> Dict[int, object]:
+    """Load rows of column's table keyed by that column, in one query"""
+    ids = {i for i in ids if i is not None}
+    if not ids:
+        return {}
+    res = await session.execute(select(column.class_).where(column.in_(ids)))
+    return {getattr(row, column.key): row for row in res.scalars().all()}
+
+
+async def _apply_ticket_events(session: AsyncSession, events: List[models.OutboxEvent], payloads: Dict[int, dict]) -> None:
+    ticket_ids = [payloads[e.id]["ticket_id"] for e in events]
+    tickets = await _load_by(session, models.Ticket.id, ticket_ids)
+    mirrors = await _load_by(session, models.AdminTicket.ticket_id, ticket_ids)
+    projects = await _load_by(session, models.Project.id, [payloads[e.id].get("project_id") for e in events])
+    deltas: Dict[rollups.RollupKey, int] = {}
+    created = []
+
+    for event in events:
+        payload = payloads[event.id]
+        ticket = tickets.get(payload["ticket_id"])
+        if ticket is None:
+            continue  # Source ticket deleted since the event was written
+        fields = {name: getattr(ticket, name) for name in TICKET_MIRROR_FIELDS}
+        mirror = mirrors.get(ticket.id)
+        if mirror is None and event.event_type == ADMIN_TICKET_CREATE:
+            project = projects.get(payload.get("project_id"))
+            mirror = models.AdminTicket(
+                ticket_id=ticket.id,
+                epic_id=payload.get("epic_id"),
+                project_id=payload.get("project_id"),
+                project_title=project.name if project else None,
+                user_name=payload.get("user_name"),
+                **fields,
+            )
+            session.add(mirror)
+            mirrors[ticket.id] = mirror
+            created.append(mirror)
+        elif mirror is not None:
+            old_key = rollups.key_of(mirror)
+            for name, value in fields.items():
+                setattr(mirror, name, value)
+            rollups.move(deltas, old_key, rollups.key_of(mirror))
+    if created:
+        await session.flush()  # Column defaults are only known once inserted
+        for mirror in created:
+            rollups.add(deltas, rollups.key_of(mirror), +1)
+    await rollups.apply(session, deltas)
+
+
+async def _apply_epic_events(session: AsyncSession, events: List[models.OutboxEvent], payloads: Dict[int, dict]) -> None:
+    epic_ids = [payloads[e.id]["epic_id"] for e in events]
+    epics = await _load_by(session, models.Epic.id, epic_ids)
+    mirrors = await _load_by(session, models.AdminEpic.epic_id, epic_ids)
+    projects = await _load_by(session, models.Project.id, [epic.project_id for epic in epics.values()])
+
+    for event in events:
+        payload = payloads[event.id]
+        epic = epics.get(payload["epic_id"])
+        if epic is None or epic.id in mirrors:
+            continue
+        project = projects.get(epic.project_id)
+        mirror = models.AdminEpic(
+            epic_id=epic.id,
+            project_id=epic.project_id,
+            project_title=project.name if project else None,
+            user_name=payload.get("user_name"),
+            name=epic.name,
+        )
+        session.add(mirror)
+        mirrors[epic.id] = mirror
+
+
+async def _apply_asset_events(session: AsyncSession, events: List[models.OutboxEvent], payloads: Dict[int, dict]) -> None:
+    asset_ids = [payloads[e.id]["asset_id"] for e in events]
+    assets = await _load_by(session, models.Asset.id, asset_ids)
+    mirrors = await _load_by(session, models.AdminAsset.id, asset_ids)
+
+    for event in events:
+        asset = assets.get(payloads[event.id]["asset_id"])
+        if asset is None or asset.id in mirrors:
+            continue
+        mirror = models.AdminAsset(
+            id=asset.id,
+            email=asset.email,
+            type=asset.type,
+            location=asset.location,
+            description=asset.description,
+            status=asset.status,
+            open_date=asset.open_date,
+            close_date=asset.close_date,
+            actions=None,
+        )
+        session.add(mirror)
+        mirrors[asset.id] = mirror
+
+
+_HANDLERS = (
+    ((ADMIN_TICKET_CREATE, ADMIN_TICKET_UPDATE), _apply_ticket_events),
+    ((ADMIN_EPIC_CREATE,), _apply_epic_events),
+    ((ADMIN_ASSET_CREATE,), _apply_asset_events),
+)
+
+
+async def process_batch(session: AsyncSession, batch_size: Optional[int] = None) -> int:
+    """Apply up to ``batch_size`` pending events and commit; returns how many were applied.
+
+    Rows are claimed with FOR UPDATE SKIP LOCKED so several API workers can
+    run the loop against the same database without applying an event twice.
+    """
+    batch_size = batch_size or settings.outbox_batch_size
+    q = (
+        select(models.OutboxEvent)
+        .where(models.OutboxEvent.processed_at.is_(None))
+        .where(models.OutboxEvent.attempts < settings.outbox_max_attempts)
+        .order_by(models.OutboxEvent.id)
+        .limit(batch_size)
+        .with_for_update(skip_locked=True)
+    )
+    events = list((await session.execute(q)).scalars().all())
+    if not events:
+        await session.rollback()
+        return 0
+
+    payloads = {event.id: json.loads(event.payload) for event in events}
+    failed = []
+    for event_types, handler in _HANDLERS:
+        group = [e for e in events if e.event_type in event_types]
+        if not group:
+            continue
+        try:
+            async with session.begin_nested():
+                await handler(session, group, payloads)
+        except Exception as e:
+            logger.error(f"Outbox handler for {event_types} failed on {len(group)} events: {e}")
+            failed.extend((event, str(e)) for event in group)
+
+    now = datetime.utcnow()
+    failed_ids = {event.id for event, _ in failed}
+    done_ids = [e.id for e in events if e.id not in failed_ids]
+    if done_ids:
+        await session.execute(
+            update(models.OutboxEvent)
+            .where(models.OutboxEvent.id.in_(done_ids))
+            .values(processed_at=now, last_error=None)
+        )
+    dead = []
+    for event, error in failed:
+        await session.execute(
+            update(models.OutboxEvent)
+            .where(models.OutboxEvent.id == event.id)
+            .values(attempts=models.OutboxEvent.attempts + 1, last_error=error)
+        )
+        if event.attempts + 1 >= settings.outbox_max_attempts:
+            dead.append(f"Outbox event {event.id} ({event.event_type}) failed {event.attempts + 1} times and will not be retried: {error}")
+    await session.commit()
+    for message in dead:
+        logger.error(message)
+    return len(done_ids)
+
+
+async def purge_processed(session: AsyncSession) -> int:
+    """Delete events applied more than ``outbox_retention_hours`` ago; returns how many"""
+    cutoff = datetime.utcnow() - timedelta(hours=settings.outbox_retention_hours)
+    res = await session.execute(
+        delete(models.OutboxEvent)
+        .where(models.OutboxEvent.processed_at < cutoff)
+        .execution_options(synchronize_session=False)
+    )
+    await session.commit()
+    return res.rowcount
+
+
+async def stats(session: AsyncSession) -> dict:
+    """Pending and dead-lettered event counts, with the most recent dead letters"""
+    events = models.OutboxEvent
+    dead = events.attempts >= settings.outbox_max_attempts
+    res = await session.execute(
+        select(func.count(), dead)
+        .where(events.processed_at.is_(None))
+        .group_by(dead)
+    )
+    counts = {bool(is_dead): count for count, is_dead in res.all()}
+    res = await session.execute(
+        select(events).where(events.processed_at.is_(None), dead).order_by(events.id.desc()).limit(DEAD_LETTER_SAMPLE)
+    )
+    return {
+        "pending": counts.get(False, 0),
+        "dead_letters": counts.get(True, 0),
+        "recent_dead_letters": [
+            {
+                "id": event.id,
+                "event_type": event.event_type,
+                "payload": json.loads(event.payload),
+                "attempts": event.attempts,
+                "last_error": event.last_error,
+                "created_at": event.created_at,
+            }
+            for event in res.scalars().all()
+        ],
+    }
+
+
+async def run_worker() -> None:
+    """Drain the outbox until stop() is called, sleeping between polls when there is nothing to do"""
+    global _wakeup, _stopping
+    _wakeup = asyncio.Event()
+    _stopping = False
+    last_purge = 0.0
+    logger.info("Outbox worker started")
+    while not _stopping:
+        try:
+            async with database.async_session_maker() as session:
+                processed = await process_batch(session)
+                if not processed and time.monotonic() - last_purge >= PURGE_INTERVAL:
+                    last_purge = time.monotonic()
+                    purged = await purge_processed(session)
+                    if purged:
+                        logger.info(f"Purged {purged} applied outbox events")
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.error(f"Outbox worker error: {e}")
+            processed = 0
+        if processed or _stopping:
+            continue  # There may be more pending events
+        try:
+            await asyncio.wait_for(_wakeup.wait(), timeout=settings.outbox_poll_interval)
+        except asyncio.TimeoutError:
+            pass
+        _wakeup.clear()
+    logger.info("Outbox worker stopped")
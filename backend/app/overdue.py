@@ -0,0 +1,151 @@
+"""Background scan that flags tickets whose due date has passed while not Done.
+
+``tickets.overdue`` and the per-project counts in ``overdue_rollups`` are
+written only here, so overdue lists and dashboard counts are plain indexed
+reads instead of a pass over every ticket. Each scan looks at two small
+slices of the table, remembered in the ``overdue_scans`` row:
+
+* tickets due after ``due_watermark`` (the last day already scanned) and
+  before today, i.e. the due dates that fell since the previous run;
+* tickets edited since ``updated_watermark``, which catches due dates moved
+  into the past and tickets reopened.
+
+Flagged tickets that were closed or rescheduled since are cleared through
+the partial index on ``overdue``. Flags and counts are therefore as of the
+last scan, at most ``settings.overdue_scan_interval`` seconds old. Flag
+changes keep ``updated_at`` as it was, so they don't look like edits to
+``updated_since`` sync clients.
+
+Every API worker runs the loop, but on PostgreSQL a scan first takes a
+transaction-level advisory lock; workers that don't get it skip the round,
+so one scan runs at a time and its writes commit with the new watermarks.
+"""
+from datetime import date, datetime, timedelta
+from typing import Dict, Optional, Tuple
+import asyncio
+import logging
+
+from sqlalchemy import and_, delete, func, insert, or_, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from . import crud, database, models, rollups
+from .config import settings
+
+logger = logging.getLogger(__name__)
+
+# pg_try_advisory_xact_lock key shared by every API worker ("flow")
+LOCK_KEY = 0x666C6F77
+STATE_ID = 1
+DONE = "Done"
+
+_wakeup: Optional[asyncio.Event] = None
+_stopping = False
+
+
+async def _lead(session: AsyncSession) -> bool:
+    """Take the scan lock until this transaction ends; False when another worker holds it"""
+    if session.bind.dialect.name != "postgresql":
+        return True  # SQLite: a single process
+    return bool((await session.execute(select(func.pg_try_advisory_xact_lock(LOCK_KEY)))).scalar())
+
+
+async def scan(session: AsyncSession, today: Optional[date] = None) -> Optional[Tuple[int, int]]:
+    """Flag newly overdue tickets, clear stale flags and recount; returns (flagged, cleared).
+
+    Returns None without touching anything when another worker is scanning.
+    """
+    today = today or datetime.utcnow().date()
+    if not await _lead(session):
+        await session.rollback()
+        return None
+    state = await session.get(models.OverdueScan, STATE_ID, with_for_update=True)
+    if state is None:
+        state = models.OverdueScan(id=STATE_ID)
+        session.add(state)
+    updated_watermark = await crud.sync_timestamp(session)
+
+    tickets = models.Ticket
+    is_overdue = and_(tickets.status != DONE, tickets.due_date < today)
+    candidates = [~tickets.overdue, is_overdue]
+    if state.due_watermark is not None:
+        candidates.append(or_(tickets.due_date > state.due_watermark, tickets.updated_at >= state.updated_watermark))
+    flagged = await session.execute(
+        update(tickets).where(*candidates)
+        .values(overdue=True, updated_at=tickets.updated_at)
+        .execution_options(synchronize_session=False)
+    )
+    cleared = await session.execute(
+        update(tickets)
+        .where(tickets.overdue, or_(tickets.status == DONE, tickets.due_date.is_(None), tickets.due_date >= today))
+        .values(overdue=False, updated_at=tickets.updated_at)
+        .execution_options(synchronize_session=False)
+    )
+
+    # Recounted from the flagged rows only, which also drops deleted tickets
+    project = func.coalesce(models.AdminTicket.project_id, rollups.NO_PROJECT)
+    grouped = (
+        select(project, func.count())
+        .select_from(tickets)
+        .outerjoin(models.AdminTicket, models.AdminTicket.ticket_id == tickets.id)
+        .where(tickets.overdue)
+        .group_by(project)
+    )
+    await session.execute(delete(models.OverdueRollup))
+    await session.execute(insert(models.OverdueRollup).from_select(["project_id", "ticket_count"], grouped))
+
+    state.due_watermark = today - timedelta(days=1)
+    state.updated_watermark = updated_watermark
+    state.scanned_at = datetime.utcnow()
+    await session.commit()
+    return flagged.rowcount, cleared.rowcount
+
+
+async def summary(session: AsyncSession, project_id: Optional[int] = None) -> dict:
+    """Overdue counts by project as of the last scan"""
+    q = select(models.OverdueRollup)
+    if project_id is not None:
+        q = q.where(models.OverdueRollup.project_id == project_id)
+    by_project: Dict[str, int] = {}
+    for row in (await session.execute(q)).scalars().all():
+        project = str(row.project_id) if row.project_id != rollups.NO_PROJECT else "none"
+        by_project[project] = row.ticket_count
+    scanned_at = (await session.execute(
+        select(models.OverdueScan.scanned_at).where(models.OverdueScan.id == STATE_ID)
+    )).scalar()
+    return {
+        "project_id": project_id,
+        "total": sum(by_project.values()),
+        "by_project": by_project,
+        "scanned_at": scanned_at,
+    }
+
+
+def stop() -> None:
+    """Ask the worker to exit after the scan it is currently running"""
+    global _stopping
+    _stopping = True
+    if _wakeup is not None:
+        _wakeup.set()
+
+
+async def run_worker() -> None:
+    """Scan every ``settings.overdue_scan_interval`` seconds until stop() is called"""
+    global _wakeup, _stopping
+    _wakeup = asyncio.Event()
+    _stopping = False
+    logger.info("Overdue scanner started")
+    while not _stopping:
+        try:
+            async with database.async_session_maker() as session:
+                result = await scan(session)
+            if result and any(result):
+                logger.info(f"Overdue scan flagged {result[0]} and cleared {result[1]} tickets")
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.error(f"Overdue scan failed: {e}")
+        try:
+            await asyncio.wait_for(_wakeup.wait(), timeout=settings.overdue_scan_interval)
+        except asyncio.TimeoutError:
+            pass
+    logger.info("Overdue scanner stopped")
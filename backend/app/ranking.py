@@ -0,0 +1,141 @@
+"""Lexicographic ranks that order tickets within a Kanban column.
+
+A rank is a string of base-36 digits (0-9, a-z) compared byte by byte
+(the rank columns use the "C" collation on PostgreSQL). The first
+``INTEGER_WIDTH`` digits encode a millisecond timestamp, so new tickets
+rank after existing ones without reading anything; a card dropped between
+two others gets a rank strictly between theirs, which only ever rewrites
+the moved row. Ranks never end in "0", so a rank between any two distinct
+ranks always exists, but repeated drops into the same gap make it longer;
+once a rank exceeds ``settings.ticket_rank_max_length`` the rebalancer
+(app/rebalancer.py) respaces the ranks around it with ``spread_between``.
+"""
+from datetime import datetime
+from typing import List, Optional
+
+DIGITS = "0123456789abcdefghijklmnopqrstuvwxyz"
+BASE = len(DIGITS)
+INTEGER_WIDTH = 8  # 36**8 ms lasts until the year 2059
+
+_EPOCH = datetime(1970, 1, 1)
+
+
+class RankCollision(ValueError):
+    """The neighbours have equal or inverted ranks, so nothing fits between them"""
+
+
+def _encode(value: int) -> str:
+    digits = []
+    for _ in range(INTEGER_WIDTH):
+        value, digit = divmod(value, BASE)
+        digits.append(DIGITS[digit])
+    # Dropping trailing zeros keeps the order of fixed-width ranks
+    return "".join(reversed(digits)).rstrip("0")
+
+
+def _integer(rank: str) -> int:
+    value = 0
+    for char in rank[:INTEGER_WIDTH].ljust(INTEGER_WIDTH, "0"):
+        value = value * BASE + DIGITS.index(char)
+    return value
+
+
+def initial(now: Optional[datetime] = None) -> str:
+    """Rank of a new ticket: after every ticket created or rebalanced before ``now``"""
+    millis = int(((now or datetime.utcnow()) - _EPOCH).total_seconds() * 1000)
+    return _encode(millis)
+
+
+def _midpoint(low: str, high: Optional[str]) -> str:
+    """A rank strictly between ``low`` ("" = no lower bound) and ``high`` (None = no upper bound)"""
+    if high is not None:
+        shared = 0
+        while shared < len(high) and (low[shared] if shared < len(low) else "0") == high[shared]:
+            shared += 1
+        if shared:
+            return high[:shared] + _midpoint(low[shared:], high[shared:])
+    low_digit = DIGITS.index(low[0]) if low else 0
+    high_digit = DIGITS.index(high[0]) if high is not None else BASE
+    if high_digit - low_digit > 1:
+        return DIGITS[(low_digit + high_digit) // 2]
+    if high is not None and len(high) > 1:
+        return high[:1]
+    return DIGITS[low_digit] + _midpoint(low[1:], None)
+
+
+def between(prev: Optional[str], next: Optional[str]) -> str:
+    """Rank for a card dropped after ``prev`` and before ``next`` (None at either end of the column)"""
+    if prev is not None and next is not None:
+        if prev >= next:
+            raise RankCollision(f"No rank between {prev!r} and {next!r}")
+        return _midpoint(prev, next)
+    if prev is not None:
+        # Bottom of the column: the next millisecond after prev
+        value = _integer(prev) + 1
+        return _encode(value) if value < BASE ** INTEGER_WIDTH else _midpoint(prev, None)
+    if next is not None:
+        # Top of the column: the millisecond before next, or within it
+        value = _integer(next) - (0 if len(next) > INTEGER_WIDTH else 1)
+        candidate = _encode(value) if value > 0 else ""
+        return candidate if candidate and candidate < next else _midpoint("", next)
+    return initial()
+
+
+def sequence(count: int, now: Optional[datetime] = None) -> List[str]:
+    """``count`` increasing ranks for tickets created together, all within the millisecond of ``initial(now)``"""
+    base = initial(now).ljust(INTEGER_WIDTH, "0")
+    width = 1
+    while BASE ** width <= count:
+        width += 1
+    ranks = []
+    for value in range(1, count + 1):
+        digits = []
+        for _ in range(width):
+            value, digit = divmod(value, BASE)
+            digits.append(DIGITS[digit])
+        # A fixed-width fraction after the padded timestamp, trailing zeros dropped as in _encode
+        ranks.append(base + "".join(reversed(digits)).rstrip("0"))
+    return ranks
+
+
+def spread(count: int, now: Optional[datetime] = None) -> List[str]:
+    """``count`` evenly spaced short ranks, in order, all below ``initial(now)``"""
+    step = _integer(initial(now)) // (count + 1)
+    if step < 1:
+        raise ValueError(f"Cannot spread {count} ranks")
+    return [_encode(step * (i + 1)) for i in range(count)]
+
+
+
+def _fixed(rank: str, width: int) -> int:
+    """``rank`` read as a ``width``-digit number (shorter ranks are padded with zeros)"""
+    value = 0
+    for char in rank[:width].ljust(width, "0"):
+        value = value * BASE + DIGITS.index(char)
+    return value
+
+
+def spread_between(prev: Optional[str], next: Optional[str], count: int) -> List[str]:
+    """``count`` evenly spaced ranks, in order, strictly between ``prev`` and ``next`` (None = open end).
+
+    The ranks are no longer than the longer bound plus the few digits
+    needed to fit ``count`` of them into the gap.
+    """
+    low = prev or ""
+    if next is not None and low >= next:
+        raise RankCollision(f"No rank between {prev!r} and {next!r}")
+    width = max(len(low), len(next or ""), 1)
+    while True:
+        low_value = _fixed(low, width)
+        high_value = _fixed(next, width) if next is not None else BASE ** width
+        step = (high_value - low_value) // (count + 1)
+        if step >= 1:
+            ranks = []
+            for i in range(1, count + 1):
+                value, digits = low_value + step * i, []
+                for _ in range(width):
+                    value, digit = divmod(value, BASE)
+                    digits.append(DIGITS[digit])
+                ranks.append("".join(reversed(digits)).rstrip("0"))
+            return ranks
+        width += 1
@@ -0,0 +1,57 @@
+"""Background respacing of ticket ranks once they get too long.
+
+``POST /tickets/{id}/move`` calls ``request`` when the rank it wrote is
+longer than ``settings.ticket_rank_max_length``. The worker started from
+``app.main`` then runs ``crud.rebalance_ticket_ranks`` once, however many
+moves asked for it in the meantime. Moves never wait for it: a long rank is
+still a valid rank, just a less compact one.
+"""
+from typing import Optional
+import asyncio
+import logging
+
+from . import crud, database
+from .config import settings
+
+logger = logging.getLogger(__name__)
+
+_wanted: Optional[asyncio.Event] = None
+_stopping = False
+
+
+def needed(rank: str) -> bool:
+    return len(rank) > settings.ticket_rank_max_length
+
+
+def request() -> None:
+    """Ask the worker to rebalance soon (no-op when it isn't running)"""
+    if _wanted is not None:
+        _wanted.set()
+
+
+def stop() -> None:
+    global _stopping
+    _stopping = True
+    request()
+
+
+async def run_worker() -> None:
+    """Rebalance whenever requested, until stop() is called"""
+    global _wanted, _stopping
+    _wanted = asyncio.Event()
+    _stopping = False
+    logger.info("Rank rebalancer started")
+    while True:
+        await _wanted.wait()
+        _wanted.clear()
+        if _stopping:
+            break
+        try:
+            async with database.async_session_maker() as session:
+                count = await crud.rebalance_ticket_ranks(session)
+            logger.info(f"Rebalanced ranks of {count} tickets")
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.error(f"Rank rebalance failed: {e}")
+    logger.info("Rank rebalancer stopped")
@@ -0,0 +1,116 @@
+"""Ticket counts per (project, status, priority, assignee) for the dashboard.
+
+``ticket_rollups`` mirrors ``SELECT project_id, status, priority, assignee,
+count(*) FROM admin_tickets GROUP BY 1, 2, 3, 4``. Every write path that
+inserts, deletes or re-keys an admin_tickets row collects +1/-1 deltas with
+``add`` and applies them with ``apply`` inside its own transaction, so the
+counts commit (or roll back) together with the ticket. ``rebuild``
+recomputes the table from scratch to repair drift.
+
+The key columns are part of the primary key, so a missing project or
+assignee is stored as 0 / '' rather than NULL.
+"""
+from typing import Dict, Optional, Tuple
+
+from sqlalchemy import delete, func, insert, select
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from . import models
+
+RollupKey = Tuple[int, str, str, str]
+
+NO_PROJECT = 0
+UNASSIGNED = ""
+
+KEY_FIELDS = ("project_id", "status", "priority", "assignee")
+
+
+def key(project_id: Optional[int], status: Optional[str], priority: Optional[str], assignee: Optional[str]) -> RollupKey:
+    return (project_id or NO_PROJECT, status or "", priority or "", assignee or UNASSIGNED)
+
+
+def key_of(row) -> RollupKey:
+    """Rollup key of an admin_tickets row (ORM object or result row)"""
+    return key(row.project_id, row.status, row.priority, row.assignee)
+
+
+def add(deltas: Dict[RollupKey, int], rollup_key: RollupKey, amount: int) -> None:
+    deltas[rollup_key] = deltas.get(rollup_key, 0) + amount
+
+
+def move(deltas: Dict[RollupKey, int], old_key: RollupKey, new_key: RollupKey) -> None:
+    """Record a ticket changing from one key to another (no-op when unchanged)"""
+    if old_key != new_key:
+        add(deltas, old_key, -1)
+        add(deltas, new_key, +1)
+
+
+def _upsert(session: AsyncSession):
+    dialect = postgresql if session.bind.dialect.name == "postgresql" else sqlite
+    return dialect.insert(models.TicketRollup)
+
+
+async def apply(session: AsyncSession, deltas: Dict[RollupKey, int]) -> None:
+    """Add ``deltas`` to the counts with one executemany upsert, in the caller's transaction"""
+    params = [
+        dict(zip(KEY_FIELDS, rollup_key), ticket_count=amount)
+        # Sorted so concurrent writers lock rows in the same order
+        for rollup_key, amount in sorted(deltas.items())
+        if amount
+    ]
+    if not params:
+        return
+    stmt = _upsert(session)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=list(KEY_FIELDS),
+        set_={"ticket_count": models.TicketRollup.ticket_count + stmt.excluded.ticket_count},
+    )
+    await session.execute(stmt, params)
+
+
+async def rebuild(session: AsyncSession) -> int:
+    """Recompute every count from admin_tickets; returns the number of rollup rows written"""
+    tickets = models.AdminTicket
+    # Same NULL handling as key()
+    columns = (
+        func.coalesce(tickets.project_id, NO_PROJECT),
+        func.coalesce(tickets.status, ""),
+        func.coalesce(tickets.priority, ""),
+        func.coalesce(tickets.assignee, UNASSIGNED),
+    )
+    grouped = select(*columns, func.count()).group_by(*columns)
+    await session.execute(delete(models.TicketRollup))
+    res = await session.execute(
+        insert(models.TicketRollup).from_select([*KEY_FIELDS, "ticket_count"], grouped)
+    )
+    await session.commit()
+    return res.rowcount
+
+
+async def summary(session: AsyncSession, project_id: Optional[int] = None) -> dict:
+    """Ticket counts by status, priority, assignee and project from the rollup table"""
+    q = select(models.TicketRollup).where(models.TicketRollup.ticket_count > 0)
+    if project_id is not None:
+        q = q.where(models.TicketRollup.project_id == project_id)
+    rows = (await session.execute(q)).scalars().all()
+
+    by_status: Dict[str, int] = {}
+    by_priority: Dict[str, int] = {}
+    by_assignee: Dict[str, int] = {}
+    by_project: Dict[str, int] = {}
+    for row in rows:
+        by_status[row.status] = by_status.get(row.status, 0) + row.ticket_count
+        by_priority[row.priority] = by_priority.get(row.priority, 0) + row.ticket_count
+        assignee = row.assignee or "Unassigned"
+        by_assignee[assignee] = by_assignee.get(assignee, 0) + row.ticket_count
+        project = str(row.project_id) if row.project_id != NO_PROJECT else "none"
+        by_project[project] = by_project.get(project, 0) + row.ticket_count
+    return {
+        "project_id": project_id,
+        "total": sum(by_status.values()),
+        "by_status": by_status,
+        "by_priority": by_priority,
+        "by_assignee": by_assignee,
+        "by_project": by_project,
+    }
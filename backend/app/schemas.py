@@ -1,5 +1,5 @@
 from pydantic import BaseModel, EmailStr, Field, field_validator
-from typing import Optional
+from typing import Dict, Optional
 from datetime import datetime
 from enum import Enum
 from datetime import date
@@ -329,12 +329,20 @@ class TicketOut(BaseModel):
     reporter: Optional[str] = None  # Email of user who created/assigned the ticket
     start_date: Optional[date] = None
     due_date: Optional[date] = None
+    rank: Optional[str] = None  # Board order; compare as plain strings
+    overdue: bool = False  # As of the last overdue scan
     created_at: Optional[datetime] = None
     updated_at: Optional[datetime] = None
 
     class Config:
         from_attributes = True
 
+class TicketMove(BaseModel):
+    """Where a card was dropped: between the cards now above and below it (ticket ids)"""
+    prev_id: Optional[int] = None  # None at the top of the column
+    next_id: Optional[int] = None  # None at the bottom of the column
+    status: Optional[str] = None  # New column, when moved across columns
+
 # AdminEpic Schemas
 class AdminEpicCreate(BaseModel):
     epic_id: int
@@ -407,12 +415,34 @@ class AdminTicketOut(BaseModel):
     reporter: Optional[str] = None  # Email of user who created/assigned the ticket
     start_date: Optional[date] = None
     due_date: Optional[date] = None
+    rank: Optional[str] = None  # Board order, copied from the ticket
     created_at: Optional[datetime] = None
     updated_at: Optional[datetime] = None
 
     class Config:
         from_attributes = True
 
+# Batch update of admin tickets (Kanban drag-and-drop)
+class AdminTicketBatchItem(BaseModel):
+    admin_ticket_id: int
+    fields: AdminTicketUpdate
+
+class AdminTicketBatchResult(BaseModel):
+    admin_ticket_id: int
+    ok: bool
+    detail: Optional[str] = None
+    ticket: Optional[AdminTicketOut] = None
+
+# Deleted rows reported to delta-sync clients
+class TombstoneOut(BaseModel):
+    entity: str
+    entity_id: int
+    project_id: Optional[int] = None
+    deleted_at: Optional[datetime] = None
+
+    class Config:
+        from_attributes = True
+
 # UsersManagement Schemas
 class UsersManagementCreate(BaseModel):
     first_name: str
@@ -468,6 +498,29 @@ class UsersManagementOut(BaseModel):
     class Config:
         from_attributes = True
 
+class DashboardSummary(BaseModel):
+    project_id: Optional[int] = None
+    total: int
+    by_status: Dict[str, int]
+    by_priority: Dict[str, int]
+    by_assignee: Dict[str, int]
+    by_project: Dict[str, int]
+
+class OverdueSummary(BaseModel):
+    project_id: Optional[int] = None
+    total: int
+    by_project: Dict[str, int]
+    scanned_at: Optional[datetime] = None  # None until the first scan
+
+class UserSearchResult(BaseModel):
+    id: int
+    email: str
+    first_name: str
+    last_name: str
+
+    class Config:
+        from_attributes = True
+
 # UserProfile Schemas
 class UserProfileCreate(BaseModel):
     full_name: str
@@ -0,0 +1,103 @@
+"""Password hashing on a dedicated, bounded thread pool.
+
+bcrypt is deliberately slow (tens of milliseconds per call), so running it
+on the event loop stalls every other request on the worker. Calls are sent
+to a small executor instead; once ``password_hash_max_queue`` calls are
+waiting behind the busy threads, new ones raise ``PasswordHasherBusy``
+(a 503 in ``app.main``) rather than queueing without bound. Queue depth
+and latency are served at ``/health/password-hashing`` and ``/metrics``.
+"""
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict
+import asyncio
+import threading
+import time
+
+import bcrypt
+
+from .config import settings
+
+_executor = ThreadPoolExecutor(
+    max_workers=settings.password_hash_workers,
+    thread_name_prefix="password-hash",
+)
+_lock = threading.Lock()
+_pending = 0
+
+# Latency stats per operation ("hash" / "verify"), exposed via stats()
+_stats: Dict[str, Dict[str, float]] = {
+    op: {"count": 0, "total_seconds": 0.0, "max_seconds": 0.0}
+    for op in ("hash", "verify")
+}
+_rejected = 0
+
+
+class PasswordHasherBusy(Exception):
+    """Raised when the hashing queue is full"""
+
+    retry_after = 1  # seconds
+
+    def __init__(self):
+        super().__init__("Server is busy processing logins, please retry shortly")
+
+
+def _password_bytes(password: str) -> bytes:
+    # bcrypt only uses the first 72 bytes
+    return password.encode("utf-8")[:72]
+
+
+def _record(op: str, seconds: float) -> None:
+    with _lock:
+        entry = _stats[op]
+        entry["count"] += 1
+        entry["total_seconds"] += seconds
+        entry["max_seconds"] = max(entry["max_seconds"], seconds)
+
+
+async def _run(op: str, fn, *args):
+    global _pending, _rejected
+    with _lock:
+        if _pending >= settings.password_hash_workers + settings.password_hash_max_queue:
+            _rejected += 1
+            raise PasswordHasherBusy()
+        _pending += 1
+    try:
+        start = time.perf_counter()
+        result = await asyncio.get_running_loop().run_in_executor(_executor, fn, *args)
+        _record(op, time.perf_counter() - start)
+        return result
+    finally:
+        with _lock:
+            _pending -= 1
+
+
+async def hash_password(password: str) -> str:
+    """Return the bcrypt hash of ``password`` as a string"""
+    hashed = await _run("hash", bcrypt.hashpw, _password_bytes(password), bcrypt.gensalt())
+    return hashed.decode("utf-8")
+
+
+async def verify_password(password: str, hashed_password: str) -> bool:
+    """Check ``password`` against a stored bcrypt hash"""
+    return await _run("verify", bcrypt.checkpw, _password_bytes(password), hashed_password.encode("utf-8"))
+
+
+def stats() -> dict:
+    """Snapshot of queue depth and hash/verify latency"""
+    with _lock:
+        operations = {
+            op: {
+                "count": int(entry["count"]),
+                "avg_ms": round(entry["total_seconds"] / entry["count"] * 1000, 2) if entry["count"] else 0.0,
+                "max_ms": round(entry["max_seconds"] * 1000, 2),
+                "total_seconds": entry["total_seconds"],
+            }
+            for op, entry in _stats.items()
+        }
+        return {
+            "workers": settings.password_hash_workers,
+            "max_queue": settings.password_hash_max_queue,
+            "pending": _pending,
+            "rejected": _rejected,
+            "operations": operations,
+        }
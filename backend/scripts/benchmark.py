@@ -0,0 +1,227 @@
+"""
+Load benchmark for a running FlowTrack API.
+
+Drives a weighted mix of the main read and write routes from concurrent
+workers for a fixed duration, then reports p50/p95/p99 latency and
+throughput per route. Results are written as JSON (with the git commit they
+were measured on) so runs can be compared across commits. Seed the database
+first with scripts/seed_data.py; ids to hit are discovered through the API.
+
+Usage:
+  uvicorn app.main:app --port 8000
+  python .\\scripts\\benchmark.py --base-url http://localhost:8000 --concurrency 32 --duration 60
+
+Options:
+  --base-url URL      API to drive (default http://localhost:8000)
+  --concurrency N     concurrent workers (default 16)
+  --duration SECONDS  measured run length (default 30)
+  --warmup SECONDS    unmeasured run before measuring (default 5)
+  --read-only         skip the write routes
+  --routes A,B        only run these routes (names as printed in the report)
+  --output PATH       JSON results file (default benchmarks/<timestamp>.json)
+  --seed N            random seed for the request mix (default 1)
+
+Requires httpx (see requirements-dev.txt).
+"""
+import argparse
+import asyncio
+import json
+import math
+import os
+import random
+import subprocess
+import sys
+import time
+from datetime import datetime
+
+import httpx
+
+
+def parse_args(argv):
+    parser = argparse.ArgumentParser(description="Benchmark the FlowTrack API")
+    parser.add_argument("--base-url", default="http://localhost:8000")
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--duration", type=float, default=30.0)
+    parser.add_argument("--warmup", type=float, default=5.0)
+    parser.add_argument("--read-only", action="store_true")
+    parser.add_argument("--routes", default=None)
+    parser.add_argument("--output", default=None)
+    parser.add_argument("--seed", type=int, default=1)
+    return parser.parse_args(argv)
+
+
+class Targets:
+    """Ids and emails discovered from the API, used to build requests"""
+
+    def __init__(self, projects, epics_by_project, ticket_ids, admin_ticket_ids, emails):
+        self.projects = projects
+        self.epics_by_project = epics_by_project
+        self.ticket_ids = ticket_ids
+        self.admin_ticket_ids = admin_ticket_ids
+        self.emails = emails
+
+
+async def discover(client: httpx.AsyncClient) -> Targets:
+    projects = [p["id"] for p in (await client.get("/projects")).json()]
+    emails = [u["email"] for u in (await client.get("/users-management")).json()]
+    ticket_ids = [t["id"] for t in (await client.get("/tickets", params={"limit": 500})).json()]
+    epics_by_project, admin_ticket_ids = {}, []
+    for project_id in projects[:20]:
+        epics = (await client.get("/epics", params={"project_id": project_id})).json()
+        epics_by_project[project_id] = [e["id"] for e in epics]
+        admin = (await client.get("/admin/tickets", params={"project_id": project_id})).json()
+        admin_ticket_ids += [t["admin_ticket_id"] for t in admin[:50]]
+    if not (projects and emails and ticket_ids):
+        raise SystemExit("No data to benchmark against; run scripts/seed_data.py first")
+    return Targets(projects, epics_by_project, ticket_ids, admin_ticket_ids, emails)
+
+
+# name -> (weight, writes?, request builder returning (method, path, kwargs))
+def _scenarios():
+    return {
+        "GET /tickets?limit=50": (20, False, lambda t, r: ("GET", "/tickets", {"params": {"limit": 50}})),
+        "GET /tickets/{id}": (15, False, lambda t, r: ("GET", f"/tickets/{r.choice(t.ticket_ids)}", {})),
+        "GET /projects?user_email": (10, False, lambda t, r: ("GET", "/projects", {"params": {"user_email": r.choice(t.emails)}})),
+        "GET /epics?project_id": (5, False, lambda t, r: ("GET", "/epics", {"params": {"project_id": r.choice(t.projects)}})),
+        "GET /admin/tickets?project_id": (10, False, lambda t, r: ("GET", "/admin/tickets", {"params": {"project_id": r.choice(list(t.epics_by_project))}})),
+        "GET /users-management": (3, False, lambda t, r: ("GET", "/users-management", {})),
+        "GET /users-management/email/{email}": (10, False, lambda t, r: ("GET", f"/users-management/email/{r.choice(t.emails)}", {})),
+        "POST /tickets": (8, True, _create_ticket),
+        "PUT /tickets/{id}": (8, True, lambda t, r: ("PUT", f"/tickets/{r.choice(t.ticket_ids)}", {"json": {"status": r.choice(["Open", "In Progress", "Done"])}})),
+        "PATCH /admin/tickets/batch": (3, True, _batch_move),
+    }
+
+
+def _create_ticket(t, r):
+    project_id = r.choice(list(t.epics_by_project))
+    epics = t.epics_by_project[project_id]
+    params = {"project_id": project_id}
+    if epics:
+        params["epic_id"] = r.choice(epics)
+    body = {"user_id": 1, "title": "Benchmark ticket", "assignee": r.choice(t.emails), "priority": "Medium"}
+    return "POST", "/tickets", {"params": params, "json": body}
+
+
+def _batch_move(t, r):
+    ids = r.sample(t.admin_ticket_ids, min(5, len(t.admin_ticket_ids)))
+    status = r.choice(["Open", "In Progress", "Done"])
+    return "PATCH", "/admin/tickets/batch", {"json": [{"admin_ticket_id": i, "fields": {"status": status}} for i in ids]}
+
+
+async def worker(client, targets, scenarios, rng, deadline, samples):
+    names = list(scenarios)
+    weights = [scenarios[name][0] for name in names]
+    while time.perf_counter() < deadline:
+        name = rng.choices(names, weights)[0]
+        method, path, kwargs = scenarios[name][2](targets, rng)
+        start = time.perf_counter()
+        try:
+            response = await client.request(method, path, **kwargs)
+            ok = response.status_code < 400
+        except httpx.HTTPError:
+            ok = False
+        if samples is not None:
+            samples.setdefault(name, []).append((time.perf_counter() - start, ok))
+
+
+async def run_phase(client, targets, scenarios, args, seconds, record):
+    samples = {} if record else None
+    deadline = time.perf_counter() + seconds
+    rngs = [random.Random(args.seed * 1000 + i) for i in range(args.concurrency)]
+    started = time.perf_counter()
+    await asyncio.gather(*(worker(client, targets, scenarios, rng, deadline, samples) for rng in rngs))
+    return samples, time.perf_counter() - started
+
+
+def percentile(sorted_values, pct):
+    if not sorted_values:
+        return 0.0
+    # Nearest-rank percentile
+    index = max(0, math.ceil(pct / 100.0 * len(sorted_values)) - 1)
+    return sorted_values[index]
+
+
+def summarize(samples, elapsed):
+    routes = {}
+    for name, entries in sorted(samples.items()):
+        latencies = sorted(seconds * 1000 for seconds, _ in entries)
+        routes[name] = {
+            "requests": len(entries),
+            "errors": sum(1 for _, ok in entries if not ok),
+            "throughput_rps": round(len(entries) / elapsed, 2),
+            "mean_ms": round(sum(latencies) / len(latencies), 2),
+            "p50_ms": round(percentile(latencies, 50), 2),
+            "p95_ms": round(percentile(latencies, 95), 2),
+            "p99_ms": round(percentile(latencies, 99), 2),
+            "max_ms": round(latencies[-1], 2),
+        }
+    total = sum(r["requests"] for r in routes.values())
+    return {
+        "elapsed_seconds": round(elapsed, 2),
+        "total_requests": total,
+        "total_errors": sum(r["errors"] for r in routes.values()),
+        "throughput_rps": round(total / elapsed, 2) if elapsed else 0.0,
+        "routes": routes,
+    }
+
+
+def git_commit():
+    try:
+        return subprocess.check_output(["git", "rev-parse", "HEAD"], stderr=subprocess.DEVNULL, text=True).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def print_report(summary):
+    print(f"{'route':<40} {'reqs':>7} {'err':>5} {'rps':>8} {'p50':>8} {'p95':>8} {'p99':>8}")
+    for name, r in summary["routes"].items():
+        print(f"{name:<40} {r['requests']:>7} {r['errors']:>5} {r['throughput_rps']:>8} {r['p50_ms']:>8} {r['p95_ms']:>8} {r['p99_ms']:>8}")
+    print(f"total: {summary['total_requests']} requests, {summary['total_errors']} errors, {summary['throughput_rps']} req/s")
+
+
+async def main(argv):
+    args = parse_args(argv)
+    scenarios = _scenarios()
+    if args.read_only:
+        scenarios = {name: s for name, s in scenarios.items() if not s[1]}
+    if args.routes:
+        wanted = {name.strip() for name in args.routes.split(",")}
+        scenarios = {name: s for name, s in scenarios.items() if name in wanted}
+    if not scenarios:
+        print("No routes selected")
+        return 2
+
+    limits = httpx.Limits(max_connections=args.concurrency, max_keepalive_connections=args.concurrency)
+    async with httpx.AsyncClient(base_url=args.base_url, limits=limits, timeout=30.0) as client:
+        targets = await discover(client)
+        if args.warmup > 0:
+            await run_phase(client, targets, scenarios, args, args.warmup, record=False)
+        samples, elapsed = await run_phase(client, targets, scenarios, args, args.duration, record=True)
+
+    summary = summarize(samples, elapsed)
+    print_report(summary)
+
+    result = {
+        "timestamp": datetime.utcnow().isoformat(),
+        "commit": git_commit(),
+        "config": {
+            "base_url": args.base_url,
+            "concurrency": args.concurrency,
+            "duration": args.duration,
+            "warmup": args.warmup,
+            "read_only": args.read_only,
+            "seed": args.seed,
+        },
+        **summary,
+    }
+    output = args.output or os.path.join("benchmarks", datetime.utcnow().strftime("%Y%m%dT%H%M%S") + ".json")
+    os.makedirs(os.path.dirname(output) or ".", exist_ok=True)
+    with open(output, "w") as f:
+        json.dump(result, f, indent=2)
+    print(f"Results written to {output}")
+    return 0
+
+
+if __name__ == "__main__":
+    code = asyncio.run(main(sys.argv[1:]))
+    sys.exit(code)
@@ -0,0 +1,49 @@
+"""
+FlowTrack operations CLI.
+
+  flowtrack db upgrade   apply pending Alembic migrations (an empty database
+                         gets every table created and stamped at head)
+  flowtrack db check     exit 1 unless the database is at the head revision,
+                         the same check API workers run at startup
+
+Run this before starting or rolling the API workers; they no longer create
+tables themselves (see DB_BOOT_MODE in env.template).
+
+Usage:
+  set PYTHONPATH=%CD% & python .\\scripts\\flowtrack.py db upgrade   (PowerShell: $env:PYTHONPATH=(Get-Location).Path; python ...)
+"""
+import argparse
+import asyncio
+import sys
+
+from app import database, migrations
+
+
+def parse_args(argv):
+    parser = argparse.ArgumentParser(prog="flowtrack", description="FlowTrack operations")
+    commands = parser.add_subparsers(dest="group", required=True)
+    db = commands.add_parser("db", help="database schema")
+    db.add_argument("action", choices=["upgrade", "check"])
+    return parser.parse_args(argv)
+
+
+async def main(argv):
+    args = parse_args(argv)
+    try:
+        if args.action == "upgrade":
+            outcome = await migrations.upgrade(database.engine)
+            print(f"Database {outcome} at revision {migrations.head_revision()}.")
+        else:
+            revision = await migrations.check(database.engine)
+            print(f"Database is at revision {revision}.")
+        return 0
+    except migrations.SchemaMismatch as e:
+        print(e, file=sys.stderr)
+        return 1
+    finally:
+        await database.engine.dispose()
+
+
+if __name__ == "__main__":
+    code = asyncio.run(main(sys.argv[1:]))
+    sys.exit(code)
@@ -0,0 +1,25 @@
+"""
+Rebuild the ticket_rollups table behind GET /dashboard/summary from admin_tickets.
+
+Rollups are normally maintained incrementally by the admin ticket write paths;
+run this to repair drift (e.g. after manual SQL edits or a failed deploy).
+
+Usage:
+  set PYTHONPATH=%CD% & python .\scripts\rebuild_dashboard_rollups.py   (PowerShell: $env:PYTHONPATH=(Get-Location).Path; python ...)
+"""
+import sys
+import asyncio
+from app import database, rollups
+
+
+async def main():
+    async with database.async_session_maker() as session:
+        written = await rollups.rebuild(session)
+    print(f"Rebuilt {written} dashboard rollup rows.")
+    await database.engine.dispose()
+    return 0
+
+
+if __name__ == "__main__":
+    code = asyncio.run(main())
+    sys.exit(code)
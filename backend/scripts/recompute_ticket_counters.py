@@ -0,0 +1,25 @@
+"""
+Rebuild users_management.tickets_issued / tickets_resolved from the tickets table.
+
+Counters are normally maintained incrementally by the ticket write paths; run
+this to repair drift (e.g. after manual SQL edits or a failed deploy).
+
+Usage:
+  set PYTHONPATH=%CD% & python .\scripts\recompute_ticket_counters.py   (PowerShell: $env:PYTHONPATH=(Get-Location).Path; python ...)
+"""
+import sys
+import asyncio
+from app import crud, database
+
+
+async def main():
+    async with database.async_session_maker() as session:
+        updated = await crud.recompute_ticket_counters(session)
+    print(f"Recomputed ticket counters for {updated} users.")
+    await database.engine.dispose()
+    return 0
+
+
+if __name__ == "__main__":
+    code = asyncio.run(main())
+    sys.exit(code)
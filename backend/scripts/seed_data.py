@@ -0,0 +1,216 @@
+"""
+Fill the configured database with synthetic FlowTrack data for load testing.
+
+Generates users_management rows (with matching user_profile rows), projects
+with lead/member rosters, epics and tickets per project together with their
+admin_* mirrors, and assets. Rows are written with multi-row INSERTs in
+batches, then ticket counters and dashboard rollups are recomputed. A fixed --seed makes runs
+reproducible; --tag keeps emails and project keys unique across runs.
+
+Usage:
+  set PYTHONPATH=%CD% & python .\\scripts\\seed_data.py --projects 50 --tickets-per-project 200   (PowerShell: $env:PYTHONPATH=(Get-Location).Path; python ...)
+
+Options:
+  --users N                 users_management rows (default 200)
+  --projects N              projects (default 20)
+  --epics-per-project N     epics per project (default 5)
+  --tickets-per-project N   tickets per project (default 100)
+  --assets N                assets (default 500)
+  --batch-size N            rows per INSERT (default 1000)
+  --seed N                  random seed (default 42)
+  --tag TEXT                suffix for generated emails/keys (default: the seed)
+"""
+import argparse
+import asyncio
+import random
+import sys
+from datetime import date, datetime, timedelta
+
+from sqlalchemy import insert
+
+from app import crud, database, models, ranking, rollups
+
+FIRST_NAMES = ["Asha", "Ben", "Chen", "Divya", "Elena", "Farid", "Grace", "Hiro", "Ines", "Jon", "Kavya", "Liam", "Maya", "Nikhil", "Olga", "Priya", "Ravi", "Sara", "Tom", "Uma"]
+LAST_NAMES = ["Rao", "Smith", "Kumar", "Garcia", "Ito", "Nair", "Brown", "Singh", "Lopez", "Reddy", "Chen", "Patel"]
+ROLES = ["Developer", "Developer", "Developer", "Tester", "Designer", "Manager"]
+DEPARTMENTS = ["Engineering", "Engineering", "QA", "Design", "Operations"]
+TICKET_STATUSES = ["Open", "Open", "In Progress", "In Progress", "Done"]
+PRIORITIES = ["Low", "Medium", "Medium", "High"]
+WORDS = ["login", "board", "sync", "export", "profile", "dashboard", "search", "report", "cache", "upload", "filter", "timeline", "billing", "alert", "import"]
+VERBS = ["Fix", "Add", "Refactor", "Investigate", "Speed up", "Document", "Remove", "Test"]
+ASSET_TYPES = ["Laptop", "Charger", "NetworkIssue"]
+ASSET_STATUSES = ["Open", "Assigned", "Closed"]
+
+
+def parse_args(argv):
+    parser = argparse.ArgumentParser(description="Seed the database with synthetic FlowTrack data")
+    parser.add_argument("--users", type=int, default=200)
+    parser.add_argument("--projects", type=int, default=20)
+    parser.add_argument("--epics-per-project", type=int, default=5)
+    parser.add_argument("--tickets-per-project", type=int, default=100)
+    parser.add_argument("--assets", type=int, default=500)
+    parser.add_argument("--batch-size", type=int, default=1000)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--tag", default=None)
+    return parser.parse_args(argv)
+
+
+async def insert_rows(session, model, rows, batch_size, returning=None):
+    """Insert rows in batches; with ``returning`` the generated values are collected in order"""
+    generated = []
+    for start in range(0, len(rows), batch_size):
+        batch = rows[start:start + batch_size]
+        if returning is None:
+            await session.execute(insert(model), batch)
+        else:
+            stmt = insert(model).returning(returning, sort_by_parameter_order=True)
+            res = await session.execute(stmt, batch)
+            generated.extend(res.scalars().all())
+    return generated
+
+
+def make_users(rng, count, tag):
+    users = []
+    for i in range(count):
+        first, last = rng.choice(FIRST_NAMES), rng.choice(LAST_NAMES)
+        users.append({
+            "first_name": first,
+            "last_name": last,
+            "email": f"{first.lower()}.{last.lower()}.{i}.{tag}@seed.flowtrack.dev",
+            "role": rng.choice(ROLES),
+            "department": rng.choice(DEPARTMENTS),
+            "tickets_issued": 0,
+            "tickets_resolved": 0,
+            "active": rng.random() > 0.05,
+            "language": "English",
+            "date_format": "YYYY-MM-DD",
+            "password_reset_needed": False,
+        })
+    return users
+
+
+def make_ticket(rng, emails, today):
+    start = today - timedelta(days=rng.randint(0, 120))
+    return {
+        "user_id": 1,
+        "title": f"{rng.choice(VERBS)} {rng.choice(WORDS)} {rng.choice(WORDS)}",
+        "description": " ".join(rng.choice(WORDS) for _ in range(rng.randint(5, 30))),
+        "status": rng.choice(TICKET_STATUSES),
+        "priority": rng.choice(PRIORITIES),
+        "assignee": rng.choice(emails) if rng.random() > 0.1 else None,
+        "reporter": rng.choice(emails),
+        "start_date": start,
+        "due_date": start + timedelta(days=rng.randint(1, 45)),
+    }
+
+
+async def seed(args):
+    rng = random.Random(args.seed)
+    tag = args.tag or str(args.seed)
+    today = date.today()
+
+    async with database.async_session_maker() as session:
+        users = make_users(rng, args.users, tag)
+        user_ids = await insert_rows(session, models.UsersManagement, users, args.batch_size, returning=models.UsersManagement.id)
+        await insert_rows(session, models.UserProfile, [
+            {"users_management_id": user_id, **crud._profile_values(models.UsersManagement(**u))}
+            for user_id, u in zip(user_ids, users)
+        ], args.batch_size)
+        emails = [u["email"] for u in users]
+        print(f"Inserted {len(users)} users")
+
+        projects = []
+        for i in range(args.projects):
+            team = rng.sample(emails, min(len(emails), rng.randint(3, 12)))
+            projects.append({
+                "name": f"{rng.choice(WORDS).title()} {rng.choice(WORDS).title()} {i}",
+                "project_key": f"S{tag}-{i}"[:50],
+                "project_type": "Software",
+                "leads": ", ".join(team[:2]),
+                "team_members": ", ".join(team[2:]),
+                "description": f"Synthetic project {i}",
+            })
+        project_ids = await insert_rows(session, models.Project, projects, args.batch_size, returning=models.Project.id)
+        members = []
+        for project_id, project in zip(project_ids, projects):
+            for role, column in (("lead", "leads"), ("member", "team_members")):
+                for email in crud._split_emails(project[column]):
+                    members.append({"project_id": project_id, "user_email": email, "role": role})
+        await insert_rows(session, models.ProjectMember, members, args.batch_size)
+        print(f"Inserted {len(projects)} projects")
+
+        epics = [
+            {"project_id": project_id, "name": f"{rng.choice(WORDS).title()} epic {j}"}
+            for project_id in project_ids
+            for j in range(args.epics_per_project)
+        ]
+        epic_ids = await insert_rows(session, models.Epic, epics, args.batch_size, returning=models.Epic.id)
+        project_names = {project_id: p["name"] for project_id, p in zip(project_ids, projects)}
+        await insert_rows(session, models.AdminEpic, [
+            {"epic_id": epic_id, "project_id": e["project_id"], "project_title": project_names[e["project_id"]], "name": e["name"]}
+            for epic_id, e in zip(epic_ids, epics)
+        ], args.batch_size)
+        epics_by_project = {}
+        for epic_id, e in zip(epic_ids, epics):
+            epics_by_project.setdefault(e["project_id"], []).append(epic_id)
+        print(f"Inserted {len(epics)} epics")
+
+        placements, tickets = [], []
+        for project_id in project_ids:
+            for _ in range(args.tickets_per_project):
+                tickets.append(make_ticket(rng, emails, today))
+                project_epics = epics_by_project.get(project_id) or [None]
+                placements.append((project_id, rng.choice(project_epics)))
+        # Distinct ranks; rows inserted in the same millisecond would otherwise tie
+        for t, rank in zip(tickets, ranking.spread(len(tickets))):
+            t["rank"] = rank
+        ticket_ids = await insert_rows(session, models.Ticket, tickets, args.batch_size, returning=models.Ticket.id)
+        await insert_rows(session, models.AdminTicket, [
+            {
+                "ticket_id": ticket_id,
+                "project_id": project_id,
+                "epic_id": epic_id,
+                "project_title": project_names[project_id],
+                "user_name": t["reporter"],
+                **t,
+            }
+            for ticket_id, t, (project_id, epic_id) in zip(ticket_ids, tickets, placements)
+        ], args.batch_size)
+        print(f"Inserted {len(tickets)} tickets")
+
+        assets = []
+        for _ in range(args.assets):
+            opened = datetime.utcnow() - timedelta(days=rng.randint(0, 365))
+            assets.append({
+                "email": rng.choice(emails),
+                "type": rng.choice(ASSET_TYPES),
+                "location": rng.choice(["WFO", "WFH"]),
+                "status": rng.choice(ASSET_STATUSES),
+                "description": f"{rng.choice(WORDS)} {rng.choice(WORDS)}",
+                "open_date": opened,
+            })
+        asset_ids = await insert_rows(session, models.Asset, assets, args.batch_size, returning=models.Asset.id)
+        await insert_rows(session, models.AdminAsset, [
+            {"id": asset_id, **a} for asset_id, a in zip(asset_ids, assets)
+        ], args.batch_size)
+        print(f"Inserted {len(assets)} assets")
+
+        await session.commit()
+        updated = await crud.recompute_ticket_counters(session)
+        print(f"Recomputed ticket counters for {updated} users")
+        written = await rollups.rebuild(session)
+        print(f"Rebuilt {written} dashboard rollup rows")
+
+
+async def main(argv):
+    args = parse_args(argv)
+    try:
+        await seed(args)
+    finally:
+        await database.engine.dispose()
+    return 0
+
+
+if __name__ == "__main__":
+    code = asyncio.run(main(sys.argv[1:]))
+    sys.exit(code)
@@ -1,5 +1,7 @@
 @echo off
 cd /d "%~dp0"
 call venv\Scripts\activate.bat
+set PYTHONPATH=%CD%
+python scripts\flowtrack.py db upgrade || exit /b 1
 python -m uvicorn app.main:app --host 0.0.0.0 --port 8000 --reload
 
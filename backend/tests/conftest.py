@@ -0,0 +1,103 @@
+"""Fixtures for the query-budget tests.
+
+The app runs against a throwaway SQLite database (aiosqlite) instead of
+PostgreSQL. ``queries`` counts the SQL statements and commits issued while
+it is active, through SQLAlchemy engine events, so tests can pin how many
+round trips a route is allowed to make.
+"""
+import os
+import sys
+import tempfile
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.orm import sessionmaker
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app import database, outbox  # noqa: E402
+from app.config import settings  # noqa: E402
+from app.main import app  # noqa: E402
+
+
+class QueryCounter:
+    """SQL statements and commits seen on the test engine since the last reset"""
+
+    def __init__(self, engine):
+        self.engine = engine.sync_engine
+        self.statements = []
+        self.commits = 0
+
+    def _on_execute(self, conn, cursor, statement, parameters, context, executemany):
+        self.statements.append(statement)
+
+    def _on_commit(self, conn):
+        self.commits += 1
+
+    def start(self):
+        event.listen(self.engine, "before_cursor_execute", self._on_execute)
+        event.listen(self.engine, "commit", self._on_commit)
+
+    def stop(self):
+        event.remove(self.engine, "before_cursor_execute", self._on_execute)
+        event.remove(self.engine, "commit", self._on_commit)
+
+    def reset(self):
+        self.statements = []
+        self.commits = 0
+
+    @property
+    def count(self) -> int:
+        return len(self.statements)
+
+    def assert_within(self, label: str, statements: int, commits: int) -> None:
+        """Fail when the work since the last reset exceeds a route's budget"""
+        listing = "\n".join(f"  {i + 1}. {s.strip().splitlines()[0]}" for i, s in enumerate(self.statements))
+        assert self.count <= statements, (
+            f"{label} ran {self.count} SQL statements, budget is {statements}:\n{listing}"
+        )
+        assert self.commits <= commits, f"{label} committed {self.commits} times, budget is {commits}"
+
+
+@pytest.fixture(scope="session")
+def test_engine():
+    path = os.path.join(tempfile.mkdtemp(prefix="flowtrack-tests-"), "test.db")
+    engine = create_async_engine(f"sqlite+aiosqlite:///{path}")
+    yield engine
+
+
+@pytest.fixture(scope="session")
+def client(test_engine):
+    """TestClient bound to the SQLite engine, with the outbox drained only on demand"""
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(database, "engine", test_engine)
+        mp.setattr(database, "async_session_maker", sessionmaker(bind=test_engine, expire_on_commit=False, class_=AsyncSession))
+        # The background worker would issue statements in the middle of counted requests
+        mp.setattr(settings, "outbox_enabled", False)
+        mp.setattr(settings, "rank_rebalance_enabled", False)
+        mp.setattr(settings, "overdue_scan_enabled", False)
+        # A fresh throwaway database, so create the tables instead of checking the revision
+        mp.setattr(settings, "db_boot_mode", "create_all")
+        with TestClient(app) as test_client:
+            yield test_client
+
+
+@pytest.fixture(scope="session")
+def drain_outbox(client):
+    """Apply pending admin_* mirror writes, as the outbox worker would"""
+    async def _drain():
+        async with database.async_session_maker() as session:
+            while await outbox.process_batch(session):
+                pass
+
+    return lambda: client.portal.call(_drain)
+
+
+@pytest.fixture
+def queries(client, test_engine):
+    counter = QueryCounter(test_engine)
+    counter.start()
+    yield counter
+    counter.stop()
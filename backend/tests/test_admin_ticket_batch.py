@@ -0,0 +1,30 @@
+"""PATCH /admin/tickets/batch: synced tickets rows, counters and change events."""
+from app import events
+
+
+def test_batch_syncs_tickets_and_publishes(client, drain_outbox):
+    email = "batch@example.com"
+    client.post("/users-management", json={"first_name": "Batch", "last_name": "User", "email": email})
+    project = client.post("/projects", json={"name": "Batch", "project_key": "BAT"}).json()
+    ticket = client.post("/tickets", params={"project_id": project["id"]}, json={"user_id": 1, "title": "Moved", "assignee": email}).json()
+    drain_outbox()
+    admin = client.get("/admin/tickets", params={"project_id": project["id"]}).json()[0]
+
+    subscription = events.broker.subscribe(project["id"])
+    try:
+        response = client.patch("/admin/tickets/batch", json=[{"admin_ticket_id": admin["admin_ticket_id"], "fields": {"status": "Done"}}])
+        assert response.status_code == 200 and response.json()[0]["ok"]
+        published = []
+        while not subscription.queue.empty():
+            published.append(subscription.queue.get_nowait())
+    finally:
+        events.broker.unsubscribe(subscription)
+
+    assert [(e["type"], e["id"]) for e in published] == [
+        ("admin_ticket.updated", admin["admin_ticket_id"]),
+        ("ticket.updated", ticket["id"]),
+    ]
+    assert published[1]["data"]["status"] == "Done"
+    assert client.get(f"/tickets/{ticket['id']}").json()["status"] == "Done"
+    user = client.get(f"/users-management/email/{email}").json()
+    assert (user["tickets_issued"], user["tickets_resolved"]) == (0, 1)
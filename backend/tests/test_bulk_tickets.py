@@ -0,0 +1,38 @@
+"""POST /tickets/bulk: one transaction for the tickets, their mirrors, counters and rollups."""
+from app.config import settings
+
+
+def test_bulk_create(client):
+    email = "bulk@example.com"
+    client.post("/users-management", json={"first_name": "Bulk", "last_name": "User", "email": email})
+    project = client.post("/projects", json={"name": "Bulk import", "project_key": "BLK"}).json()
+    items = [
+        {"user_id": 1, "title": "Bulk 1", "assignee": email},
+        {"user_id": 1, "title": "Bulk 2", "assignee": email, "status": "Done"},
+        {"user_id": 1, "title": "Bulk 3", "priority": "High", "due_date": "2031-05-01"},
+    ]
+    response = client.post("/tickets/bulk", params={"project_id": project["id"]}, json=items)
+    assert response.status_code == 201
+    created = response.json()
+    assert [t["title"] for t in created] == ["Bulk 1", "Bulk 2", "Bulk 3"]
+    ranks = [t["rank"] for t in created]
+    assert ranks == sorted(ranks) and len(set(ranks)) == 3
+
+    # Mirrors are written in the same transaction, without the outbox
+    mirrors = client.get("/admin/tickets", params={"project_id": project["id"]}).json()
+    assert [(m["ticket_id"], m["title"], m["project_title"], m["rank"]) for m in mirrors] == [
+        (t["id"], t["title"], "Bulk import", t["rank"]) for t in created
+    ]
+    summary = client.get("/dashboard/summary", params={"project_id": project["id"]}).json()
+    assert summary["by_status"] == {"Open": 2, "Done": 1}
+    assert summary["by_priority"] == {"Medium": 2, "High": 1}
+
+    user = client.get(f"/users-management/email/{email}").json()
+    assert (user["tickets_issued"], user["tickets_resolved"]) == (1, 1)
+
+
+def test_bulk_limit(client, monkeypatch):
+    monkeypatch.setattr(settings, "ticket_bulk_max_items", 2)
+    response = client.post("/tickets/bulk", json=[{"user_id": 1, "title": f"Over {i}"} for i in range(3)])
+    assert response.status_code == 400
+    assert client.post("/tickets/bulk", json=[]).json() == []
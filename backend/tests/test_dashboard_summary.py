@@ -0,0 +1,85 @@
+"""GET /dashboard/summary: the rollup counts track every admin_tickets write."""
+import itertools
+
+from app import database, rollups
+
+_ids = itertools.count(1)
+
+
+def _expected(client, project_id=None):
+    """The summary computed directly from /admin/tickets"""
+    params = {"project_id": project_id} if project_id is not None else {}
+    by_status, by_priority, by_assignee, by_project = {}, {}, {}, {}
+    for t in client.get("/admin/tickets", params=params).json():
+        by_status[t["status"]] = by_status.get(t["status"], 0) + 1
+        by_priority[t["priority"]] = by_priority.get(t["priority"], 0) + 1
+        assignee = t["assignee"] or "Unassigned"
+        by_assignee[assignee] = by_assignee.get(assignee, 0) + 1
+        project = str(t["project_id"]) if t["project_id"] else "none"
+        by_project[project] = by_project.get(project, 0) + 1
+    return {
+        "project_id": project_id,
+        "total": sum(by_status.values()),
+        "by_status": by_status,
+        "by_priority": by_priority,
+        "by_assignee": by_assignee,
+        "by_project": by_project,
+    }
+
+
+def _assert_consistent(client, project_id):
+    assert client.get("/dashboard/summary", params={"project_id": project_id}).json() == _expected(client, project_id)
+
+
+def test_rollups_follow_ticket_writes(client, drain_outbox):
+    n = next(_ids)
+    email = f"dash{n}@example.com"
+    other = f"dash{n}b@example.com"
+    project = client.post("/projects", json={"name": f"Dashboard {n}", "project_key": f"D{n}", "leads": email}).json()
+    epic = client.post("/epics", json={"project_id": project["id"], "name": "Dashboard epic"}).json()
+    ticket_ids = [
+        client.post(
+            "/tickets",
+            params={"project_id": project["id"], "epic_id": epic["id"]},
+            json={"user_id": 1, "title": f"Dashboard {i}", "assignee": email if i else None},
+        ).json()["id"]
+        for i in range(3)
+    ]
+    drain_outbox()
+    summary = client.get("/dashboard/summary", params={"project_id": project["id"]}).json()
+    assert summary["total"] == 3
+    assert summary["by_assignee"] == {email: 2, "Unassigned": 1}
+    _assert_consistent(client, project["id"])
+
+    # Ticket edits reach admin_tickets through the outbox
+    client.put(f"/tickets/{ticket_ids[0]}", json={"status": "Done", "assignee": other})
+    drain_outbox()
+    _assert_consistent(client, project["id"])
+
+    admin = client.get("/admin/tickets", params={"project_id": project["id"]}).json()
+    client.put(f"/admin/tickets/{admin[0]['admin_ticket_id']}", json={"priority": "High"})
+    _assert_consistent(client, project["id"])
+
+    client.patch("/admin/tickets/batch", json=[
+        {"admin_ticket_id": t["admin_ticket_id"], "fields": {"status": "In Progress"}} for t in admin
+    ])
+    _assert_consistent(client, project["id"])
+    assert client.get("/dashboard/summary", params={"project_id": project["id"]}).json()["by_status"] == {"In Progress": 3}
+
+    client.delete(f"/admin/tickets/{admin[1]['admin_ticket_id']}")
+    _assert_consistent(client, project["id"])
+
+    client.delete(f"/projects/{project['id']}")
+    assert client.get("/dashboard/summary", params={"project_id": project["id"]}).json()["total"] == 0
+
+
+def test_rebuild_matches_incremental_counts(client):
+    before = client.get("/dashboard/summary").json()
+    assert before == _expected(client)
+
+    async def _rebuild():
+        async with database.async_session_maker() as session:
+            return await rollups.rebuild(session)
+
+    client.portal.call(_rebuild)
+    assert client.get("/dashboard/summary").json() == before
@@ -0,0 +1,47 @@
+"""Connection pool profile: engine options from settings, warm-up and /health/db."""
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from app import database
+from app.config import settings
+
+PG_URL = "postgresql+asyncpg://flowtrack@db/flowtrack"
+
+
+def test_postgres_options_follow_settings(monkeypatch):
+    for name, value in (("db_pool_size", 7), ("db_max_overflow", 3), ("db_pool_timeout", 2.5),
+                        ("db_pool_recycle", 600), ("db_pool_pre_ping", False), ("db_statement_timeout_ms", 1500)):
+        monkeypatch.setattr(settings, name, value)
+    options = database._engine_options(PG_URL)
+    assert {k: options[k] for k in ("pool_size", "max_overflow", "pool_timeout", "pool_recycle", "pool_pre_ping")} == {
+        "pool_size": 7, "max_overflow": 3, "pool_timeout": 2.5, "pool_recycle": 600, "pool_pre_ping": False,
+    }
+    assert options["connect_args"] == {"server_settings": {"statement_timeout": "1500"}}
+
+    monkeypatch.setattr(settings, "db_statement_timeout_ms", 0)
+    assert "connect_args" not in database._engine_options(PG_URL)
+
+
+def test_sqlite_keeps_default_pool():
+    options = database._engine_options("sqlite+aiosqlite:///flowtrack.db")
+    assert not {"pool_size", "max_overflow", "pool_timeout", "pool_recycle"} & set(options)
+
+
+def test_warm_up_and_health_report_pool(client):
+    assert client.portal.call(database.warm_up_pool, 0) == 0
+    assert client.portal.call(database.warm_up_pool, 3) == 3
+
+    response = client.get("/health/db")
+    assert response.status_code == 200
+    body = response.json()
+    assert body["status"] == "healthy" and body["latency_ms"] >= 0
+    pool = body["pool"]
+    assert pool["pool_class"] == type(database.engine.pool).__name__
+    assert pool["checked_out"] == 0 and pool["idle"] >= 1
+    assert pool["max_overflow"] == settings.db_max_overflow
+
+
+def test_health_reports_unreachable_database(client, monkeypatch, tmp_path):
+    monkeypatch.setattr(database, "engine", create_async_engine(f"sqlite+aiosqlite:///{tmp_path}/missing/db.sqlite"))
+    response = client.get("/health/db")
+    assert response.status_code == 503
+    assert response.json()["status"] == "unhealthy" and "pool_class" in response.json()["pool"]
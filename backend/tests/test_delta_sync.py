@@ -0,0 +1,53 @@
+"""Delta sync: updated_since filters, tombstones and X-Sync-Timestamp."""
+from datetime import datetime, timedelta
+
+from sqlalchemy import update
+
+from app import database, models
+from app.config import settings
+
+USER_ID = 9100
+
+
+def _age(client, ticket_ids, when):
+    async def write():
+        async with database.async_session_maker() as session:
+            await session.execute(update(models.Ticket).where(models.Ticket.id.in_(ticket_ids)).values(updated_at=when))
+            await session.commit()
+
+    client.portal.call(write)
+
+
+def test_updated_since_returns_only_later_changes(client):
+    old, recent = (client.post("/tickets", json={"user_id": USER_ID, "title": t}).json()["id"] for t in ("Old", "Recent"))
+    _age(client, [old], datetime(2020, 1, 1))
+    _age(client, [recent], datetime(2022, 1, 1))
+
+    params = {"user_id": USER_ID, "updated_since": "2021-01-01T00:00:00"}
+    assert [t["id"] for t in client.get("/tickets", params=params).json()] == [recent]
+    assert [t["id"] for t in client.get("/tickets", params={**params, "limit": 10}).json()] == [recent]
+
+    client.put(f"/tickets/{old}", json={"title": "Old, edited"})  # Stamps updated_at again
+    assert sorted(t["id"] for t in client.get("/tickets", params=params).json()) == sorted([old, recent])
+
+
+def test_deletes_are_listed_as_tombstones(client):
+    since = client.get("/tickets", params={"user_id": USER_ID}).headers["X-Sync-Timestamp"]
+    ticket = client.post("/tickets", json={"user_id": USER_ID, "title": "Deleted"}).json()
+    assert client.delete(f"/tickets/{ticket['id']}").status_code == 204
+
+    deleted = client.get("/sync/deleted/tickets", params={"since": since}).json()
+    assert ticket["id"] in [t["entity_id"] for t in deleted]
+    assert client.get("/sync/deleted/tickets", params={"since": "2999-01-01T00:00:00"}).json() == []
+    assert client.get("/sync/deleted/passwords", params={"since": since}).status_code == 404
+
+
+def test_sync_timestamp_includes_overlap(client, monkeypatch):
+    def stamp():
+        return datetime.fromisoformat(client.get("/tickets", params={"user_id": USER_ID}).headers["X-Sync-Timestamp"])
+
+    monkeypatch.setattr(settings, "sync_overlap_seconds", 0)
+    now = stamp()
+    assert abs(now - datetime.utcnow()) < timedelta(seconds=5)  # SQLite's clock is UTC
+    monkeypatch.setattr(settings, "sync_overlap_seconds", 120)
+    assert timedelta(seconds=115) < now - stamp() <= timedelta(seconds=120)
@@ -0,0 +1,76 @@
+"""Event brokers: NOTIFY payload size and listener reconnects."""
+import asyncio
+import json
+
+from app import events
+
+LONG = "x" * 20000
+
+
+class FakeConnection:
+    def __init__(self, closed=False):
+        self.closed = closed
+        self.notified = []
+
+    def is_closed(self):
+        return self.closed
+
+    async def execute(self, query, channel, payload):
+        self.notified.append(payload)
+
+
+def _broker(conn):
+    broker = events.PostgresBroker(10, "postgresql+asyncpg://localhost/flowtrack", "flowtrack_events")
+    broker._conn = conn
+    return broker
+
+
+def test_large_event_is_notified_without_data():
+    conn = FakeConnection()
+    event = {"type": "ticket.updated", "id": 7, "project_id": 3, "data": {"description": LONG}, "ts": "now"}
+    asyncio.run(_broker(conn).publish(event))
+
+    payload = conn.notified[0]
+    assert len(payload.encode("utf-8")) < 8000
+    sent = json.loads(payload)
+    assert (sent["type"], sent["id"], sent["project_id"], sent["data"], sent["truncated"]) == ("ticket.updated", 7, 3, None, True)
+
+
+def test_small_event_is_notified_whole():
+    conn = FakeConnection()
+    event = {"type": "ticket.updated", "id": 7, "project_id": 3, "data": {"description": "short"}, "ts": "now"}
+    asyncio.run(_broker(conn).publish(event))
+    assert json.loads(conn.notified[0]) == event
+
+
+def test_closed_connection_reconnects_and_delivers_locally():
+    async def run():
+        broker = _broker(FakeConnection(closed=True))
+        fresh = FakeConnection()
+
+        async def connect():
+            broker._conn = fresh
+
+        broker._connect = connect
+        subscription = broker.subscribe(None)
+        await broker.publish({"type": "epic.created", "id": 1, "project_id": None, "data": None, "ts": "now"})
+        await broker._reconnect_task
+        await broker.publish({"type": "epic.updated", "id": 1, "project_id": None, "data": None, "ts": "now"})
+        return subscription.queue.get_nowait(), fresh
+
+    local, fresh = asyncio.run(run())
+    assert local["type"] == "epic.created"
+    assert [json.loads(p)["type"] for p in fresh.notified] == ["epic.updated"]
+
+
+def test_memory_broker_keeps_large_descriptions(client):
+    subscription = events.broker.subscribe(None)
+    try:
+        ticket = client.post("/tickets", json={"user_id": 1, "title": "Long", "description": LONG}).json()
+        published = []
+        while not subscription.queue.empty():
+            published.append(subscription.queue.get_nowait())
+    finally:
+        events.broker.unsubscribe(subscription)
+    created = next(e for e in published if e["type"] == "ticket.created" and e["id"] == ticket["id"])
+    assert created["data"]["description"] == LONG
@@ -0,0 +1,41 @@
+"""Request metrics: streaming routes stay out of the in-flight gauge and latency histograms."""
+import asyncio
+
+from app import metrics
+
+
+def _gauge(body, name):
+    return int(next(line for line in body.splitlines() if line.startswith(name + " ")).split()[-1])
+
+
+def test_open_stream_is_not_in_flight():
+    seen = {}
+
+    async def stream(scope, receive, send):
+        await send({"type": "http.response.start", "status": 200, "headers": []})
+        await send({"type": "http.response.body", "body": b"retry: 3000\n\n", "more_body": True})
+        # Still streaming: the request is open
+        body = metrics.render()
+        seen["in_flight"] = _gauge(body, "flowtrack_http_requests_in_flight")
+        seen["streams"] = _gauge(body, "flowtrack_http_streams_open")
+        await send({"type": "http.response.body", "body": b""})
+
+    async def send(message):
+        pass
+
+    before = metrics.render()
+    scope = {"type": "http", "method": "GET", "path": "/events/stream"}
+    asyncio.run(metrics.MetricsMiddleware(stream)(scope, None, send))
+
+    assert seen["in_flight"] == _gauge(before, "flowtrack_http_requests_in_flight")
+    assert seen["streams"] == _gauge(before, "flowtrack_http_streams_open") + 1
+    assert _gauge(metrics.render(), "flowtrack_http_streams_open") == _gauge(before, "flowtrack_http_streams_open")
+
+
+def test_exports_are_counted_without_latency(client):
+    assert client.get("/export/tickets").status_code == 200
+    body = client.get("/metrics").text
+    assert 'flowtrack_http_requests_total{method="GET",route="/export/{entity}",status="200"}' in body
+    assert 'route="/export/{entity}"' not in "\n".join(
+        line for line in body.splitlines() if line.startswith("flowtrack_http_request_duration_seconds")
+    )
@@ -0,0 +1,57 @@
+"""Boot-time schema check and the `flowtrack db upgrade` steps, on their own database."""
+import asyncio
+import os
+import tempfile
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from app import migrations
+
+
+def _run(coro_fn):
+    """Run ``coro_fn(engine)`` against a new empty SQLite database"""
+    async def _main():
+        path = os.path.join(tempfile.mkdtemp(prefix="flowtrack-migrations-"), "test.db")
+        engine = create_async_engine(f"sqlite+aiosqlite:///{path}")
+        try:
+            return await coro_fn(engine)
+        finally:
+            await engine.dispose()
+
+    return asyncio.run(_main())
+
+
+def test_upgrade_then_check():
+    async def scenario(engine):
+        with pytest.raises(migrations.SchemaMismatch, match="<none>"):
+            await migrations.check(engine)
+        assert await migrations.upgrade(engine) == "created"
+        assert await migrations.check(engine) == migrations.head_revision()
+        # Idempotent once at head
+        assert await migrations.upgrade(engine) == "upgraded"
+        assert await migrations.current_revision(engine) == migrations.head_revision()
+
+    _run(scenario)
+
+
+def test_check_rejects_other_revision():
+    async def scenario(engine):
+        await migrations.upgrade(engine)
+        async with engine.begin() as conn:
+            await conn.execute(text("UPDATE alembic_version SET version_num = '20261018_ticket_search'"))
+        with pytest.raises(migrations.SchemaMismatch, match="20261018_ticket_search"):
+            await migrations.check(engine)
+
+    _run(scenario)
+
+
+def test_upgrade_refuses_unversioned_tables():
+    async def scenario(engine):
+        async with engine.begin() as conn:
+            await conn.execute(text("CREATE TABLE tickets (id INTEGER PRIMARY KEY)"))
+        with pytest.raises(migrations.SchemaMismatch, match="alembic stamp"):
+            await migrations.upgrade(engine)
+
+    _run(scenario)
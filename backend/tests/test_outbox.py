@@ -0,0 +1,99 @@
+"""Outbox worker: handler failures, the attempts cap and retention."""
+import json
+import logging
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import select
+
+from app import database, models, outbox
+from app.config import settings
+
+
+def _call(client, fn):
+    async def _run():
+        async with database.async_session_maker() as session:
+            return await fn(session)
+
+    return client.portal.call(_run)
+
+
+def _ticket_event(client, ticket_id):
+    async def load(session):
+        res = await session.execute(select(models.OutboxEvent).where(models.OutboxEvent.event_type == outbox.ADMIN_TICKET_CREATE))
+        return next(e for e in res.scalars().all() if json.loads(e.payload)["ticket_id"] == ticket_id)
+
+    return _call(client, load)
+
+
+@pytest.fixture
+def failing_tickets(monkeypatch):
+    """Make the ticket handler write its mirrors and then fail"""
+    (ticket_types, apply_tickets), *others = outbox._HANDLERS
+
+    async def failing(session, events, payloads):
+        await apply_tickets(session, events, payloads)
+        await session.flush()
+        raise RuntimeError("mirror write failed")
+
+    monkeypatch.setattr(outbox, "_HANDLERS", ((ticket_types, failing), *others))
+
+
+def test_failed_handler_is_retried(client, drain_outbox, failing_tickets, monkeypatch):
+    drain_outbox()
+    project = client.post("/projects", json={"name": "Outbox retry", "project_key": "OBR"}).json()
+    ticket = client.post("/tickets", params={"project_id": project["id"]}, json={"user_id": 1, "title": "Retried"}).json()
+    epic = client.post("/epics", json={"project_id": project["id"], "name": "Applied"}).json()
+
+    assert _call(client, outbox.process_batch) == 1  # Only the epic event
+    event = _ticket_event(client, ticket["id"])
+    assert (event.attempts, event.processed_at, event.last_error) == (1, None, "mirror write failed")
+    # The failed group's writes were rolled back with its savepoint; the other group committed
+    assert client.get("/admin/tickets", params={"project_id": project["id"]}).json() == []
+    assert [e["epic_id"] for e in client.get("/admin/epics", params={"project_id": project["id"]}).json()] == [epic["id"]]
+
+    monkeypatch.undo()  # The handler works again
+    drain_outbox()
+    assert _ticket_event(client, ticket["id"]).processed_at is not None
+    assert [t["ticket_id"] for t in client.get("/admin/tickets", params={"project_id": project["id"]}).json()] == [ticket["id"]]
+
+
+def test_attempts_cap_dead_letters(client, drain_outbox, failing_tickets, monkeypatch, caplog):
+    drain_outbox()
+    monkeypatch.setattr(settings, "outbox_max_attempts", 2)
+    # Alembic's fileConfig (test_migrations) disables loggers that already exist
+    monkeypatch.setattr(outbox.logger, "disabled", False)
+    ticket = client.post("/tickets", json={"user_id": 1, "title": "Dead letter"}).json()
+
+    with caplog.at_level(logging.ERROR, logger="app.outbox"):
+        for _ in range(3):
+            _call(client, outbox.process_batch)
+    assert _ticket_event(client, ticket["id"]).attempts == 2  # Not picked up a third time
+    assert any("will not be retried" in r.getMessage() for r in caplog.records)
+
+    health = client.get("/health/outbox").json()
+    assert health["dead_letters"] >= 1
+    assert health["recent_dead_letters"][0]["payload"]["ticket_id"] == ticket["id"]
+
+
+def test_purge_keeps_recent_and_failed_events(client, monkeypatch):
+    old = datetime.utcnow() - timedelta(hours=settings.outbox_retention_hours + 1)
+
+    async def seed(session):
+        events = [
+            models.OutboxEvent(event_type="test.old", payload="{}", attempts=0, processed_at=old),
+            models.OutboxEvent(event_type="test.recent", payload="{}", attempts=0, processed_at=datetime.utcnow()),
+            models.OutboxEvent(event_type="test.failed", payload="{}", attempts=settings.outbox_max_attempts, processed_at=None),
+        ]
+        session.add_all(events)
+        await session.commit()
+        return [e.id for e in events]
+
+    ids = _call(client, seed)
+    assert _call(client, outbox.purge_processed) >= 1
+
+    async def remaining(session):
+        res = await session.execute(select(models.OutboxEvent.id).where(models.OutboxEvent.id.in_(ids)))
+        return set(res.scalars().all())
+
+    assert _call(client, remaining) == set(ids[1:])
@@ -0,0 +1,78 @@
+"""Overdue scan: flags, the watermarks, GET /tickets/overdue and /dashboard/overdue."""
+from datetime import date, datetime
+
+from sqlalchemy import select, update
+
+from app import database, models, overdue
+
+
+def _scan(client, today):
+    async def _run():
+        async with database.async_session_maker() as session:
+            return await overdue.scan(session, today)
+
+    return client.portal.call(_run)
+
+
+def _overdue_titles(client, project_id):
+    response = client.get("/tickets/overdue", params={"project_id": project_id})
+    assert response.status_code == 200
+    return [t["title"] for t in response.json()]
+
+
+def test_scan_flags_and_clears(client, drain_outbox):
+    project = client.post("/projects", json={"name": "Overdue", "project_key": "OVD"}).json()
+    ids = {}
+    for title, fields in {
+        "late": {"due_date": "2035-01-10"},
+        "later": {"due_date": "2035-01-20"},
+        "done": {"due_date": "2035-01-10", "status": "Done"},
+        "undated": {},
+    }.items():
+        ids[title] = client.post("/tickets", params={"project_id": project["id"]}, json={"user_id": 1, "title": title, **fields}).json()["id"]
+    drain_outbox()
+
+    _scan(client, date(2035, 1, 15))
+    assert _overdue_titles(client, project["id"]) == ["late"]
+    assert client.get(f"/tickets/{ids['late']}").json()["overdue"] is True
+    summary = client.get("/dashboard/overdue", params={"project_id": project["id"]}).json()
+    assert summary["total"] == 1 and summary["by_project"] == {str(project["id"]): 1}
+    assert summary["scanned_at"] is not None
+
+    # Edits since the last scan are rescanned on the same day
+    client.put(f"/tickets/{ids['late']}", json={"status": "Done"})
+    client.put(f"/tickets/{ids['done']}", json={"status": "In Progress"})
+    _scan(client, date(2035, 1, 15))
+    assert _overdue_titles(client, project["id"]) == ["done"]
+
+    # A due date that passed since the last scan
+    _scan(client, date(2035, 1, 25))
+    assert _overdue_titles(client, project["id"]) == ["done", "later"]
+    assert client.get("/dashboard/overdue", params={"project_id": project["id"]}).json()["total"] == 2
+
+    client.put(f"/tickets/{ids['later']}", json={"due_date": "2035-02-01"})
+    flagged, cleared = _scan(client, date(2035, 1, 25))
+    assert cleared == 1
+    assert _overdue_titles(client, project["id"]) == ["done"]
+
+
+def test_flags_do_not_touch_updated_at(client):
+    ticket = client.post("/tickets", json={"user_id": 9200, "title": "Quietly late", "due_date": "2036-01-10"}).json()
+    stamped = datetime(2030, 1, 1)
+
+    async def age():
+        async with database.async_session_maker() as session:
+            await session.execute(update(models.Ticket).where(models.Ticket.id == ticket["id"]).values(updated_at=stamped))
+            await session.commit()
+
+    async def updated_at():
+        async with database.async_session_maker() as session:
+            return (await session.execute(select(models.Ticket.updated_at).where(models.Ticket.id == ticket["id"]))).scalar()
+
+    client.portal.call(age)
+    _scan(client, date(2036, 1, 15))
+    assert client.get(f"/tickets/{ticket['id']}").json()["overdue"] is True
+    _scan(client, date(2036, 1, 5))  # Cleared again
+    assert client.get(f"/tickets/{ticket['id']}").json()["overdue"] is False
+    assert client.portal.call(updated_at) == stamped
+    assert client.get("/tickets", params={"user_id": 9200, "updated_since": "2031-01-01T00:00:00"}).json() == []
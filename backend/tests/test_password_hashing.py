@@ -0,0 +1,23 @@
+"""bcrypt thread pool: rejection when full, and its /metrics series."""
+from app import security
+from app.config import settings
+
+
+def test_full_queue_is_503(client, monkeypatch):
+    monkeypatch.setattr(settings, "password_hash_workers", 0)
+    monkeypatch.setattr(settings, "password_hash_max_queue", 0)
+    response = client.post("/auth/register", json={"email": "busy@example.com", "password": "secret", "full_name": "Busy"})
+    assert response.status_code == 503
+    assert response.headers["Retry-After"] == str(security.PasswordHasherBusy.retry_after)
+    assert security.stats()["rejected"] >= 1
+
+
+def test_hashing_is_exported_as_metrics(client):
+    assert client.post("/auth/register", json={"email": "metered@example.com", "password": "secret", "full_name": "Metered"}).status_code == 201
+    assert client.post("/auth/login", json={"email": "metered@example.com", "password": "secret"}).status_code == 200
+
+    body = client.get("/metrics").text
+    assert "flowtrack_password_hash_pending 0" in body
+    assert 'flowtrack_password_hash_seconds_count{operation="hash"}' in body
+    count = next(line for line in body.splitlines() if line.startswith('flowtrack_password_hash_seconds_count{operation="verify"}'))
+    assert int(count.split()[-1]) >= 1
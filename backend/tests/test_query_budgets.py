@@ -0,0 +1,181 @@
+"""SQL statement and commit budgets for the hot routes.
+
+Each budget is the number of round trips the route makes today. A change
+that adds a query (an N+1 loop, an extra refresh, a second commit) fails
+here; lower a budget when a route gets cheaper.
+"""
+import itertools
+
+import pytest
+
+# (statements, commits) per route
+BUDGETS = {
+    "POST /users-management": (2, 1),
+    "PUT /users-management/{user_id}": (2, 1),
+    "GET /users-management": (1, 0),
+    "GET /users-management/email/{email}": (1, 0),
+    "GET /users-management/search": (1, 0),
+    "DELETE /users-management/{user_id}": (3, 1),
+    "POST /user-profiles": (2, 1),
+    "PUT /user-profiles/{user_id}": (2, 1),
+    "DELETE /user-profiles/{user_id}": (3, 1),
+    "POST /projects": (3, 1),
+    "GET /projects": (2, 0),
+    "DELETE /projects/{project_id}": (10, 1),
+    "POST /epics": (2, 1),
+    "GET /epics": (2, 0),
+    "POST /tickets": (3, 1),
+    "POST /tickets/bulk": (5, 1),
+    "GET /tickets": (2, 0),
+    "GET /tickets/{ticket_id}": (1, 0),
+    "GET /tickets/search": (1, 0),
+    "GET /tickets/timeline": (1, 0),
+    "GET /tickets/overdue": (1, 0),
+    "PUT /tickets/{ticket_id}": (5, 1),
+    "POST /tickets/{ticket_id}/move": (4, 1),
+    "DELETE /tickets/{ticket_id}": (10, 2),
+    "GET /admin/tickets": (2, 0),
+    "PUT /admin/tickets/{admin_ticket_id}": (6, 2),
+    "PATCH /admin/tickets/batch": (8, 1),
+    "GET /dashboard/summary": (1, 0),
+    "GET /dashboard/overdue": (2, 0),
+    "POST /assets": (2, 1),
+    "GET /assets": (1, 0),
+}
+
+_ids = itertools.count(1)
+
+
+@pytest.fixture
+def budget(queries):
+    """Reset the counter, run a request and check it against its route's budget"""
+    def _run(route, call, expected_status=200):
+        queries.reset()
+        response = call()
+        assert response.status_code == expected_status, response.text
+        queries.assert_within(route, *BUDGETS[route])
+        return response
+
+    return _run
+
+
+@pytest.fixture
+def board(client, drain_outbox):
+    """A user with a project, an epic and one assigned ticket mirrored into admin_tickets"""
+    n = next(_ids)
+    email = f"dev{n}@example.com"
+    user = client.post("/users-management", json={"first_name": "Dev", "last_name": str(n), "email": email}).json()
+    project = client.post("/projects", json={"name": f"Project {n}", "project_key": f"P{n}", "leads": email}).json()
+    epic = client.post("/epics", json={"project_id": project["id"], "name": f"Epic {n}"}).json()
+    ticket = client.post(
+        "/tickets",
+        params={"project_id": project["id"], "epic_id": epic["id"]},
+        json={"user_id": 1, "title": f"Ticket {n}", "assignee": email},
+    ).json()
+    drain_outbox()
+    admin_ticket = client.get("/admin/tickets", params={"project_id": project["id"]}).json()[0]
+    return {"email": email, "user": user, "project": project, "epic": epic, "ticket": ticket, "admin_ticket": admin_ticket}
+
+
+def test_users_management_budgets(client, budget):
+    n = next(_ids)
+    email = f"user{n}@example.com"
+    user = budget(
+        "POST /users-management",
+        lambda: client.post("/users-management", json={"first_name": "New", "last_name": "User", "email": email}),
+        201,
+    ).json()
+    budget("PUT /users-management/{user_id}", lambda: client.put(f"/users-management/{user['id']}", json={"role": "Lead"}))
+    budget("GET /users-management", lambda: client.get("/users-management"))
+    budget("GET /users-management/email/{email}", lambda: client.get(f"/users-management/email/{email}"))
+    budget("GET /users-management/search", lambda: client.get("/users-management/search", params={"q": "user"}))
+    budget("DELETE /users-management/{user_id}", lambda: client.delete(f"/users-management/{user['id']}"), 204)
+
+
+def test_user_profile_budgets(client, budget):
+    n = next(_ids)
+    profile = budget(
+        "POST /user-profiles",
+        lambda: client.post("/user-profiles", json={"full_name": "New Profile", "email": f"profile{n}@example.com", "role": "Tester", "department": "QA"}),
+        201,
+    ).json()
+    budget("PUT /user-profiles/{user_id}", lambda: client.put(f"/user-profiles/{profile['user_id']}", json={"full_name": "Renamed Profile"}))
+    budget("DELETE /user-profiles/{user_id}", lambda: client.delete(f"/user-profiles/{profile['user_id']}"), 204)
+
+
+def test_project_budgets(client, budget, board):
+    n = next(_ids)
+    budget(
+        "POST /projects",
+        lambda: client.post("/projects", json={"name": "Other", "project_key": f"O{n}", "leads": board["email"], "team_members": "x@example.com"}),
+        201,
+    )
+    budget("GET /projects", lambda: client.get("/projects", params={"user_email": board["email"]}))
+    budget("DELETE /projects/{project_id}", lambda: client.delete(f"/projects/{board['project']['id']}"), 204)
+
+
+def test_epic_budgets(client, budget, board):
+    budget("POST /epics", lambda: client.post("/epics", json={"project_id": board["project"]["id"], "name": "Another"}), 201)
+    budget("GET /epics", lambda: client.get("/epics", params={"project_id": board["project"]["id"]}))
+
+
+def test_ticket_budgets(client, budget, board):
+    ticket_id = board["ticket"]["id"]
+    other = budget(
+        "POST /tickets",
+        lambda: client.post(
+            "/tickets",
+            params={"project_id": board["project"]["id"], "epic_id": board["epic"]["id"]},
+            json={"user_id": 1, "title": "Another", "assignee": board["email"]},
+        ),
+        201,
+    ).json()
+    budget(
+        "POST /tickets/bulk",
+        lambda: client.post(
+            "/tickets/bulk",
+            params={"project_id": board["project"]["id"], "epic_id": board["epic"]["id"]},
+            json=[{"user_id": 1, "title": f"Bulk {i}", "assignee": board["email"]} for i in range(20)],
+        ),
+        201,
+    )
+    budget("GET /tickets", lambda: client.get("/tickets"))
+    budget("GET /tickets/{ticket_id}", lambda: client.get(f"/tickets/{ticket_id}"))
+    budget("GET /tickets/search", lambda: client.get("/tickets/search", params={"q": "ticket", "project_id": board["project"]["id"]}))
+    budget("GET /tickets/overdue", lambda: client.get("/tickets/overdue", params={"project_id": board["project"]["id"]}))
+    budget("GET /tickets/timeline", lambda: client.get("/tickets/timeline", params={"from": "2026-01-01", "to": "2026-12-31", "project_id": board["project"]["id"]}))
+    budget("PUT /tickets/{ticket_id}", lambda: client.put(f"/tickets/{ticket_id}", json={"status": "Done"}))
+    budget("POST /tickets/{ticket_id}/move", lambda: client.post(f"/tickets/{ticket_id}/move", json={"prev_id": other["id"]}))
+    budget("DELETE /tickets/{ticket_id}", lambda: client.delete(f"/tickets/{ticket_id}"), 204)
+
+
+def test_admin_ticket_budgets(client, budget, board):
+    admin_ticket_id = board["admin_ticket"]["admin_ticket_id"]
+    budget("GET /admin/tickets", lambda: client.get("/admin/tickets", params={"project_id": board["project"]["id"]}))
+    budget(
+        "PUT /admin/tickets/{admin_ticket_id}",
+        lambda: client.put(f"/admin/tickets/{admin_ticket_id}", json={"status": "In Progress"}),
+    )
+    budget(
+        "PATCH /admin/tickets/batch",
+        lambda: client.patch("/admin/tickets/batch", json=[{"admin_ticket_id": admin_ticket_id, "fields": {"status": "Done"}}]),
+    )
+    budget("GET /dashboard/summary", lambda: client.get("/dashboard/summary", params={"project_id": board["project"]["id"]}))
+    budget("GET /dashboard/overdue", lambda: client.get("/dashboard/overdue", params={"project_id": board["project"]["id"]}))
+
+
+def test_asset_budgets(client, budget, board):
+    budget(
+        "POST /assets",
+        lambda: client.post("/assets", json={"email": board["email"], "type": "Laptop", "location": "WFO", "status": "active"}),
+        201,
+    )
+    budget("GET /assets", lambda: client.get("/assets"))
+
+
+def test_counter_reports_extra_statements(queries, client):
+    """The harness itself: a budget below the real count must fail"""
+    queries.reset()
+    client.get("/tickets")
+    with pytest.raises(AssertionError, match="budget is 1"):
+        queries.assert_within("GET /tickets", 1, 0)
@@ -0,0 +1,66 @@
+"""?fields= on the list routes: only the requested columns are selected and returned."""
+import itertools
+
+_ids = itertools.count(1)
+
+BOARD_FIELDS = "title,status,priority,assignee"
+
+
+def _ticket_select(queries):
+    return next(s for s in queries.statements if s.lstrip().startswith("SELECT") and "FROM tickets" in s)
+
+
+def test_ticket_fields(client, queries):
+    n = next(_ids)
+    for i in range(3):
+        client.post("/tickets", json={"user_id": 1, "title": f"Sparse {n}.{i}", "description": "x" * 500})
+
+    queries.reset()
+    response = client.get("/tickets", params={"fields": BOARD_FIELDS})
+    assert response.status_code == 200
+    tickets = response.json()
+    assert tickets and all(set(t) == {"id", "title", "status", "priority", "assignee"} for t in tickets)
+    assert "description" not in _ticket_select(queries)
+    assert "X-Sync-Timestamp" in response.headers
+
+
+def test_ticket_fields_paging(client):
+    for i in range(3):
+        client.post("/tickets", json={"user_id": 1, "title": f"Paged {i}"})
+    first = client.get("/tickets", params={"limit": 2, "fields": "title"})
+    assert [set(t) for t in first.json()] == [{"id", "title"}] * 2
+    cursor = first.headers["X-Next-Cursor"]
+
+    full = client.get("/tickets", params={"limit": 2, "cursor": cursor}).json()
+    sparse = client.get("/tickets", params={"limit": 2, "cursor": cursor, "fields": "title"}).json()
+    assert sparse == [{"id": t["id"], "title": t["title"]} for t in full]
+
+
+def test_admin_ticket_and_user_fields(client, drain_outbox):
+    n = next(_ids)
+    project = client.post("/projects", json={"name": f"Sparse {n}", "project_key": f"S{n}"}).json()
+    client.post("/tickets", params={"project_id": project["id"]}, json={"user_id": 1, "title": "Mirrored"})
+    drain_outbox()
+
+    admin = client.get("/admin/tickets", params={"project_id": project["id"], "fields": BOARD_FIELDS}).json()
+    assert admin == [{"admin_ticket_id": admin[0]["admin_ticket_id"], "title": "Mirrored", "status": "Open", "priority": "Medium", "assignee": None}]
+
+    client.post("/users-management", json={"first_name": "Sparse", "last_name": "User", "email": f"sparse{n}@example.com"})
+    users = client.get("/users-management", params={"fields": "email"}).json()
+    assert users and all(set(u) == {"id", "email"} for u in users)
+
+
+def test_user_fields_are_selected_in_sql(client, queries):
+    client.get("/users-management")  # Fill the directory cache
+    queries.reset()
+    users = client.get("/users-management", params={"fields": "email,role"}).json()
+    assert users and all(set(u) == {"id", "email", "role"} for u in users)
+    select = next(s for s in queries.statements if "FROM users_management" in s)
+    assert "first_name" not in select and "tickets_issued" not in select
+
+
+def test_unknown_field_is_rejected(client):
+    for path in ("/tickets", "/admin/tickets", "/users-management"):
+        response = client.get(path, params={"fields": "title,password"})
+        assert response.status_code == 400
+        assert "password" in response.json()["detail"]
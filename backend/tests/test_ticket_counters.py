@@ -0,0 +1,77 @@
+"""tickets_issued / tickets_resolved: atomic deltas, the floor at zero and the repair job."""
+from sqlalchemy import select, update
+
+from app import crud, database, models
+
+
+def _call(client, fn):
+    async def _run():
+        async with database.async_session_maker() as session:
+            return await fn(session)
+
+    return client.portal.call(_run)
+
+
+def _counters(client, email):
+    async def load(session):
+        res = await session.execute(
+            select(models.UsersManagement.tickets_issued, models.UsersManagement.tickets_resolved)
+            .where(models.UsersManagement.email == email)
+        )
+        return tuple(res.one())
+
+    return _call(client, load)
+
+
+def _set_counters(client, email, issued, resolved):
+    async def write(session):
+        await session.execute(
+            update(models.UsersManagement).where(models.UsersManagement.email == email)
+            .values(tickets_issued=issued, tickets_resolved=resolved)
+        )
+        await session.commit()
+
+    _call(client, write)
+
+
+def _user(client, name):
+    email = f"{name}@counters.example.com"
+    client.post("/users-management", json={"first_name": name.title(), "last_name": "Counter", "email": email})
+    return email
+
+
+def test_assign_resolve_and_delete_move_counters_by_one(client):
+    alice, bob = _user(client, "alice"), _user(client, "bob")
+    ticket = client.post("/tickets", json={"user_id": 1, "title": "Counted", "assignee": alice}).json()
+    assert _counters(client, alice) == (1, 0)
+
+    client.put(f"/tickets/{ticket['id']}", json={"status": "Done"})
+    assert _counters(client, alice) == (0, 1)
+
+    client.put(f"/tickets/{ticket['id']}", json={"title": "Renamed"})
+    assert _counters(client, alice) == (0, 1)  # Neither assignee nor status changed
+
+    client.put(f"/tickets/{ticket['id']}", json={"assignee": bob})
+    assert (_counters(client, alice), _counters(client, bob)) == ((0, 0), (0, 1))
+
+    assert client.delete(f"/tickets/{ticket['id']}").status_code == 204
+    assert _counters(client, bob) == (0, 0)
+
+
+def test_counters_never_go_below_zero(client):
+    carol = _user(client, "carol")
+    ticket = client.post("/tickets", json={"user_id": 1, "title": "Drifted", "assignee": carol}).json()
+    _set_counters(client, carol, 0, 0)  # Drifted low
+
+    client.put(f"/tickets/{ticket['id']}", json={"status": "Done"})
+    assert _counters(client, carol) == (0, 1)
+
+
+def test_recompute_repairs_drift(client):
+    dave = _user(client, "dave")
+    client.post("/tickets", json={"user_id": 1, "title": "Open", "assignee": dave})
+    client.post("/tickets", json={"user_id": 1, "title": "Done", "assignee": dave, "status": "Done"})
+    _set_counters(client, dave, 42, 7)
+
+    assert _call(client, crud.recompute_ticket_counters) >= 1
+    assert _counters(client, dave) == (1, 1)
@@ -0,0 +1,38 @@
+"""Keyset pagination of GET /tickets, including tickets without created_at."""
+import base64
+
+from sqlalchemy import update
+
+from app import database, models
+
+USER_ID = 9001
+
+
+def test_pages_cover_tickets_without_created_at(client):
+    ids = [client.post("/tickets", json={"user_id": USER_ID, "title": f"Paged {i}"}).json()["id"] for i in range(5)]
+
+    async def _clear_created_at():
+        async with database.async_session_maker() as session:
+            await session.execute(update(models.Ticket).where(models.Ticket.id.in_(ids[1:3])).values(created_at=None))
+            await session.commit()
+
+    client.portal.call(_clear_created_at)
+
+    full = [t["id"] for t in client.get("/tickets", params={"user_id": USER_ID}).json()]
+    assert full[:2] == [ids[2], ids[1]]  # No created_at: first, newest id first
+
+    paged, cursor = [], None
+    for _ in range(len(ids) + 1):
+        params = {"user_id": USER_ID, "limit": 1, **({"cursor": cursor} if cursor else {})}
+        response = client.get("/tickets", params=params)
+        assert response.status_code == 200
+        paged += [t["id"] for t in response.json()]
+        cursor = response.headers.get("X-Next-Cursor")
+        if not cursor:
+            break
+    assert paged == full and sorted(paged) == sorted(ids)
+
+
+def test_malformed_cursor_is_rejected(client):
+    for cursor in ("junk", base64.urlsafe_b64encode(b'{"c":"yesterday","i":1}').decode(), base64.urlsafe_b64encode(b"[1]").decode()):
+        assert client.get("/tickets", params={"limit": 2, "cursor": cursor}).status_code == 400
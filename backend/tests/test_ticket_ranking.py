@@ -0,0 +1,127 @@
+"""Kanban card order: rank math, POST /tickets/{id}/move and the rebalance."""
+import itertools
+import random
+
+import pytest
+
+from sqlalchemy import update
+
+from app import crud, database, models, ranking
+from app.config import settings
+
+_ids = itertools.count(1)
+
+
+def test_between_keeps_order():
+    rng = random.Random(7)
+    ranks = ranking.spread(3)
+    assert ranks == sorted(ranks)
+    for _ in range(2000):
+        i = rng.randint(0, len(ranks))
+        prev = ranks[i - 1] if i else None
+        nxt = ranks[i] if i < len(ranks) else None
+        rank = ranking.between(prev, nxt)
+        assert (prev is None or prev < rank) and (nxt is None or rank < nxt)
+        assert not rank.endswith("0")
+        ranks.insert(i, rank)
+    # Drops at the ends don't make ranks longer
+    assert len(ranking.between(None, ranks[0])) <= ranking.INTEGER_WIDTH
+    assert len(ranking.between(ranks[-1], None)) <= ranking.INTEGER_WIDTH
+    with pytest.raises(ranking.RankCollision):
+        ranking.between(ranks[1], ranks[0])
+
+
+def _column(client, n):
+    """Three cards with a status of their own, returned in board order"""
+    status = f"Column {n}"
+    for i in range(3):
+        client.post("/tickets", json={"user_id": 1, "title": f"Card {n}.{i}", "status": status})
+    return status, [t["id"] for t in client.get("/tickets", params={"status": status, "order": "rank"}).json()]
+
+
+def test_move_rewrites_one_row(client, queries):
+    status, (a, b, c) = _column(client, next(_ids))
+
+    queries.reset()
+    response = client.post(f"/tickets/{c}/move", json={"next_id": a})
+    assert response.status_code == 200, response.text
+    updates = [s.strip() for s in queries.statements if s.lstrip().startswith("UPDATE")]
+    assert len(updates) == 1 and updates[0].startswith("UPDATE tickets SET rank")
+    assert [t["id"] for t in client.get("/tickets", params={"status": status, "order": "rank"}).json()] == [c, a, b]
+
+    client.post(f"/tickets/{c}/move", json={"prev_id": a, "next_id": b})
+    assert [t["id"] for t in client.get("/tickets", params={"status": status, "order": "rank"}).json()] == [a, c, b]
+
+
+def test_move_across_columns_syncs_admin_tickets(client, drain_outbox):
+    n = next(_ids)
+    project = client.post("/projects", json={"name": f"Ranked {n}", "project_key": f"R{n}"}).json()
+    ids = [
+        client.post("/tickets", params={"project_id": project["id"]}, json={"user_id": 1, "title": f"Ranked {i}"}).json()["id"]
+        for i in range(3)
+    ]
+    drain_outbox()
+    moved = client.post(f"/tickets/{ids[2]}/move", json={"next_id": ids[0], "status": "In Progress"}).json()
+    assert moved["status"] == "In Progress"
+    drain_outbox()
+    admin = client.get("/admin/tickets", params={"project_id": project["id"]}).json()
+    assert [t["ticket_id"] for t in admin] == [ids[2], ids[0], ids[1]]
+    assert admin[0]["status"] == "In Progress" and admin[0]["rank"] == moved["rank"]
+
+
+def test_move_errors(client):
+    _, (a, b, c) = _column(client, next(_ids))
+    assert client.post("/tickets/999999/move", json={"prev_id": a}).status_code == 404
+    assert client.post(f"/tickets/{a}/move", json={"prev_id": 999999}).status_code == 400
+    assert client.post(f"/tickets/{a}/move", json={"prev_id": a}).status_code == 400
+    # Neighbours given the wrong way round: the board is stale
+    assert client.post(f"/tickets/{a}/move", json={"prev_id": c, "next_id": b}).status_code == 409
+    assert client.get("/tickets", params={"order": "rank", "limit": 5}).status_code == 400
+
+
+def _rebalance(client):
+    async def run():
+        async with database.async_session_maker() as session:
+            return await crud.rebalance_ticket_ranks(session)
+
+    return client.portal.call(run)
+
+
+def test_rebalance_keeps_order_and_shortens_ranks(client, monkeypatch):
+    monkeypatch.setattr(settings, "ticket_rank_max_length", ranking.INTEGER_WIDTH + 2)
+    status, (a, b, c) = _column(client, next(_ids))
+    for _ in range(15):
+        # Keep dropping a card into the gap right after a
+        client.post(f"/tickets/{c}/move", json={"prev_id": a, "next_id": b})
+        client.post(f"/tickets/{b}/move", json={"prev_id": a, "next_id": c})
+    before = client.get("/tickets", params={"order": "rank"}).json()
+    assert max(len(t["rank"]) for t in before) > settings.ticket_rank_max_length
+
+    # Only the neighbourhood of the long ranks is rewritten
+    assert 2 <= _rebalance(client) < len(before)
+    after = client.get("/tickets", params={"order": "rank"}).json()
+    assert [t["id"] for t in after] == [t["id"] for t in before]
+    assert max(len(t["rank"]) for t in after) <= ranking.INTEGER_WIDTH + 1
+    unchanged = {t["id"]: t["rank"] for t in before if len(t["rank"]) <= ranking.INTEGER_WIDTH}
+    assert all(t["rank"] == unchanged[t["id"]] for t in after if t["id"] in unchanged)
+    assert _rebalance(client) == 0
+
+
+def test_rebalance_separates_equal_ranks(client):
+    status, ids = _column(client, next(_ids))
+    tail = client.post("/tickets", json={"user_id": 1, "title": "Tail", "status": status}).json()
+    shared = client.get(f"/tickets/{ids[1]}").json()["rank"]
+
+    async def collide():
+        async with database.async_session_maker() as session:
+            await session.execute(update(models.Ticket).where(models.Ticket.id.in_(ids[1:])).values(rank=shared))
+            await session.commit()
+
+    client.portal.call(collide)
+    assert client.post(f"/tickets/{ids[0]}/move", json={"prev_id": ids[1], "next_id": ids[2]}).status_code == 409
+
+    assert _rebalance(client) == 2
+    ranks = [client.get(f"/tickets/{i}").json()["rank"] for i in ids]
+    assert ranks == sorted(ranks) and len(set(ranks)) == 3
+    assert ranks[-1] < client.get(f"/tickets/{tail['id']}").json()["rank"]
+    assert client.post(f"/tickets/{ids[0]}/move", json={"prev_id": ids[1], "next_id": ids[2]}).status_code == 200
@@ -0,0 +1,53 @@
+"""Ticket search at /tickets/search and /admin/tickets/search (LIKE fallback on SQLite)."""
+import pytest
+
+
+@pytest.fixture(scope="module")
+def searchable(client, drain_outbox):
+    project = client.post("/projects", json={"name": "Search", "project_key": "SRCH"}).json()
+    other = client.post("/projects", json={"name": "Elsewhere", "project_key": "ELSE"}).json()
+    tickets = {}
+    for key, project_id, title, description, status in (
+        ("title", project["id"], "Zebra login fails", "Steps to reproduce", "Open"),
+        ("description", project["id"], "Broken page", "The zebra login button does nothing", "Open"),
+        ("done", project["id"], "Zebra login copy", None, "Done"),
+        ("other", other["id"], "Zebra login in other project", None, "Open"),
+    ):
+        tickets[key] = client.post(
+            "/tickets",
+            params={"project_id": project_id},
+            json={"user_id": 1, "title": title, "description": description, "status": status},
+        ).json()
+    drain_outbox()
+    return project, tickets
+
+
+def _ids(response):
+    return [t["id"] for t in response.json()]
+
+
+def test_all_words_must_match_title_first(client, searchable):
+    _, tickets = searchable
+    found = _ids(client.get("/tickets/search", params={"q": "ZEBRA login"}))
+    assert found[:3] == [tickets["other"]["id"], tickets["done"]["id"], tickets["title"]["id"]]
+    assert found[3] == tickets["description"]["id"]
+    assert client.get("/tickets/search", params={"q": "zebra giraffe"}).json() == []
+
+
+def test_filters(client, searchable):
+    project, tickets = searchable
+    params = {"q": "zebra", "project_id": project["id"], "status": "Open"}
+    assert sorted(_ids(client.get("/tickets/search", params=params))) == sorted([tickets["title"]["id"], tickets["description"]["id"]])
+    admin = client.get("/admin/tickets/search", params=params).json()
+    assert sorted(t["ticket_id"] for t in admin) == sorted([tickets["title"]["id"], tickets["description"]["id"]])
+
+
+def test_pagination(client, searchable):
+    first = client.get("/tickets/search", params={"q": "zebra", "limit": 3})
+    assert len(first.json()) == 3
+    cursor = first.headers["X-Next-Cursor"]
+    second = client.get("/tickets/search", params={"q": "zebra", "limit": 3, "cursor": cursor})
+    assert len(second.json()) == 1
+    assert "X-Next-Cursor" not in second.headers
+    assert not set(_ids(first)) & set(_ids(second))
+    assert client.get("/tickets/search", params={"q": "zebra", "cursor": "junk"}).status_code == 400
@@ -0,0 +1,50 @@
+"""GET /tickets/timeline: tickets whose start_date..due_date span overlaps a window."""
+import itertools
+
+_ids = itertools.count(1)
+
+WINDOW = {"from": "2031-03-10", "to": "2031-03-20"}
+
+
+def _board(client, drain_outbox, tickets):
+    n = next(_ids)
+    project = client.post("/projects", json={"name": f"Timeline {n}", "project_key": f"TL{n}"}).json()
+    for title, dates in tickets.items():
+        client.post("/tickets", params={"project_id": project["id"]}, json={"user_id": 1, "title": title, **dates})
+    drain_outbox()
+    return project["id"]
+
+
+def test_overlapping_tickets(client, drain_outbox):
+    project_id = _board(client, drain_outbox, {
+        "spans window": {"start_date": "2031-03-01", "due_date": "2031-03-31"},
+        "ends inside": {"start_date": "2031-02-01", "due_date": "2031-03-10"},
+        "starts inside": {"start_date": "2031-03-20", "due_date": "2031-04-30"},
+        "due only": {"due_date": "2031-03-15"},
+        "start only": {"start_date": "2031-03-12"},
+        "inverted": {"start_date": "2031-03-25", "due_date": "2031-03-05"},
+        "before": {"start_date": "2031-02-01", "due_date": "2031-03-09"},
+        "after": {"start_date": "2031-03-21"},
+        "undated": {},
+    })
+    _board(client, drain_outbox, {"other project": {"due_date": "2031-03-15"}})
+
+    response = client.get("/tickets/timeline", params={**WINDOW, "project_id": project_id})
+    assert response.status_code == 200
+    assert [t["title"] for t in response.json()] == [
+        "ends inside", "spans window", "start only", "due only", "starts inside", "inverted",
+    ]
+
+    everywhere = [t["title"] for t in client.get("/tickets/timeline", params=WINDOW).json()]
+    assert "other project" in everywhere and "before" not in everywhere
+
+
+def test_timeline_fields(client, drain_outbox):
+    project_id = _board(client, drain_outbox, {"sparse": {"due_date": "2031-03-11"}})
+    tickets = client.get("/tickets/timeline", params={**WINDOW, "project_id": project_id, "fields": "title,due_date"}).json()
+    assert [set(t) for t in tickets] == [{"id", "title", "due_date"}]
+
+
+def test_inverted_window_is_rejected(client):
+    response = client.get("/tickets/timeline", params={"from": "2031-03-20", "to": "2031-03-10"})
+    assert response.status_code == 400
@@ -0,0 +1,54 @@
+"""The user lookup caches: repeated reads skip the database, writes invalidate."""
+import itertools
+
+_ids = itertools.count(1)
+
+
+def _new_user(client):
+    email = f"cached{next(_ids)}@example.com"
+    user = client.post("/users-management", json={"first_name": "Cached", "last_name": "User", "email": email}).json()
+    return email, user
+
+
+def test_lookup_by_email_is_cached(client, queries):
+    email, _ = _new_user(client)
+    client.get(f"/users-management/email/{email}")
+    client.get(f"/user-profiles/email/{email}")
+    client.get("/users-management")
+
+    queries.reset()
+    assert client.get(f"/users-management/email/{email}").json()["email"] == email
+    assert client.get(f"/user-profiles/email/{email}").json()["email"] == email
+    assert any(u["email"] == email for u in client.get("/users-management").json())
+    assert queries.count == 0
+
+
+def test_user_writes_invalidate(client):
+    email, user = _new_user(client)
+    client.get(f"/users-management/email/{email}")
+    client.get(f"/user-profiles/email/{email}")
+
+    client.put(f"/users-management/{user['id']}", json={"role": "Lead"})
+    assert client.get(f"/users-management/email/{email}").json()["role"] == "Lead"
+    assert client.get(f"/user-profiles/email/{email}").json()["role"] == "Lead"
+
+    client.delete(f"/users-management/{user['id']}")
+    assert client.get(f"/users-management/email/{email}").status_code == 404
+    assert all(u["email"] != email for u in client.get("/users-management").json())
+
+
+def test_ticket_counters_invalidate(client):
+    email, _ = _new_user(client)
+    assert client.get(f"/users-management/email/{email}").json()["tickets_issued"] == 0
+
+    client.post("/tickets", json={"user_id": 1, "title": "Counted", "assignee": email})
+    assert client.get(f"/users-management/email/{email}").json()["tickets_issued"] == 1
+    listed = next(u for u in client.get("/users-management").json() if u["email"] == email)
+    assert listed["tickets_issued"] == 1
+
+
+def test_stats_are_exposed(client):
+    stats = client.get("/health/cache").json()
+    assert {"users_management_by_email", "user_profile_by_email", "user_directory"} <= set(stats)
+    assert stats["users_management_by_email"]["hits"] > 0
+    assert "flowtrack_cache_hits_total" in client.get("/metrics").text
@@ -0,0 +1,30 @@
+"""Assignee autocomplete at /users-management/search (prefix matching on SQLite)."""
+import pytest
+
+
+@pytest.fixture(scope="module")
+def directory(client):
+    users = [("Priya", "Raman", "priya.raman@search.example.org"), ("Pranav", "Iyer", "p.iyer@search.example.org"), ("Omar", "Priestley", "omar@search.example.org")]
+    for first, last, email in users:
+        assert client.post("/users-management", json={"first_name": first, "last_name": last, "email": email}).status_code == 201
+    return users
+
+
+def test_prefix_on_email_first_and_last_name(client, directory):
+    found = client.get("/users-management/search", params={"q": "Pri"}).json()
+    assert [u["email"] for u in found] == ["omar@search.example.org", "priya.raman@search.example.org"]
+    assert set(found[0]) == {"id", "email", "first_name", "last_name"}
+
+
+def test_limit_and_no_substring_match(client, directory):
+    assert len(client.get("/users-management/search", params={"q": "p", "limit": 1}).json()) == 1
+    assert client.get("/users-management/search", params={"q": "aman"}).json() == []
+
+
+def test_like_wildcards_are_literal(client, directory):
+    assert client.get("/users-management/search", params={"q": "%"}).json() == []
+    assert client.get("/users-management/search", params={"q": "p_"}).json() == []
+
+
+def test_query_is_required(client):
+    assert client.get("/users-management/search").status_code == 422